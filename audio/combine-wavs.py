@@ -1,19 +1,33 @@
 #!/usr/bin/env python3
 """Recursively find matching file pairs in each dir under starting dir named
 "<name>-L.wav" / "<name>-R.wav" and combine them into a stereo file using sox.
+
+If soundfile (and NumPy) are installed, files are merged in-process, block by
+block, and sox is only used for files soundfile can not handle.
 """
 
+import argparse
 import os
 import re
 import sys
 
-from os.path import exists, join, splitext
+from concurrent.futures import ThreadPoolExecutor
+from os.path import join, split, splitext
 from subprocess import CalledProcessError, run
 
+try:
+    import numpy as np
+    import soundfile as sf
+except ImportError:
+    sf = None
+
 
 PROG = "combine-wavs"
 WAV_RX = re.compile(r".*-L\.[Ww][Aa][Vv]")
 SOX_COMMAND = ["sox", "-M", "{left}", "{right}", "{output}"]
+ENGINES = ("auto", "soundfile", "sox")
+# Number of frames read from each input per block by the soundfile engine
+BLOCK_FRAMES = 65536
 
 
 def run_sox(**kw):
@@ -22,28 +36,220 @@ def run_sox(**kw):
     return run(cmd, check=True, capture_output=True)
 
 
-def main():
-    if len(sys.argv) > 1:
-        startdir = sys.argv[1]
-    else:
-        sys.exit(f"Usage: {PROG} <start dir>")
-
-    for dirpath, dirname, filenames in os.walk(startdir):
-        for filename in filenames:
-            match = WAV_RX.match(filename)
-            if match:
-                # cut off extension and "-L" part
-                basename, ext = splitext(filename)
-                right = join(dirpath, basename[:-2] + "-R" + ext)
-                output = join(dirpath, basename[:-2] + "-stereo" + ext)
-                if exists(right):
-                    try:
-                        run_sox(left=join(dirpath, filename), right=right, output=output)
-                    except CalledProcessError as exc:
-                        stderr = exc.stderr.decode()
-                        print(f"sox command failed: {stderr}", file=sys.stderr)
-                else:
-                    print(f"Did not find matching file for '{filename}'.", file=sys.stderr)
-
-
-main()
+def merge_soundfile(left, right, output, block_frames=BLOCK_FRAMES):
+    """Merge channels of `left` and `right` into `output` like 'sox -M' does.
+
+    Reads both inputs block by block into fixed buffers, so memory use does not depend
+    on the file size. The shorter input is padded with silence. Integer PCM samples are
+    copied unchanged, the output gets the format and subtype of the left input.
+
+    """
+    with sf.SoundFile(left) as lf, sf.SoundFile(right) as rf:
+        if lf.samplerate != rf.samplerate:
+            raise ValueError(
+                f"Sample rates differ: {lf.samplerate} Hz (left) / {rf.samplerate} Hz (right)"
+            )
+
+        # read samples in a type which holds them without conversion loss
+        dtype = {"FLOAT": "float32", "DOUBLE": "float64"}.get(lf.subtype, "int32")
+        lbuf = np.empty((block_frames, lf.channels), dtype=dtype)
+        rbuf = np.empty((block_frames, rf.channels), dtype=dtype)
+        out = np.empty((block_frames, lf.channels + rf.channels), dtype=dtype)
+
+        with sf.SoundFile(
+            output,
+            "w",
+            samplerate=lf.samplerate,
+            channels=lf.channels + rf.channels,
+            format=lf.format,
+            subtype=lf.subtype,
+        ) as of:
+            while True:
+                lread = len(lf.read(out=lbuf))
+                rread = len(rf.read(out=rbuf))
+                nframes = max(lread, rread)
+
+                if not nframes:
+                    break
+
+                out[:lread, : lf.channels] = lbuf[:lread]
+                out[lread:nframes, : lf.channels] = 0
+                out[:rread, lf.channels :] = rbuf[:rread]
+                out[rread:nframes, lf.channels :] = 0
+                of.write(out[:nframes])
+
+
+def merge_pair(left, right, output, engine="auto"):
+    """Merge `left` and `right` into `output` with given engine.
+
+    With engine "auto", soundfile is used if it is installed, falling back to sox if it
+    fails to handle the files.
+
+    The merged file is written to a temporary file next to `output`, which is only renamed
+    to `output` on success, so a failed or interrupted merge never leaves a truncated output
+    behind, which would be considered up to date by the next run.
+
+    """
+    dirname, filename = split(output)
+    basename, ext = splitext(filename)
+    # keep the extension, sox uses it to determine the output format
+    tmp_output = join(dirname, f".{basename}.tmp-{os.getpid()}{ext}")
+    print(f"Merging '{left}' and '{right}' into '{output}'...")
+
+    try:
+        _merge(left, right, tmp_output, engine)
+        os.replace(tmp_output, output)
+    except BaseException:
+        try:
+            os.remove(tmp_output)
+        except OSError:
+            pass
+
+        raise
+
+
+def _merge(left, right, output, engine):
+    if engine == "soundfile" or (engine == "auto" and sf is not None):
+        try:
+            return merge_soundfile(left, right, output)
+        except (RuntimeError, ValueError) as exc:
+            if engine != "auto":
+                raise
+
+            print(f"Merging with soundfile failed: {exc}", file=sys.stderr)
+
+    run_sox(left=left, right=right, output=output)
+
+
+def find_pairs(startdir):
+    """Recursively find "<name>-L.wav" / "<name>-R.wav" file pairs under `startdir`.
+
+    Each directory is listed once with os.scandir() and its file names are indexed in a
+    dict, so matching files and existing outputs are looked up without further system
+    calls.
+
+    Returns a tuple (pairs, unmatched), where `pairs` is a list of (left, right, output,
+    up_to_date) tuples and `unmatched` a list of left files without matching right file.
+    `up_to_date` is True if the output exists and is not older than both inputs.
+
+    """
+    pairs = []
+    unmatched = []
+    dirs = [startdir]
+
+    while dirs:
+        dirpath = dirs.pop()
+        files = {}
+        subdirs = []
+
+        try:
+            with os.scandir(dirpath) as entries:
+                for entry in entries:
+                    # like os.walk(), don't follow symlinks to directories
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file():
+                        files[entry.name] = entry
+        except OSError:
+            # skip unreadable directories like os.walk() does
+            continue
+
+        # walk sub-directories in order, depth-first
+        dirs.extend(sorted(subdirs, reverse=True))
+
+        for filename in sorted(files):
+            if not WAV_RX.match(filename):
+                continue
+
+            # cut off extension and "-L" part
+            basename, ext = splitext(filename)
+            right = files.get(basename[:-2] + "-R" + ext)
+
+            if right is None:
+                unmatched.append(join(dirpath, filename))
+                continue
+
+            output = files.get(basename[:-2] + "-stereo" + ext)
+            up_to_date = output is not None and output.stat().st_mtime >= max(
+                files[filename].stat().st_mtime, right.stat().st_mtime
+            )
+            output = join(dirpath, basename[:-2] + "-stereo" + ext)
+            pairs.append((join(dirpath, filename), right.path, output, up_to_date))
+
+    return pairs, unmatched
+
+
+def merge_job(left, right, output, engine):
+    """Merge file pair and return error message or None on success."""
+    try:
+        merge_pair(left, right, output, engine)
+    except CalledProcessError as exc:
+        return f"sox command failed: {exc.stderr.decode()}"
+    except OSError as exc:
+        return f"Could not run sox: {exc}"
+    except (RuntimeError, ValueError) as exc:
+        return f"Merging failed: {exc}"
+
+
+def main(args=None):
+    ap = argparse.ArgumentParser(prog=PROG, description=__doc__.splitlines()[0])
+    ap.add_argument(
+        "-e",
+        "--engine",
+        choices=ENGINES,
+        default="auto",
+        help=(
+            "How to merge files (default: %(default)s, i.e. soundfile if installed, "
+            "with sox as fallback)"
+        ),
+    )
+    ap.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        help="Merge pairs even if output file is newer than both inputs",
+    )
+    ap.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of pairs to merge in parallel (default: %(default)i)",
+    )
+    ap.add_argument("startdir", metavar="START_DIR", help="Directory to search for file pairs")
+    args = ap.parse_args(args)
+
+    if args.engine == "soundfile" and sf is None:
+        ap.error("The soundfile engine requires the 'soundfile' and 'numpy' packages.")
+
+    pairs, unmatched = find_pairs(args.startdir)
+
+    for left in unmatched:
+        print(f"Did not find matching file for '{left}'.", file=sys.stderr)
+
+    jobs = []
+    skipped = 0
+
+    for left, right, output, up_to_date in pairs:
+        if up_to_date and not args.force:
+            skipped += 1
+        else:
+            jobs.append((left, right, output))
+
+    with ThreadPoolExecutor(max_workers=max(args.jobs, 1)) as pool:
+        futures = [pool.submit(merge_job, *job, args.engine) for job in jobs]
+        errors = [error for error in (future.result() for future in futures) if error]
+
+    for error in errors:
+        print(error, file=sys.stderr)
+
+    print(
+        f"{len(jobs) - len(errors)} merged, {skipped} up to date, "
+        f"{len(unmatched)} unmatched, {len(errors)} failed."
+    )
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main() or 0)
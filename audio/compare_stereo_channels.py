@@ -9,21 +9,46 @@ This script:
   - Exact/approximate sample-by-sample equality.
   - Optional "invert-sum similarity" check: compute residual = left + (-right),
     then evaluate whether the residual exceeds a threshold.
+- If the file has more than two channels, compares all pairs of channels in the same
+  way in a single pass and reports a channel similarity matrix and duplicate channels.
 
 The invert-sum check is useful for detecting near-identical channels even if small
 differences exist (e.g., due to dithering or encoding), by measuring how much
 cancellation happens when one channel is inverted.
 
-Works in streaming/chunked mode to handle large files efficiently.
+With --profile FILE, residual and signal RMS and peak are computed per window (--window-ms,
+default 100 ms) and written to FILE as a NumPy .npy array or CSV, e.g. for plotting. The
+whole-file invert-sum result is derived from the same pass, and the time ranges where the
+channels diverge are reported.
+
+Batch mode (--batch) accepts any number of files, directories (searched recursively) and
+glob patterns, analyses the files in parallel worker processes and writes one result record
+per file as JSON Lines or CSV. Results are cached in an SQLite database, keyed by path,
+size, modification time and comparison parameters, so unchanged files are not decoded again
+on the next run. --changed-only reports only new or modified files, --since only files
+modified after the given date.
+
+Works in streaming/chunked mode to handle large files efficiently. Chunks are read into
+reused buffers. With --prefetch N, a reader thread decodes up to N chunks ahead while the
+current chunk is compared, so decoding (e.g. of FLAC) and comparison run concurrently.
 
 Usage:
   compare_stereo_channels.py <audio_file>
     [--threshold 0.0]
     [--dtype float64]
     [--chunk-frames 262144]
+    [--prefetch 0]
     [--isr]
     [--rms]
     [--relative]
+    [--profile FILE [--window-ms 100]]
+  compare_stereo_channels.py --batch <file|dir|glob>...
+    [--jobs N]
+    [--format jsonl|csv]
+    [--output FILE]
+    [--changed-only]
+    [--since DATE]
+    [--cache-db FILE | --no-cache]
 
 Examples:
   compare_stereo_channels.py song.wav
@@ -32,6 +57,8 @@ Examples:
   compare_stereo_channels.py stereo.flac --isr --threshold 1e-7
   compare_stereo_channels.py stereo.flac --isr --peak --threshold 1e-4
   compare_stereo_channels.py stereo.flac --isr --relative --threshold 0.01
+  compare_stereo_channels.py stereo.flac --rms --relative --threshold 0.01 --profile p.npy
+  compare_stereo_channels.py --batch --format csv -o report.csv ~/Music '*.wav'
 
 Interpretation of invert-sum threshold:
 
@@ -43,9 +70,18 @@ Interpretation of invert-sum threshold:
 """
 
 import argparse
+import csv
+import glob
+import json
 import logging
+import os
+import queue
+import sqlite3
 import sys
-from typing import Tuple
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import numpy as np
 import soundfile as sf
@@ -53,14 +89,129 @@ import soundfile as sf
 
 log = logging.getLogger("compare_stereo")
 
+# File name extensions of audio files searched for in directories in batch mode
+AUDIO_EXTENSIONS = {"." + fmt.lower() for fmt in sf.available_formats()} | {".aif", ".opus"}
+CACHE_DB = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+    "compare_stereo_channels",
+    "results.sqlite",
+)
+CACHE_SCHEMA_SQL = """\
+CREATE TABLE IF NOT EXISTS results (
+    path TEXT NOT NULL,
+    params TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    record TEXT NOT NULL,
+    PRIMARY KEY (path, params)
+);
+"""
+# Number of results stored in the cache per transaction
+CACHE_COMMIT_INTERVAL = 100
+# Columns of the similarity profile (one row per window)
+PROFILE_COLUMNS = (
+    "start_frame",
+    "frames",
+    "residual_rms",
+    "residual_peak",
+    "signal_rms",
+    "signal_peak",
+)
+# Fields of batch mode result records
+RECORD_FIELDS = (
+    "path",
+    "channels",
+    "samplerate",
+    "frames",
+    "check",
+    "metric",
+    "residual",
+    "signal",
+    "verdict",
+    "duplicates",
+    "error",
+)
+
+
+def parse_since(value: str) -> float:
+    """Convert an ISO 8601 date (and time) or a Unix timestamp to a timestamp."""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date: {value!r}")
+
 
 def parse_args(args=None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Determine if an audio file is stereo and whether both channels contain identical or similar audio."
     )
     parser.add_argument(
-        "audio_file",
-        help="Path to the audio file (any format supported by libsndfile/soundfile).",
+        "audio_files",
+        nargs="+",
+        metavar="audio_file",
+        help=(
+            "Path to the audio file (any format supported by libsndfile/soundfile). "
+            "In batch mode: audio files, directories or glob patterns."
+        ),
+    )
+    parser.add_argument(
+        "-b",
+        "--batch",
+        action="store_true",
+        help="Batch mode: analyse all given files and write one result record per file.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Batch mode: number of worker processes (default: number of CPUs).",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=["jsonl", "csv"],
+        default="jsonl",
+        help="Batch mode: output format of result records (default: jsonl).",
+    )
+    parser.add_argument(
+        "-C",
+        "--changed-only",
+        action="store_true",
+        help="Batch mode: only analyse and report files which are new or changed since last run.",
+    )
+    parser.add_argument(
+        "-S",
+        "--since",
+        type=parse_since,
+        metavar="DATE",
+        help=(
+            "Batch mode: only analyse and report files modified after DATE "
+            "(ISO 8601 date / date and time or Unix timestamp)."
+        ),
+    )
+    parser.add_argument(
+        "-D",
+        "--cache-db",
+        metavar="FILE",
+        default=CACHE_DB,
+        help="Batch mode: result cache database file (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-N",
+        "--no-cache",
+        action="store_true",
+        help="Batch mode: do not use or update the result cache.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        metavar="FILE",
+        help="Batch mode: write result records to FILE (default: standard output).",
     )
     parser.add_argument(
         "-t",
@@ -90,6 +241,17 @@ def parse_args(args=None) -> argparse.Namespace:
         default=262144,
         help="Number of frames to process per chunk (default: 262144).",
     )
+    parser.add_argument(
+        "-p",
+        "--prefetch",
+        type=int,
+        default=0,
+        metavar="CHUNKS",
+        help=(
+            "Number of chunks to decode ahead in a separate reader thread "
+            "(default: 0, i.e. read and compare in the same thread)."
+        ),
+    )
     parser.add_argument(
         "-i",
         "--isr",
@@ -115,6 +277,24 @@ def parse_args(args=None) -> argparse.Namespace:
             "must be <= threshold. Useful if the signal levels of both channels are different."
         ),
     )
+    parser.add_argument(
+        "-P",
+        "--profile",
+        metavar="FILE",
+        help=(
+            "Write per-window residual / signal RMS and peak to FILE "
+            "(NumPy array if name ends with '.npy', CSV otherwise). Implies --isr. "
+            "Stereo files only."
+        ),
+    )
+    parser.add_argument(
+        "-w",
+        "--window-ms",
+        type=float,
+        default=100.0,
+        metavar="MS",
+        help="Window length for --profile in milliseconds (default: %(default)s).",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -125,7 +305,84 @@ def parse_args(args=None) -> argparse.Namespace:
     return parser.parse_args(args)
 
 
-def channels_equal(f: sf.SoundFile, dtype: str, chunk_frames: int, tol: float) -> Tuple[bool, int]:
+def read_chunks(f: sf.SoundFile, dtype: str, chunk_frames: int, prefetch: int = 0) -> Iterator[np.ndarray]:
+    """Yield the frames of the file in chunks of shape (frames, channels).
+
+    Chunks are read into preallocated buffers with ``SoundFile.read(out=...)``, so a
+    yielded array is only valid until the next chunk is requested.
+
+    If prefetch > 0, a reader thread decodes up to `prefetch` chunks ahead into a bounded
+    queue, while the caller processes the current chunk. Buffers are recycled through a
+    second queue, so there are never more than prefetch + 2 chunk buffers.
+
+    """
+    if prefetch <= 0:
+        buf = np.empty((chunk_frames, f.channels), dtype=dtype)
+
+        while True:
+            data = f.read(out=buf)
+            if data.shape[0] == 0:
+                break
+
+            yield data
+
+        return
+
+    free = queue.Queue()
+    ready = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+
+    for _ in range(prefetch + 2):
+        free.put(np.empty((chunk_frames, f.channels), dtype=dtype))
+
+    def reader():
+        try:
+            while not stop.is_set():
+                buf = free.get()
+                if buf is None:
+                    break
+
+                nframes = f.read(out=buf).shape[0]
+                ready.put((buf, nframes))
+
+                if nframes == 0:
+                    break
+        except Exception as exc:
+            ready.put((exc, 0))
+
+    thread = threading.Thread(target=reader, name="read_chunks", daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            buf, nframes = ready.get()
+
+            if isinstance(buf, Exception):
+                raise buf
+
+            if nframes == 0:
+                break
+
+            yield buf[:nframes]
+            free.put(buf)
+    finally:
+        # Stop reader, also if the consumer exits early, and unblock it if it is waiting
+        # for a free buffer or for space in the queue.
+        stop.set()
+        free.put(None)
+
+        while thread.is_alive():
+            try:
+                ready.get(timeout=0.01)
+            except queue.Empty:
+                pass
+
+        thread.join()
+
+
+def channels_equal(
+    f: sf.SoundFile, dtype: str, chunk_frames: int, tol: float, prefetch: int = 0
+) -> Tuple[bool, int]:
     """Read through the file and compare left/right channels.
 
     Returns:
@@ -139,14 +396,13 @@ def channels_equal(f: sf.SoundFile, dtype: str, chunk_frames: int, tol: float) -
     equal = True
     total_frames = 0
 
-    if f.channels != 2:
-        raise TypeError("Only audio files with two channels are supported.")
-
-    while True:
-        data = f.read(frames=chunk_frames, dtype=dtype, always_2d=True)
-        if data.size == 0:
-            break
+    if f.channels > 2:
+        matrix, total_frames = channel_equality_matrix(f, dtype, chunk_frames, tol, prefetch)
+        return bool(matrix.all()), total_frames
+    elif f.channels != 2:
+        raise TypeError("Only audio files with two or more channels are supported.")
 
+    for data in read_chunks(f, dtype, chunk_frames, prefetch):
         left = data[:, 0]
         right = data[:, 1]
 
@@ -171,15 +427,20 @@ def invert_sum_similarity(
     rms: bool,
     threshold: float,
     relative: bool,
+    prefetch: int = 0,
 ) -> Tuple[bool, int, float, float]:
     """Check similarity by residual = L - R.
 
     Accumulates residual metric and signal metric over the whole file in streaming fashion.
 
+    For files with more than two channels, all channels must be similar to each other and
+    the metrics of the least similar channel pair are returned.
+
     Parameters:
       - mode: 'rms' or 'peak'
       - threshold: numeric threshold for the decision
       - relative: if True, compare residual_metric/signal_metric to threshold; else compare residual_metric to threshold
+      - prefetch: number of chunks to decode ahead in a reader thread (0 = no reader thread)
 
     Returns:
       (similar, total_frames, residual_metric, signal_metric)
@@ -193,14 +454,19 @@ def invert_sum_similarity(
     residual_peak = 0.0
     signal_peak = 0.0
 
-    if f.channels != 2:
-        raise TypeError("Only audio files with two channels are supported.")
-
-    while True:
-        data = f.read(frames=chunk_frames, dtype=dtype, always_2d=True)
-        if data.size == 0:
-            break
+    if f.channels > 2:
+        similar, total_frames, residual, signal = channel_similarity_matrix(
+            f, dtype, chunk_frames, rms, threshold, relative, prefetch
+        )
+        if relative:
+            worst = np.unravel_index(np.argmax(residual / np.maximum(signal, 1e-20)), residual.shape)
+        else:
+            worst = np.unravel_index(np.argmax(residual), residual.shape)
+        return bool(similar.all()), total_frames, residual[worst], signal[worst]
+    elif f.channels != 2:
+        raise TypeError("Only audio files with two or more channels are supported.")
 
+    for data in read_chunks(f, dtype, chunk_frames, prefetch):
         left = data[:, 0]
         right = data[:, 1]
         residual = left - right  # L + (-R)
@@ -238,6 +504,490 @@ def invert_sum_similarity(
     return similar, total_frames, residual_metric, signal_metric
 
 
+def channel_equality_matrix(
+    f: sf.SoundFile, dtype: str, chunk_frames: int, tol: float, prefetch: int = 0
+) -> Tuple[np.ndarray, int]:
+    """Compare all pairs of channels for (approximate) equality in one pass.
+
+    Returns:
+      (matrix, total_frames_compared)
+
+    where `matrix` is a symmetric (channels x channels) boolean array. Only pairs which
+    are still equal are compared in each chunk and reading stops as soon as no pair is
+    equal anymore.
+
+    """
+    rows, cols = np.triu_indices(f.channels, 1)
+    equal = np.ones(len(rows), dtype=bool)
+    total_frames = 0
+
+    for data in read_chunks(f, dtype, chunk_frames, prefetch):
+        total_frames += data.shape[0]
+        active = np.flatnonzero(equal)
+        a = data[:, rows[active]]
+        b = data[:, cols[active]]
+
+        if tol == 0.0:
+            equal[active] = (a == b).all(axis=0)
+        else:
+            equal[active] = np.isclose(a, b, rtol=1e-12, atol=tol, equal_nan=True).all(axis=0)
+
+        if not equal.any():
+            break
+
+    matrix = np.eye(f.channels, dtype=bool)
+    matrix[rows, cols] = matrix[cols, rows] = equal
+    return matrix, total_frames
+
+
+def channel_similarity_matrix(
+    f: sf.SoundFile,
+    dtype: str,
+    chunk_frames: int,
+    rms: bool,
+    threshold: float,
+    relative: bool,
+    prefetch: int = 0,
+) -> Tuple[np.ndarray, int, np.ndarray, np.ndarray]:
+    """Invert-sum similarity check of all pairs of channels in one pass.
+
+    Per pair (i, j), the residual is channel i - channel j and the signal metric combines
+    both channels, like in invert_sum_similarity().
+
+    Returns:
+      (similar, total_frames, residual_metric, signal_metric)
+
+    each a symmetric (channels x channels) array.
+
+    """
+    rows, cols = np.triu_indices(f.channels, 1)
+    residual_acc = np.zeros(len(rows))
+    channel_acc = np.zeros(f.channels)
+    total_frames = 0
+
+    for data in read_chunks(f, dtype, chunk_frames, prefetch):
+        total_frames += data.shape[0]
+        data = data.astype(np.float64)
+        residual = data[:, rows] - data[:, cols]
+
+        if rms:
+            residual_acc += np.einsum("ij,ij->j", residual, residual)
+            channel_acc += np.einsum("ij,ij->j", data, data)
+        else:
+            np.maximum(residual_acc, np.abs(residual).max(axis=0), out=residual_acc)
+            np.maximum(channel_acc, np.abs(data).max(axis=0), out=channel_acc)
+
+    if rms:
+        residual_pairs = np.sqrt(residual_acc / max(total_frames, 1))
+        signal_pairs = np.sqrt((channel_acc[rows] + channel_acc[cols]) / max(total_frames, 1))
+    else:
+        residual_pairs = residual_acc
+        signal_pairs = np.maximum(channel_acc[rows], channel_acc[cols])
+
+    if relative:
+        similar_pairs = residual_pairs / np.maximum(signal_pairs, 1e-20) <= threshold
+    else:
+        similar_pairs = residual_pairs <= threshold
+
+    shape = (f.channels, f.channels)
+    similar = np.eye(f.channels, dtype=bool)
+    residual_metric = np.zeros(shape)
+    signal_metric = np.zeros(shape)
+
+    for matrix, values in ((similar, similar_pairs), (residual_metric, residual_pairs),
+                           (signal_metric, signal_pairs)):
+        matrix[rows, cols] = matrix[cols, rows] = values
+
+    if rms:
+        np.fill_diagonal(signal_metric, np.sqrt(2 * channel_acc / max(total_frames, 1)))
+    else:
+        np.fill_diagonal(signal_metric, channel_acc)
+
+    return similar, total_frames, residual_metric, signal_metric
+
+
+def least_similar_pair(
+    residual: np.ndarray, signal: np.ndarray, relative: bool
+) -> Tuple[int, int]:
+    """Return (0-based) channel indices of the pair with the largest (relative) residual.
+
+    `residual` and `signal` are the matrices returned by channel_similarity_matrix().
+
+    """
+    rows, cols = np.triu_indices(residual.shape[0], 1)
+    values = residual[rows, cols]
+
+    if relative:
+        values = values / np.maximum(signal[rows, cols], 1e-20)
+
+    worst = int(values.argmax())
+    return int(rows[worst]), int(cols[worst])
+
+
+def duplicate_pairs(matrix: np.ndarray) -> List[Tuple[int, int]]:
+    """Return (1-based) channel number pairs marked as equal / similar in `matrix`."""
+    rows, cols = np.triu_indices(matrix.shape[0], 1)
+    return [(int(i) + 1, int(j) + 1) for i, j in zip(rows, cols) if matrix[i, j]]
+
+
+def format_matrix(matrix: np.ndarray) -> str:
+    """Format a channel similarity matrix as text table."""
+    if matrix.dtype == bool:
+        cells = np.where(matrix, "=", ".")
+    else:
+        cells = np.vectorize(lambda v: f"{v:.2e}")(matrix)
+
+    width = max(3, max(len(c) for c in cells.ravel()))
+    lines = ["ch " + " ".join(f"{j + 1:>{width}}" for j in range(matrix.shape[0]))]
+    lines.extend(f"{i + 1:>2} " + " ".join(f"{c:>{width}}" for c in row) for i, row in enumerate(cells))
+    return "\n".join(lines)
+
+
+def similarity_profile(
+    f: sf.SoundFile, dtype: str, chunk_frames: int, window: int, prefetch: int = 0
+) -> np.ndarray:
+    """Compute residual (L - R) and signal metrics per window of `window` frames.
+
+    Returns a float64 array with one row per window and the columns in PROFILE_COLUMNS.
+    The signal metrics combine both channels like in invert_sum_similarity(). Each chunk
+    is processed as a (windows, window, channels) view, so there is no per-window loop.
+    The last window may be shorter.
+
+    """
+    if f.channels != 2:
+        raise TypeError("Only audio files with two channels are supported.")
+
+    # whole windows per chunk, so only the last chunk can have a partial window
+    chunk_frames = max(chunk_frames // window, 1) * window
+    rows = []
+    offset = 0
+
+    for data in read_chunks(f, dtype, chunk_frames, prefetch):
+        n = data.shape[0]
+        full = n // window * window
+
+        for block, size in ((data[:full], window), (data[full:], n - full)):
+            if size == 0:
+                continue
+
+            frames = block.reshape(-1, size, 2).astype(np.float64)
+            residual = frames[..., 0] - frames[..., 1]
+            profile = np.empty((frames.shape[0], len(PROFILE_COLUMNS)))
+            profile[:, 0] = offset + np.arange(frames.shape[0]) * size
+            profile[:, 1] = size
+            profile[:, 2] = np.sqrt(np.einsum("ij,ij->i", residual, residual) / size)
+            profile[:, 3] = np.abs(residual).max(axis=1)
+            profile[:, 4] = np.sqrt(np.einsum("ijk,ijk->i", frames, frames) / size)
+            profile[:, 5] = np.abs(frames).max(axis=(1, 2))
+            rows.append(profile)
+            offset += block.shape[0]
+
+    return np.concatenate(rows) if rows else np.empty((0, len(PROFILE_COLUMNS)))
+
+
+def summarize_profile(
+    profile: np.ndarray, rms: bool, threshold: float, relative: bool
+) -> Tuple[bool, float, float, np.ndarray]:
+    """Derive the whole-file invert-sum result from a similarity profile.
+
+    Returns:
+      (similar, residual_metric, signal_metric, diverging)
+
+    where `diverging` is a boolean array marking windows which exceed the threshold.
+
+    """
+    frames = profile[:, 1]
+    total_frames = max(frames.sum(), 1)
+
+    if rms:
+        residual, signal = profile[:, 2], profile[:, 4]
+        residual_metric = np.sqrt(np.dot(residual**2, frames) / total_frames)
+        signal_metric = np.sqrt(np.dot(signal**2, frames) / total_frames)
+    else:
+        residual, signal = profile[:, 3], profile[:, 5]
+        residual_metric = residual.max(initial=0.0)
+        signal_metric = signal.max(initial=0.0)
+
+    eps = 1e-20
+    if relative:
+        similar = residual_metric / max(signal_metric, eps) <= threshold
+        diverging = residual / np.maximum(signal, eps) > threshold
+    else:
+        similar = residual_metric <= threshold
+        diverging = residual > threshold
+
+    return similar, residual_metric, signal_metric, diverging
+
+
+def write_profile(filename: str, profile: np.ndarray):
+    """Write similarity profile as NumPy .npy file or CSV file (depending on extension)."""
+    if filename.endswith(".npy"):
+        np.save(filename, profile)
+    else:
+        np.savetxt(filename, profile, fmt="%.10g", delimiter=",", header=",".join(PROFILE_COLUMNS),
+                   comments="")
+
+
+def analyze_file(
+    path: str,
+    dtype: str,
+    chunk_frames: int,
+    isr: bool,
+    rms: bool,
+    threshold: float,
+    relative: bool,
+    prefetch: int = 0,
+) -> Dict:
+    """Compare the channels of one audio file and return a result record.
+
+    The record is a dict with the keys in RECORD_FIELDS. The verdict is one of "same",
+    "different", "not stereo" or "error". For files with more than two channels, the
+    verdict "same" means all channels are equal / similar and "duplicates" that some of
+    them are, which are then listed in the "duplicates" field (e.g. "1=3 2=5"), and
+    "residual" and "signal" are those of the least similar channel pair.
+
+    """
+    record = dict.fromkeys(RECORD_FIELDS)
+    record.update(path=path, check="isr" if isr else "equal")
+
+    try:
+        with sf.SoundFile(path, mode="r") as f:
+            record.update(channels=f.channels, samplerate=f.samplerate)
+
+            if f.channels < 2:
+                record["verdict"] = "not stereo"
+                return record
+
+            if f.channels > 2:
+                if isr:
+                    matrix, frames, residual, signal = channel_similarity_matrix(
+                        f, dtype, chunk_frames, rms, threshold, relative, prefetch
+                    )
+                    # report both metrics of the same pair
+                    i, j = least_similar_pair(residual, signal, relative)
+                    record.update(metric="rms" if rms else "peak",
+                                  residual=float(residual[i, j]), signal=float(signal[i, j]))
+                else:
+                    matrix, frames = channel_equality_matrix(
+                        f, dtype, chunk_frames, threshold, prefetch
+                    )
+
+                pairs = duplicate_pairs(matrix)
+                record.update(
+                    frames=frames,
+                    duplicates=" ".join(f"{i}={j}" for i, j in pairs),
+                    verdict="same" if matrix.all() else "duplicates" if pairs else "different",
+                )
+                return record
+
+            if isr:
+                same, frames, residual_metric, signal_metric = invert_sum_similarity(
+                    f, dtype, chunk_frames, rms, threshold, relative, prefetch
+                )
+                record.update(
+                    metric="rms" if rms else "peak",
+                    residual=float(residual_metric),
+                    signal=float(signal_metric),
+                )
+            else:
+                same, frames = channels_equal(f, dtype, chunk_frames, threshold, prefetch)
+    except Exception as exc:
+        record.update(verdict="error", error=str(exc))
+        return record
+
+    record.update(frames=frames, verdict="same" if same else "different")
+    return record
+
+
+def find_audio_files(paths: List[str]) -> List[str]:
+    """Expand directories (recursively) and glob patterns to a list of audio files."""
+    files = []
+
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames.sort()
+                files.extend(
+                    os.path.join(dirpath, fn)
+                    for fn in sorted(filenames)
+                    if os.path.splitext(fn)[1].lower() in AUDIO_EXTENSIONS
+                )
+        elif any(c in path for c in "*?["):
+            files.extend(sorted(glob.glob(path, recursive=True)))
+        else:
+            files.append(path)
+
+    return files
+
+
+class ResultCache:
+    """Cache of batch result records in an SQLite database.
+
+    Records are stored per absolute path and comparison parameters and are valid as long
+    as size and modification time of the file have not changed.
+
+    """
+
+    def __init__(self, filename: str, params: Dict):
+        dirname = os.path.dirname(filename)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+
+        self.params = json.dumps(params, sort_keys=True)
+        self.db = sqlite3.connect(filename)
+        self.db.execute(CACHE_SCHEMA_SQL)
+        self.pending = 0
+
+    def get(self, path: str, stat: os.stat_result) -> Optional[Dict]:
+        row = self.db.execute(
+            "SELECT size, mtime, record FROM results WHERE path = ? AND params = ?",
+            (os.path.abspath(path), self.params),
+        ).fetchone()
+
+        if row and row[0] == stat.st_size and row[1] == stat.st_mtime:
+            record = json.loads(row[2])
+            record["path"] = path
+            return record
+
+        return None
+
+    def put(self, path: str, stat: os.stat_result, record: Dict):
+        self.db.execute(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+            (os.path.abspath(path), self.params, stat.st_size, stat.st_mtime, json.dumps(record)),
+        )
+        self.pending += 1
+
+        if self.pending >= CACHE_COMMIT_INTERVAL:
+            self.db.commit()
+            self.pending = 0
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    """Analyse many files in a process pool and stream result records to the output."""
+    files = find_audio_files(args.audio_files)
+    options = dict(
+        dtype=args.dtype,
+        chunk_frames=args.chunk_frames,
+        isr=args.isr,
+        rms=args.rms,
+        threshold=args.threshold,
+        relative=args.relative,
+        prefetch=args.prefetch,
+    )
+    errors = 0
+    cache = None
+    stats = {}
+
+    if not args.no_cache:
+        # chunk_frames affects the reported frames when the comparison exits early
+        params = {key: options[key]
+                  for key in ("dtype", "chunk_frames", "threshold", "isr", "rms", "relative")}
+        try:
+            cache = ResultCache(args.cache_db, params)
+        except (OSError, sqlite3.Error) as exc:
+            log.warning(f"Could not open result cache: {exc}")
+
+    output = open(args.output, "w", newline="") if args.output else sys.stdout
+
+    try:
+        if args.format == "csv":
+            writer = csv.DictWriter(output, fieldnames=RECORD_FIELDS)
+            writer.writeheader()
+            write_record = writer.writerow
+        else:
+            write_record = lambda record: output.write(json.dumps(record) + "\n")
+
+        pending = []
+        for path in files:
+            try:
+                stats[path] = os.stat(path)
+            except OSError:
+                # let analyze_file() report the error
+                pending.append(path)
+                continue
+
+            if args.since is not None and stats[path].st_mtime <= args.since:
+                continue
+
+            record = cache.get(path, stats[path]) if cache else None
+
+            if record is None:
+                pending.append(path)
+            elif not args.changed_only:
+                write_record(record)
+
+        output.flush()
+        log.info(f"Analysing {len(pending)} of {len(files)} files...")
+
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            futures = {pool.submit(analyze_file, path, **options): path for path in pending}
+
+            for i, future in enumerate(as_completed(futures)):
+                record = future.result()
+                write_record(record)
+                output.flush()
+
+                if cache and record["verdict"] != "error" and futures[future] in stats:
+                    cache.put(futures[future], stats[futures[future]], record)
+
+                if record["verdict"] == "error":
+                    errors += 1
+                    log.error(f"{record['path']}: {record['error']}")
+                else:
+                    log.info(f"[{i + 1}/{len(pending)}] {record['path']}: {record['verdict']}")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+        if cache:
+            cache.close()
+
+    return 2 if errors else 0
+
+
+def compare_multichannel(f: sf.SoundFile, args: argparse.Namespace) -> int:
+    """Compare all channel pairs of a file with more than two channels and log results."""
+    log.debug(f"Samplerate: {f.samplerate} Hz, channels: {f.channels}")
+
+    try:
+        if args.isr:
+            matrix, nframes, residual, signal = channel_similarity_matrix(
+                f, args.dtype, args.chunk_frames, args.rms, args.threshold, args.relative,
+                prefetch=args.prefetch,
+            )
+        else:
+            matrix, nframes = channel_equality_matrix(
+                f, args.dtype, args.chunk_frames, args.threshold, prefetch=args.prefetch
+            )
+    except Exception as e:
+        log.error(f"Error reading or comparing audio: {e}")
+        return 2
+
+    log.debug(f"Frames compared: {nframes}")
+
+    if args.isr:
+        metric_name = "RMS" if args.rms else "Peak"
+        log.debug(f"Residual {metric_name} matrix:\n{format_matrix(residual)}")
+        log.debug(f"Signal {metric_name} matrix:\n{format_matrix(signal)}")
+
+    log.info(f"Channel {'similarity' if args.isr else 'equality'} matrix "
+             f"(threshold = {args.threshold}):\n{format_matrix(matrix)}")
+
+    pairs = duplicate_pairs(matrix)
+    for i, j in pairs:
+        log.info(f"Channels {i} and {j} are {'similar' if args.isr else 'the same'}.")
+
+    if not pairs:
+        log.info("No duplicate channels found.")
+
+    return 1 if pairs else 0
+
+
 def main(args=None) -> int:
     args = parse_args(args)
     
@@ -246,18 +996,74 @@ def main(args=None) -> int:
         format="%(levelname)s: %(message)s"
     )
 
-    with sf.SoundFile(args.audio_file, mode="r") as f:
-        if f.channels != 2:
+    if args.batch:
+        return run_batch(args)
+
+    if len(args.audio_files) > 1:
+        log.error("Only one audio file allowed without --batch.")
+        return 2
+
+    with sf.SoundFile(args.audio_files[0], mode="r") as f:
+        if f.channels < 2:
             log.warning(f"File is not stereo (channels={f.channels}).")
             return 0
 
+        if f.channels > 2:
+            if args.profile:
+                log.error("--profile is only supported for stereo files.")
+                return 2
+
+            return compare_multichannel(f, args)
+
         log.debug(f"Samplerate: {f.samplerate} Hz")
 
-        if not args.isr:
+        if args.profile:
+            window = max(int(round(f.samplerate * args.window_ms / 1000.0)), 1)
+
+            try:
+                profile = similarity_profile(
+                    f, args.dtype, args.chunk_frames, window, prefetch=args.prefetch
+                )
+                write_profile(args.profile, profile)
+            except Exception as e:
+                log.error(f"Error computing or writing similarity profile: {e}")
+                return 2
+
+            equal, residual_metric, signal_metric, diverging = summarize_profile(
+                profile, args.rms, args.threshold, args.relative
+            )
+            log.debug(f"Wrote profile with {len(profile)} windows of {window} frames "
+                      f"to '{args.profile}'.")
+
+            metric_name = "RMS" if args.rms else "Peak"
+            log.debug(f"Residual {metric_name}: {residual_metric:.6e}")
+            log.debug(f"Signal {metric_name}:   {signal_metric:.6e}")
+
+            if diverging.any():
+                # start and end indices of runs of diverging windows
+                edges = np.flatnonzero(np.diff(np.concatenate(([0], diverging.view(np.int8), [0]))))
+                ranges = [
+                    (profile[start, 0] / f.samplerate,
+                     (profile[end - 1, 0] + profile[end - 1, 1]) / f.samplerate)
+                    for start, end in zip(edges[::2], edges[1::2])
+                ]
+                log.info(f"Channels diverge in {int(diverging.sum())} of {len(profile)} windows "
+                         f"({len(ranges)} ranges, first at {ranges[0][0]:.3f} s).")
+                for start, end in ranges:
+                    log.debug(f"Channels diverge from {start:.3f} s to {end:.3f} s.")
+
+            log.info("Invert-sum comparison: channels are " +
+                ("NOT " if not equal else "") + "similar (residual " +
+                ("within" if equal else "exceeds") + f" threshold = {args.threshold}).")
+        elif not args.isr:
             # Equality/approximate equality
             try:
                 equal, nframes_equal = channels_equal(
-                    f, dtype=args.dtype, chunk_frames=args.chunk_frames, tol=args.threshold
+                    f,
+                    dtype=args.dtype,
+                    chunk_frames=args.chunk_frames,
+                    tol=args.threshold,
+                    prefetch=args.prefetch,
                 )
             except Exception as e:
                 log.error(f"Error reading or comparing audio: {e}")
@@ -277,6 +1083,7 @@ def main(args=None) -> int:
                     rms=args.rms,
                     threshold=args.threshold,
                     relative=args.relative,
+                    prefetch=args.prefetch,
                 )
             except Exception as e:
                 log.error(f"Error during invert-sum similarity check: {e}")
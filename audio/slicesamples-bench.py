@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Benchmark the section analysis backends of slicesamples.
+
+Writes a recording of noise bursts separated by silence (or uses the given
+input file), runs the analysis with the ``aubio`` backend (silence checked hop
+by hop) and the ``numpy`` backend (silence checked per block) and reports
+their times. Both backends must find the same sections.
+
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from os.path import join
+
+import aubio
+import numpy as np
+
+from slicesamples import BLOCK_HOPS, create_onset, find_sections, find_sections_numpy
+
+
+def write_recording(path, seconds, samplerate, channels):
+    rng = np.random.default_rng(0)
+    out = aubio.sink(path, samplerate, channels)
+    nframes = 0
+
+    while nframes < seconds * samplerate:
+        # decaying noise burst followed by silence, like a multisample recording
+        length = int(samplerate * rng.uniform(0.2, 2.0))
+        decay = np.exp(-np.arange(length) / (samplerate * rng.uniform(0.05, 0.5)))
+        burst = rng.standard_normal((channels, length)) * 0.5 * decay
+        silence = np.zeros((channels, int(samplerate * rng.uniform(0.1, 1.0))))
+
+        for block in (burst, silence):
+            block = block.astype(aubio.float_type)
+
+            for pos in range(0, block.shape[1], 4096):
+                chunk = np.ascontiguousarray(block[:, pos:pos + 4096])
+                out.do_multi(chunk, chunk.shape[1])
+
+            nframes += block.shape[1]
+
+    out.close()
+
+
+def analyze(input_file, args, backend):
+    read_size = args.hop_size * (BLOCK_HOPS if backend == "numpy" else 1)
+
+    with aubio.source(input_file, hop_size=read_size) as audio_source:
+        onset = create_onset(args, audio_source.samplerate)
+        t0 = time.perf_counter()
+
+        if backend == "numpy":
+            sections = find_sections_numpy(audio_source, onset, args)
+        else:
+            sections = find_sections(audio_source, onset, args)
+
+        return time.perf_counter() - t0, sections
+
+
+def main(args=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("-d", "--duration", type=float, default=600.0,
+                    help="Duration of generated recording in seconds (default: %(default).0f)")
+    ap.add_argument("-H", "--hop-size", type=int, default=256,
+                    help="Hop size in sample frames (default: %(default)i)")
+    ap.add_argument("-r", "--runs", type=int, default=3,
+                    help="Number of runs per backend (default: %(default)i)")
+    ap.add_argument("input_file", nargs="?",
+                    help="Analyze this file instead of a generated recording")
+    args = ap.parse_args(args)
+    # analysis settings as used by slicesamples by default
+    args.onset_method = "default"
+    args.min_interval = "12ms"
+    args.onset_threshold = 0.3
+    args.silence_threshold = -70.0
+    args.min_silent_hops = 10
+    args.verbose = False
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        input_file = args.input_file
+
+        if not input_file:
+            input_file = join(tmpdir, "recording.wav")
+            write_recording(input_file, args.duration, 44100, 1)
+
+        print("%-10s %10s %10s" % ("backend", "time (s)", "sections"))
+        results = {}
+
+        for backend in ("aubio", "numpy"):
+            times = []
+
+            for _ in range(args.runs):
+                elapsed, sections = analyze(input_file, args, backend)
+                times.append(elapsed)
+
+            results[backend] = sections
+            print("%-10s %10.3f %10i" % (backend, min(times), len(sections)))
+
+    if results["aubio"] != results["numpy"]:
+        print("Sections found by backends differ!", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main() or 0)
@@ -2,14 +2,311 @@
 """Slice audio file with recording of samples separated by silence via aubio."""
 
 import argparse
+import csv
+import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import aubio
+import numpy as np
 
-from slicing import slice_source_at_stamps
+from slicing import StreamSlicer, slice_source_at_stamps
 
 PROG = "slicesamples"
+BACKENDS = ("aubio", "numpy")
+# Number of hops read per block by the numpy backend
+BLOCK_HOPS = 1024
+# File name extensions of input files searched for in directories
+AUDIO_EXTENSIONS = {".aif", ".aiff", ".flac", ".mp3", ".ogg", ".wav"}
+# Columns of the slice manifest
+MANIFEST_FIELDS = ("source", "slice", "path", "start", "end", "frames", "peak", "rms")
+
+
+def create_onset(args, samplerate):
+    """Create aubio onset detector configured from command line arguments."""
+    onset = aubio.onset(
+        args.onset_method,
+        buf_size=512,
+        hop_size=args.hop_size,
+        samplerate=samplerate,
+    )
+
+    if args.min_interval:
+        if args.min_interval.endswith("ms"):
+            onset.set_minioi_ms(int(args.min_interval[:-2]))
+        elif args.min_interval.endswith("s"):
+            onset.set_minioi_s(int(args.min_interval[:-1]))
+        else:
+            onset.set_minioi(int(args.min_interval))
+
+    onset.set_threshold(args.onset_threshold)
+    return onset
+
+
+def find_sections(audio_source, onset, args, slicer=None):
+    """Find sections of signal separated by onsets or silence in audio source.
+
+    Returns a list of (start, end) tuples in sample frames (end is inclusive).
+
+    If a `slicing.StreamSlicer` is passed as `slicer`, all hops read are fed to it and
+    slices are started and ended as soon as their boundaries are known, so the file is
+    sliced while it is analyzed.
+
+    """
+    nframes = 0
+    nhops = 0
+    onsets = 0
+    read = 0
+    sections = []
+    silence_start = -1
+    signal_start = -1
+    silent_hops = 0
+
+    while True:
+        if slicer:
+            vec, read = audio_source.do_multi()
+            # same down-mix aubio does when reading mono from a multi-channel source
+            frames = vec.mean(axis=0) if vec.shape[0] > 1 else vec[0]
+        else:
+            frames, read = audio_source()
+
+        if onset(frames):
+            onset_frame = onset.get_last()
+            onsets += 1
+
+            if args.verbose:
+                print(f"Onset #{onsets:02} detected at: {onset.get_last_s():.4f}")
+
+            if signal_start != -1:
+                if silence_start != -1 and silent_hops >= args.min_silent_hops:
+                    sections.append((signal_start, silence_start - 1))
+                else:
+                    sections.append((signal_start, onset_frame - 1))
+
+                if slicer:
+                    slicer.end(sections[-1][1])
+
+            signal_start = onset_frame
+            silence_start = -1
+            silent_hops = 0
+
+            if slicer:
+                slicer.start(onset_frame)
+        elif signal_start != -1:
+            if aubio.silence_detection(frames, args.silence_threshold):
+                if silence_start == -1:
+                    silence_start = nframes
+
+                    if slicer:
+                        # section may end here, depending on the number of silent hops
+                        slicer.hold(silence_start)
+
+                silent_hops += 1
+
+                if slicer and silent_hops == args.min_silent_hops:
+                    # silent hops are only reset by the next onset, so this is final
+                    slicer.end(silence_start - 1)
+
+        if slicer:
+            slicer.feed(vec, read)
+
+        nframes += read
+        nhops += 1
+
+        if read < audio_source.hop_size:
+            break
+
+    if signal_start != -1:
+        if silence_start != -1 and silent_hops >= args.min_silent_hops:
+            sections.append((signal_start, silence_start - 1))
+        else:
+            sections.append((signal_start, nframes - 1))
+
+        if slicer:
+            slicer.end(sections[-1][1])
+
+    if args.verbose:
+        print(f"Read frames={nframes}, hops={nhops}, hop_size={args.hop_size}")
+
+    return sections
+
+
+def hop_levels(hops):
+    """Return level in dB SPL of each row of `hops` (like aubio.db_spl does for one hop)."""
+    energy = np.einsum("ij,ij->i", hops, hops, dtype=np.float64) / hops.shape[1]
+
+    with np.errstate(divide="ignore"):
+        return 10 * np.log10(energy)
+
+
+def find_sections_numpy(audio_source, onset, args):
+    """Find sections like find_sections() with block-wise, vectorized silence detection.
+
+    `audio_source` must read blocks of a multiple of `args.hop_size` frames. Onsets are
+    still detected by feeding each hop to aubio, but the silence level of all hops of a
+    block is computed in one go and the section boundaries are derived from the onset
+    hops and silent hops afterwards, instead of tracking them hop by hop.
+
+    Returns the same list of (start, end) tuples as find_sections().
+
+    """
+    hop_size = args.hop_size
+    block_hops = audio_source.hop_size // hop_size
+    nframes = 0
+    onsets = []
+    silent = []
+
+    while True:
+        frames, read = audio_source()
+
+        if read < audio_source.hop_size:
+            frames[read:] = 0
+            # find_sections() also reads a last hop with no frames, if the length of the
+            # source is a multiple of the hop size
+            nhops = read // hop_size + 1
+        else:
+            nhops = block_hops
+
+        hops = frames[: nhops * hop_size].reshape(nhops, hop_size)
+        silent.append(hop_levels(hops) < args.silence_threshold)
+        first_hop = nframes // hop_size
+
+        for i, hop in enumerate(hops):
+            if onset(hop):
+                onsets.append((first_hop + i, onset.get_last()))
+
+                if args.verbose:
+                    print(f"Onset #{len(onsets):02} detected at: {onset.get_last_s():.4f}")
+
+        nframes += read
+
+        if read < audio_source.hop_size:
+            break
+
+    silent = np.concatenate(silent)
+    nhops = len(silent)
+
+    if args.verbose:
+        print(f"Read frames={nframes}, hops={nhops}, hop_size={hop_size}")
+
+    if not onsets:
+        return []
+
+    onset_hops, onset_frames = np.array(onsets).T
+    # silence is only checked in hops without onset
+    silent[onset_hops] = False
+    # number of silent hops before each hop
+    silent_count = np.concatenate(([0], np.cumsum(silent)))
+    # index of first silent hop at or after each hop (nhops if none)
+    next_silent = np.where(silent, np.arange(nhops), nhops)
+    next_silent = np.append(np.minimum.accumulate(next_silent[::-1])[::-1], nhops)
+
+    # each section lasts from the hop after its onset to the hop of the next onset
+    first = onset_hops + 1
+    last = np.append(onset_hops[1:], nhops)
+    silence_start = next_silent[first]
+    silent_hops = silent_count[last] - silent_count[first]
+    ends = np.append(onset_frames[1:], nframes) - 1
+    ends = np.where(
+        (silence_start < last) & (silent_hops >= args.min_silent_hops),
+        silence_start * hop_size - 1,
+        ends,
+    )
+    return [(int(start), int(end)) for start, end in zip(onset_frames, ends)]
+
+
+def slice_file(input_file, args):
+    """Find sections in input file and write them to slices.
+
+    Returns list of slice records (see `slicing.slice_source_at_stamps`). Their peak
+    and RMS levels are only computed if a manifest is written.
+
+    """
+    output_dir = args.output_dir or os.path.dirname(input_file) or "."
+
+    # the numpy backend reads blocks of hops and splits them into hops itself
+    read_size = args.hop_size * (BLOCK_HOPS if args.backend == "numpy" else 1)
+
+    with aubio.source(input_file, hop_size=read_size) as audio_source:
+        onset = create_onset(args, audio_source.samplerate)
+
+        if args.verbose:
+            print(f"Analyzing file '{input_file}'...")
+
+        if args.single_pass:
+            # onsets are reported with a delay, so keep enough past hops to start slices there
+            with StreamSlicer(
+                input_file,
+                audio_source.samplerate,
+                audio_source.channels,
+                lookbehind=onset.get_delay() + 2 * args.hop_size,
+                output_dir=output_dir,
+                output_template=args.output_format,
+                verbose=args.verbose,
+                stats=bool(args.manifest),
+            ) as slicer:
+                find_sections(audio_source, onset, args, slicer)
+
+            return slicer.records
+
+        if args.backend == "numpy":
+            sections = find_sections_numpy(audio_source, onset, args)
+        else:
+            sections = find_sections(audio_source, onset, args)
+
+    if not sections:
+        return []
+
+    return slice_source_at_stamps(
+        input_file,
+        sections,
+        hop_size=args.hop_size,
+        output_dir=output_dir,
+        output_template=args.output_format,
+        verbose=args.verbose,
+        stats=bool(args.manifest),
+    )
+
+
+def slice_file_safe(input_file, args):
+    """Call slice_file() and return (records, None) or ([], error message) in worker process."""
+    try:
+        return slice_file(input_file, args), None
+    except Exception as exc:
+        return [], str(exc)
+
+
+def find_audio_files(paths):
+    """Expand directories (recursively) to a list of audio files."""
+    files = []
+
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames.sort()
+                files.extend(
+                    os.path.join(dirpath, fn)
+                    for fn in sorted(filenames)
+                    if os.path.splitext(fn)[1].lower() in AUDIO_EXTENSIONS
+                )
+        else:
+            files.append(path)
+
+    return files
+
+
+def write_manifest(filename, records):
+    """Write slice records to JSON file (if name ends with '.json') or CSV file."""
+    with open(filename, "w", newline="") as fp:
+        if filename.lower().endswith(".json"):
+            json.dump(records, fp, indent=2)
+            fp.write("\n")
+        else:
+            writer = csv.DictWriter(fp, fieldnames=MANIFEST_FIELDS)
+            writer.writeheader()
+            writer.writerows(records)
 
 
 def main(args=None):
@@ -73,91 +370,88 @@ def main(args=None):
         default=256,
         help="Hop size in sample frames (default: %(default)i)",
     )
+    ap.add_argument(
+        "-b",
+        "--backend",
+        choices=BACKENDS,
+        default="aubio",
+        help=(
+            "Analysis backend (default: %(default)s): aubio checks silence hop by hop, "
+            "numpy reads blocks and checks silence of all their hops at once"
+        ),
+    )
+    ap.add_argument(
+        "-1",
+        "--single-pass",
+        action="store_true",
+        help="Write slices while analyzing the input instead of reading it a second time.",
+    )
     ap.add_argument("-v", "--verbose", action="store_true", help="Be more verbose.")
-    ap.add_argument(dest="input_file", help="Input audio file.")
+    ap.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        metavar="N",
+        default=1,
+        help="Number of input files to slice in parallel processes (default: %(default)i)",
+    )
+    ap.add_argument(
+        "-x",
+        "--manifest",
+        metavar="FILE",
+        help=(
+            "Write list of slices with source, frame range, output path, peak and RMS "
+            "to FILE (JSON if name ends with '.json', CSV otherwise)"
+        ),
+    )
+    ap.add_argument(
+        dest="input_files",
+        nargs="+",
+        metavar="INPUT",
+        help="Input audio file(s) or directories to search for audio files.",
+    )
 
     args = ap.parse_args(args)
 
-    with aubio.source(args.input_file, hop_size=args.hop_size) as audio_source:
-        nframes = 0
-        nhops = 0
-        onsets = 0
-        read = 0
-        sections = []
-        silence_start = -1
-        silence_end = -1
-        signal_start = -1
-
-        onset = aubio.onset(
-            args.onset_method,
-            buf_size=512,
-            hop_size=args.hop_size,
-            samplerate=audio_source.samplerate,
-        )
-
-        if args.min_interval:
-            if args.min_interval.endswith("ms"):
-                onset.set_minioi_ms(int(args.min_interval[:-2]))
-            elif args.min_interval.endswith("s"):
-                onset.set_minioi_s(int(args.min_interval[:-1]))
-            else:
-                onset.set_minioi(int(args.min_interval))
-
-        onset.set_threshold(args.onset_threshold)
-
-        if args.verbose:
-            print(f"Analyzing file '{args.input_file}'...")
-
-        while True:
-            frames, read = audio_source()
-
-            if onset(frames):
-                onset_frame = onset.get_last()
-                onsets += 1
+    if args.single_pass and args.backend != "aubio":
+        ap.error("--single-pass is only supported with the aubio backend.")
 
-                if args.verbose:
-                    print(f"Onset #{onsets:02} detected at: {onset.get_last_s():.4f}")
+    files = find_audio_files(args.input_files)
 
-                if signal_start != -1:
-                    if silence_start != -1 and silent_hops >= args.min_silent_hops:
-                        sections.append((signal_start, silence_start - 1))
-                    else:
-                        sections.append((signal_start, onset_frame - 1))
+    if not files:
+        ap.error("No input files found.")
 
-                signal_start = onset_frame
-                silence_start = -1
-                silent_hops = 0
-            elif signal_start != -1:
-                if aubio.silence_detection(frames, args.silence_threshold):
-                    if silence_start == -1:
-                        silence_start = nframes
+    records = []
+    errors = 0
 
-                    silent_hops += 1
+    if args.jobs > 1 and len(files) > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            results = pool.map(slice_file_safe, files, [args] * len(files))
 
-            nframes += read
-            nhops += 1
+            for input_file, (slices, error) in zip(files, results):
+                if error:
+                    print(f"Error slicing '{input_file}': {error}", file=sys.stderr)
+                    errors += 1
+                else:
+                    records.extend(slices)
+    else:
+        for input_file in files:
+            try:
+                records.extend(slice_file(input_file, args))
+            except Exception as exc:
+                if len(files) == 1:
+                    raise
 
-            if read < audio_source.hop_size:
-                break
+                print(f"Error slicing '{input_file}': {exc}", file=sys.stderr)
+                errors += 1
 
-        if signal_start != -1:
-            if silence_start != -1 and silent_hops >= args.min_silent_hops:
-                sections.append((signal_start, silence_start - 1))
-            else:
-                sections.append((signal_start, nframes - 1))
+    if args.manifest:
+        write_manifest(args.manifest, records)
 
         if args.verbose:
-            print(f"Read frames={nframes}, hops={nhops}, hop_size={args.hop_size}")
-
-        if sections:
-            slice_source_at_stamps(
-                args.input_file,
-                sections,
-                hop_size=args.hop_size,
-                output_dir=args.output_dir,
-                output_template=args.output_format,
-                verbose=args.verbose,
-            )
+            print(f"Wrote manifest of {len(records)} slices to '{args.manifest}'.")
+
+    return 1 if errors else 0
 
 
 if __name__ == "__main__":
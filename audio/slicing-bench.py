@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Benchmark slice_source_at_stamps with many short regions.
+
+Writes a noise file, slices it into ``--regions`` short, partly overlapping
+regions and reports the time for ``slice_source_at_stamps()``.
+
+To compare against an older version, put its ``slicing.py`` in a directory
+and pass that directory with ``--compare``, e.g.::
+
+    mkdir /tmp/old && git show HEAD~1:audio/slicing.py > /tmp/old/slicing.py
+    ./slicing-bench.py --compare /tmp/old
+
+"""
+
+import argparse
+import importlib.util
+import random
+import sys
+import tempfile
+import time
+from os.path import abspath, dirname, join
+
+import aubio
+import numpy as np
+
+
+def load_slicing(moddir):
+    spec = importlib.util.spec_from_file_location("slicing", join(moddir, "slicing.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def write_noise(path, nframes, samplerate, channels, hop_size=4096):
+    rng = np.random.default_rng(0)
+    out = aubio.sink(path, samplerate, channels)
+
+    for pos in range(0, nframes, hop_size):
+        n = min(hop_size, nframes - pos)
+        out.do_multi(rng.uniform(-0.5, 0.5, (channels, hop_size)).astype(aubio.float_type), n)
+
+    out.close()
+
+
+def make_regions(count, min_len, max_len, overlap, seed=0):
+    rnd = random.Random(seed)
+    regions = []
+    pos = 0
+
+    for _ in range(count):
+        length = rnd.randint(min_len, max_len)
+        regions.append((pos, pos + length - 1))
+        # start next region before the end of this one with given probability
+        pos += rnd.randint(1, length) if rnd.random() < overlap else length
+
+    return regions
+
+
+def main(args=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("-c", "--compare", metavar="DIR",
+                    help="Directory with another slicing.py to compare against")
+    ap.add_argument("-n", "--regions", type=int, default=10000,
+                    help="Number of regions (default: %(default)i)")
+    ap.add_argument("-l", "--min-length", type=int, default=256,
+                    help="Minimum region length in frames (default: %(default)i)")
+    ap.add_argument("-L", "--max-length", type=int, default=2048,
+                    help="Maximum region length in frames (default: %(default)i)")
+    ap.add_argument("-O", "--overlap", type=float, default=0.2,
+                    help="Probability of a region overlapping the next (default: %(default).1f)")
+    ap.add_argument("-H", "--hop-size", type=int, default=64,
+                    help="Hop size in sample frames (default: %(default)i)")
+    ap.add_argument("-r", "--runs", type=int, default=3,
+                    help="Number of runs per version (default: %(default)i)")
+    args = ap.parse_args(args)
+
+    candidates = [("current", dirname(abspath(__file__)))]
+    if args.compare:
+        candidates.append(("compare", abspath(args.compare)))
+
+    regions = make_regions(args.regions, args.min_length, args.max_length, args.overlap)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source_file = join(tmpdir, "noise.wav")
+        write_noise(source_file, regions[-1][1] + 1, 44100, 2)
+        print(f"{len(regions)} regions, {regions[-1][1] + 1} frames, hop size {args.hop_size}")
+        print("%-10s %10s" % ("version", "time (s)"))
+
+        for label, moddir in candidates:
+            slicing = load_slicing(moddir)
+            times = []
+
+            for run in range(args.runs):
+                output_dir = join(tmpdir, f"{label}-{run}")
+                t0 = time.perf_counter()
+                # older versions consume the regions list
+                slicing.slice_source_at_stamps(
+                    source_file, list(regions), hop_size=args.hop_size, output_dir=output_dir
+                )
+                times.append(time.perf_counter() - t0)
+
+            print("%-10s %10.3f" % (label, min(times)))
+
+
+if __name__ == "__main__":
+    sys.exit(main() or 0)
@@ -1,9 +1,76 @@
 """Utility routine to slice sound files at given timestamps"""
 
+import heapq
+import math
 import os
+from collections import deque
+
+import numpy as np
 from aubio import source, sink
 
 
+def _sink_path(output_dir, output_template, basename, slice_, timestamp, samplerate):
+    # create name based on a output_template
+    timestamp_seconds = timestamp / float(samplerate)
+    return os.path.join(
+        output_dir,
+        output_template.format(
+            basename=basename,
+            timestamp_seconds="%011.6f" % timestamp_seconds,
+            ext="wav",
+            timestamp=timestamp,
+            slice=slice_,
+            samplerate=samplerate,
+        ),
+    )
+
+
+def _new_slice(slice_, start_stamp, end_stamp, _sink, **extra):
+    return {
+        "slice": slice_,
+        "start_stamp": start_stamp,
+        "end_stamp": end_stamp,
+        "sink": _sink,
+        "frames": 0,
+        "samples": 0,
+        "peak": 0.0,
+        "sumsq": 0.0,
+        **extra,
+    }
+
+
+def _update_stats(current_slice, vec, stats):
+    # accumulate length and, if `stats` is true, peak and energy of samples written to slice
+    current_slice["frames"] += vec.shape[1]
+    current_slice["samples"] += vec.size
+
+    if stats and vec.size:
+        current_slice["peak"] = max(current_slice["peak"], float(np.abs(vec).max()))
+        current_slice["sumsq"] += float(np.einsum("ij,ij->", vec, vec, dtype=np.float64))
+
+
+def _slice_record(source_file, current_slice, stats):
+    # create dict describing written slice
+    samples = current_slice["samples"]
+
+    if not stats:
+        peak = rms = None
+    else:
+        peak = current_slice["peak"]
+        rms = math.sqrt(current_slice["sumsq"] / samples) if samples else 0.0
+
+    return {
+        "source": source_file,
+        "slice": current_slice["slice"],
+        "path": current_slice["sink"].uri,
+        "start": current_slice["start_stamp"],
+        "end": current_slice["start_stamp"] + current_slice["frames"] - 1,
+        "frames": current_slice["frames"],
+        "peak": peak,
+        "rms": rms,
+    }
+
+
 def slice_source_at_stamps(
     source_file,
     regions,
@@ -13,6 +80,7 @@ def slice_source_at_stamps(
     exist_ok=True,
     output_template="{basename}_{slice:02}.{ext}",
     verbose=False,
+    stats=False,
 ):
     """Slice a sound file at given timestamps.
 
@@ -21,6 +89,12 @@ def slice_source_at_stamps(
     integer tuples corresponding to time locations in `source_file`,
     in sample frames.
 
+    Returns a list of dicts, one for each slice written, ordered by
+    slice number, with the keys "source", "slice", "path", "start",
+    "end", "frames", "peak" and "rms". "end" is the last frame actually
+    written, "peak" and "rms" are the peak and RMS level of all samples
+    of the slice (all channels) if `stats` is True, otherwise None.
+
     If `output_dir` is unspecified, the new slices will be written in
     the current directory. If `output_dir` is a string, new slices
     will be written in `output_dir`, after creating the directory if
@@ -49,6 +123,9 @@ def slice_source_at_stamps(
         samplerate to read the file at
     hop_size : int (optional)
         number of samples read from source per iteration
+    stats : bool (optional)
+        compute peak and RMS level of each slice (default: False, since
+        this is costly for many short hops)
     add_first : bool (optional)
         always create the slice at the start of the file
 
@@ -69,7 +146,9 @@ def slice_source_at_stamps(
     Notes
     -----
 
-    Slices may be overlapping.
+    Slices may be overlapping. Regions need not be sorted, slices are
+    numbered in order of their start stamp. An end stamp of `None` means
+    the slice extends to the end of the source.
 
     """
     if not regions:
@@ -82,72 +161,236 @@ def slice_source_at_stamps(
 
     os.makedirs(output_dir, exist_ok=exist_ok)
 
-    def _new_sink_name(slice_, basename, timestamp, samplerate):
-        # create name based on a output_template
-        timestamp_seconds = timestamp / float(samplerate)
-        return os.path.join(
-            output_dir,
-            output_template.format(
-                basename=basename,
-                timestamp_seconds="%011.6f" % timestamp_seconds,
-                ext="wav",
-                timestamp=timestamp,
-                slice=slice_,
-                samplerate=samplerate,
-            ),
-        )
+    # regions not started yet, ordered by start stamp
+    pending = deque(sorted(regions, key=lambda r: r[0]))
+    # open slices as min-heap of (end stamp, slice number, slice), so slices ending
+    # in the current hop are found without looking at all open slices
+    active = []
 
     # open source file
     _source = source(source_file, samplerate, hop_size)
     samplerate = _source.samplerate
 
     total_frames = 0
-    slices = []
     slice_ = 0
+    records = []
+
+    def _write(current_slice, vec):
+        _update_stats(current_slice, vec, stats)
+        current_slice["sink"].do_multi(vec, vec.shape[1])
+
+    def _close(current_slice):
+        records.append(_slice_record(source_file, current_slice, stats))
+        current_slice["sink"].close()
 
     while True:
         # get hop_size new samples from source
         vec, read = _source.do_multi()
-        # if the total number of frames read will exceed the next region start
-        while regions and total_frames + read >= regions[0][0]:
-            # get next region
-            start_stamp, end_stamp = regions.pop(0)
+        hop_end = total_frames + read
+
+        # open sinks for all regions starting in this hop
+        while pending and pending[0][0] < hop_end:
+            start_stamp, end_stamp = pending.popleft()
             slice_ += 1
             # create a name for the sink
-            new_sink_path = _new_sink_name(slice_, source_base_name, start_stamp, samplerate)
+            new_sink_path = _sink_path(
+                output_dir, output_template, source_base_name, slice_, start_stamp, samplerate
+            )
             # create its sink
             _sink = sink(new_sink_path, samplerate, _source.channels)
-            # create a dictionary containing all this
-            new_slice = {"start_stamp": start_stamp, "end_stamp": end_stamp, "sink": _sink}
-            # append the dictionary to the current list of slices
-            slices.append(new_slice)
+            new_slice = _new_slice(slice_, start_stamp, end_stamp, _sink)
+            heapq.heappush(
+                active, (math.inf if end_stamp is None else end_stamp, slice_, new_slice)
+            )
 
             if verbose:
                 print(f"Writing slice #{slice_} to '{_sink.uri}'.")
 
-        for i, current_slice in enumerate(slices):
-            start_stamp = current_slice["start_stamp"]
+        for _, _, current_slice in active:
+            # range of samples of the new source vector belonging to the region
+            start = max(current_slice["start_stamp"] - total_frames, 0)
             end_stamp = current_slice["end_stamp"]
-            _sink = current_slice["sink"]
-            # sample index to start writing from new source vector
-            start = max(start_stamp - total_frames, 0)
-            # number of samples yet to written be until end of region
-            remaining = end_stamp - total_frames + 1
-
-            # not enough frames remaining, time to split
-            if remaining < read:
-                if remaining > start:
-                    # write remaining samples from current region
-                    _sink.do_multi(vec[:, start:remaining], remaining - start)
-                    # close this file
-                    _sink.close()
-            elif read > start:
-                # write all the samples
-                _sink.do_multi(vec[:, start:read], read - start)
-
-        total_frames += read
-        # remove old slices
-        slices = list(filter(lambda s: s["end_stamp"] > total_frames, slices))
+            stop = read if end_stamp is None else min(end_stamp - total_frames + 1, read)
+
+            if stop > start:
+                _write(current_slice, vec[:, start:stop])
+
+        # close all sinks of regions ending in this hop
+        while active and active[0][0] < hop_end:
+            _close(heapq.heappop(active)[2])
+
+        total_frames = hop_end
 
         if read < hop_size:
             break
+
+    # close regions extending past the end of the source
+    for _, _, current_slice in active:
+        _close(current_slice)
+
+    records.sort(key=lambda r: r["slice"])
+    return records
+
+
+class StreamSlicer:
+    """Slice a stream of audio hops into files while regions are still being detected.
+
+    Instead of collecting all regions first and then reading the source a second time
+    (like :func:`slice_source_at_stamps` does), the caller feeds each hop it reads
+    to :meth:`feed` and announces region boundaries as soon as they are known:
+
+    - :meth:`start` opens a new slice at the given start stamp, which may lie up to
+      `lookbehind` frames in the past (e.g. the onset detection delay).
+    - :meth:`hold` marks a stamp after which frames of the current slice must not be
+      written yet, because the slice may still end there (e.g. start of a silence).
+      Held frames are kept in memory until the slice ends or a new one is started.
+    - :meth:`end` sets the last (inclusive) frame of the current slice.
+
+    The frames of the current slice are written to its sink with a delay of
+    `lookbehind` frames, since a slice may end at the start of the next one, which is
+    only known after the detection delay. Sinks are closed as soon as their slice has
+    been written completely. Call :meth:`close` after the last hop.
+
+    Slices are named like in :func:`slice_source_at_stamps`. After :meth:`close`,
+    `records` holds a record for each slice written, as returned by
+    :func:`slice_source_at_stamps` with the same `stats` argument.
+
+    """
+
+    def __init__(
+        self,
+        source_file,
+        samplerate,
+        channels,
+        lookbehind=0,
+        output_dir=None,
+        exist_ok=True,
+        output_template="{basename}_{slice:02}.{ext}",
+        verbose=False,
+        stats=False,
+    ):
+        self.source_file = source_file
+        self.basename = os.path.splitext(os.path.basename(source_file))[0]
+        self.samplerate = samplerate
+        self.channels = channels
+        self.lookbehind = lookbehind
+        self.output_dir = os.path.basename(source_file) if output_dir is None else output_dir
+        self.output_template = output_template
+        self.verbose = verbose
+        self.stats = stats
+        self.frames = 0
+        self.hops = deque()
+        self.slices = []
+        self.current = None
+        self.held = None
+        self.slice_ = 0
+        self.records = []
+        os.makedirs(self.output_dir, exist_ok=exist_ok)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def start(self, stamp):
+        """Start a new slice at `stamp`, ending the current one if not ended yet."""
+        oldest = self.hops[0][0] if self.hops else self.frames
+
+        if stamp < oldest:
+            raise ValueError(f"Slice start {stamp} is before oldest buffered frame {oldest}")
+
+        if self.current is not None:
+            self.end(max(stamp - 1, self.current["start_stamp"] - 1))
+
+        self.slice_ += 1
+        path = _sink_path(
+            self.output_dir, self.output_template, self.basename, self.slice_, stamp, self.samplerate
+        )
+        self.current = _new_slice(
+            self.slice_, stamp, None, sink(path, self.samplerate, self.channels), pos=stamp
+        )
+        self.slices.append(self.current)
+        self.held = None
+
+        if self.verbose:
+            print(f"Writing slice #{self.slice_} to '{path}'.")
+
+    def hold(self, stamp):
+        """Do not write frames from `stamp` on of the current slice until it ends."""
+        self.held = stamp
+
+    def end(self, stamp):
+        """End the current slice at `stamp` (inclusive). Does nothing if no slice is open."""
+        if self.current is not None:
+            self.current["end_stamp"] = stamp
+            self.current = None
+            self.held = None
+
+    def feed(self, vec, read):
+        """Add a hop of `read` frames in `vec` (channels x frames) and write what is safe."""
+        if read:
+            self.hops.append((self.frames, vec[:, :read].copy()))
+            self.frames += read
+
+        self._flush(self.frames - self.lookbehind)
+
+    def close(self):
+        """Write all remaining frames, end the current slice and close all sinks."""
+        self.end(self.frames - 1)
+
+        try:
+            self._flush(self.frames, final=True)
+        finally:
+            self.hops.clear()
+            self.records.sort(key=lambda r: r["slice"])
+
+    def _write(self, slice_, limit):
+        pos = slice_["pos"]
+        hops = self.hops
+        hop_size = hops[0][1].shape[1]
+        # all hops but the last one have the same size, so we can index them directly
+        index = max(pos - hops[0][0], 0) // hop_size
+
+        while pos < limit and index < len(hops):
+            hop_start, vec = hops[index]
+            start = pos - hop_start
+            stop = min(limit - hop_start, vec.shape[1])
+
+            if stop > start:
+                _update_stats(slice_, vec[:, start:stop], self.stats)
+                slice_["sink"].do_multi(vec[:, start:stop], stop - start)
+                pos = hop_start + stop
+
+            index += 1
+
+        slice_["pos"] = pos
+
+    def _flush(self, limit, final=False):
+        remaining = []
+
+        for slice_ in self.slices:
+            end = slice_["end_stamp"]
+
+            if end is not None:
+                slice_limit = end + 1
+            elif self.held is not None:
+                slice_limit = min(limit, self.held)
+            else:
+                slice_limit = limit
+
+            if self.hops and slice_limit > slice_["pos"]:
+                self._write(slice_, slice_limit)
+
+            if final or (end is not None and slice_["pos"] > end):
+                self.records.append(_slice_record(self.source_file, slice_, self.stats))
+                slice_["sink"].close()
+            else:
+                remaining.append(slice_)
+
+        self.slices = remaining
+        # keep hops still needed by open slices or for slices starting in the past
+        keep = min([s["pos"] for s in self.slices] + [self.frames - self.lookbehind])
+
+        while self.hops and self.hops[0][0] + self.hops[0][1].shape[1] <= keep:
+            self.hops.popleft()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Benchmark start-up cost of the colornames module.
+
+Each measurement runs in a fresh interpreter and reports the time for
+``import colornames`` and for the first ``get_color_name()`` call (which
+loads the color table and builds the classifier).
+
+To compare against an older version, put its ``colornames.py`` in a
+directory and pass that directory with ``--compare``, e.g.::
+
+    mkdir /tmp/old && git show HEAD~1:colornames.py > /tmp/old/colornames.py
+    ./colornames-bench.py --compare /tmp/old
+
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from os.path import abspath, dirname
+
+
+SNIPPET = """\
+import sys, time
+sys.path.insert(0, %r)
+t0 = time.perf_counter()
+import colornames
+t1 = time.perf_counter()
+colornames.get_color_name(0x80, 0x40, 0x20, 20)
+t2 = time.perf_counter()
+print(t1 - t0, t2 - t1)
+"""
+
+
+def measure(moddir, runs):
+    cmd = [sys.executable, '-c', SNIPPET % moddir]
+    # always allow the bytecode cache, so we measure the normal start-up cost
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    imports, lookups = [], []
+
+    for _ in range(runs):
+        out = subprocess.run(cmd, check=True, capture_output=True, text=True, env=env).stdout
+        t_import, t_lookup = (float(t) for t in out.split())
+        imports.append(t_import)
+        lookups.append(t_lookup)
+
+    return statistics.median(imports), statistics.median(lookups)
+
+
+def main(args=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument('-c', '--compare', metavar='DIR',
+                    help="Directory with another colornames.py to compare against")
+    ap.add_argument('-n', '--runs', type=int, default=20,
+                    help="Number of interpreter runs per measurement (default: %(default)i)")
+    args = ap.parse_args(args)
+
+    candidates = [('current', dirname(abspath(__file__)))]
+    if args.compare:
+        candidates.append(('compare', abspath(args.compare)))
+
+    print("%-10s %12s %16s" % ("version", "import (ms)", "first lookup (ms)"))
+    for label, moddir in candidates:
+        # warm-up run writes the bytecode cache
+        measure(moddir, 1)
+        t_import, t_lookup = measure(moddir, args.runs)
+        print("%-10s %12.2f %16.2f" % (label, t_import * 1000, t_lookup * 1000))
+
+
+if __name__ == '__main__':
+    sys.exit(main() or 0)
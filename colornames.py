@@ -2,7 +2,24 @@
 """Find name of closest matching color."""
 
 import math
+import os
 import sys
+from os.path import expanduser, join
+
+# NumPy is imported on first use, see _have_numpy()
+np = None
+
+
+def _have_numpy():
+    """Import NumPy if not done yet and return whether it is available."""
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            return False
+        np = numpy
+    return True
 
 
 def dist(p1, p2):
@@ -12,1594 +29,2041 @@ def dist(p1, p2):
     return math.sqrt(x * x + y * y + z * z)
 
 
+# sRGB -> CIE XYZ (D65) matrix and reference white
+_XYZ_MATRIX = (
+    (0.4124564, 0.3575761, 0.1804375),
+    (0.2126729, 0.7151522, 0.0721750),
+    (0.0193339, 0.1191920, 0.9503041),
+)
+_WHITE_D65 = (0.95047, 1.0, 1.08883)
+
+
+def rgb_to_lab(r, g, b):
+    """Convert an sRGB color (0-255 per channel) to CIELAB (D65)."""
+    def linear(c):
+        c /= 255.0
+        return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+
+    def f(t):
+        return t ** (1 / 3.0) if t > 216 / 24389.0 else t * 841 / 108.0 + 4 / 29.0
+
+    rgb = [linear(c) for c in (r, g, b)]
+    fx, fy, fz = (f(sum(m * c for m, c in zip(row, rgb)) / white)
+                  for row, white in zip(_XYZ_MATRIX, _WHITE_D65))
+    return 116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz)
+
+
+def rgb_to_lab_array(colors):
+    """Convert an (..., 3) array of sRGB colors (0-255) to CIELAB (D65)."""
+    if not _have_numpy():
+        raise ImportError("rgb_to_lab_array() needs NumPy.")
+
+    rgb = np.asarray(colors, dtype=np.float64) / 255.0
+    rgb = np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    xyz = rgb @ np.array(_XYZ_MATRIX).T / _WHITE_D65
+    fxyz = np.where(xyz > 216 / 24389.0, np.cbrt(xyz), xyz * 841 / 108.0 + 4 / 29.0)
+    lab = np.empty(fxyz.shape, dtype=np.float64)
+    lab[..., 0] = 116 * fxyz[..., 1] - 16
+    lab[..., 1] = 500 * (fxyz[..., 0] - fxyz[..., 1])
+    lab[..., 2] = 200 * (fxyz[..., 1] - fxyz[..., 2])
+    return lab
+
+
+def delta_e2000(lab1, lab2):
+    """Return CIEDE2000 color difference of broadcastable (..., 3) Lab arrays."""
+    if not _have_numpy():
+        raise ImportError("delta_e2000() needs NumPy.")
+
+    lab1 = np.asarray(lab1, dtype=np.float64)
+    lab2 = np.asarray(lab2, dtype=np.float64)
+    L1, a1, b1 = lab1[..., 0], lab1[..., 1], lab1[..., 2]
+    L2, a2, b2 = lab2[..., 0], lab2[..., 1], lab2[..., 2]
+
+    c7 = ((np.hypot(a1, b1) + np.hypot(a2, b2)) / 2) ** 7
+    g = 0.5 * (1 - np.sqrt(c7 / (c7 + 25.0 ** 7)))
+    c1 = np.hypot(a1 * (1 + g), b1)
+    c2 = np.hypot(a2 * (1 + g), b2)
+    h1 = np.degrees(np.arctan2(b1, a1 * (1 + g))) % 360
+    h2 = np.degrees(np.arctan2(b2, a2 * (1 + g))) % 360
+    chroma_zero = c1 * c2 == 0
+
+    dh = h2 - h1
+    dh = np.where(dh > 180, dh - 360, np.where(dh < -180, dh + 360, dh))
+    dh = np.where(chroma_zero, 0, dh)
+    dL = L2 - L1
+    dC = c2 - c1
+    dH = 2 * np.sqrt(c1 * c2) * np.sin(np.radians(dh / 2))
+
+    L_mean = (L1 + L2) / 2
+    c_mean = (c1 + c2) / 2
+    h_sum = h1 + h2
+    h_mean = np.where(chroma_zero, h_sum,
+                      np.where(np.abs(h1 - h2) <= 180, h_sum / 2,
+                               np.where(h_sum < 360, h_sum + 360, h_sum - 360) / 2))
+
+    t = (1 - 0.17 * np.cos(np.radians(h_mean - 30)) + 0.24 * np.cos(np.radians(2 * h_mean)) +
+         0.32 * np.cos(np.radians(3 * h_mean + 6)) - 0.20 * np.cos(np.radians(4 * h_mean - 63)))
+    c7 = c_mean ** 7
+    r_t = (-2 * np.sqrt(c7 / (c7 + 25.0 ** 7)) *
+           np.sin(np.radians(60 * np.exp(-((h_mean - 275) / 25) ** 2))))
+    s_l = 1 + 0.015 * (L_mean - 50) ** 2 / np.sqrt(20 + (L_mean - 50) ** 2)
+    s_c = 1 + 0.045 * c_mean
+    s_h = 1 + 0.015 * c_mean * t
+
+    return np.sqrt((dL / s_l) ** 2 + (dC / s_c) ** 2 + (dH / s_h) ** 2 +
+                   r_t * (dC / s_c) * (dH / s_h))
+
+
+class _GridIndex(object):
+    """Uniform 3-D bucket grid for exact nearest-neighbour queries.
+
+    Points are sorted into cubic cells of `cell_size`. A query visits the
+    cells in rings of increasing Chebyshev distance around the query's cell
+    and stops as soon as no point in the next ring can be closer than the
+    best match found so far.
+
+    """
+
+    def __init__(self, points, cell_size):
+        self.points = points
+        self.cell_size = cell_size
+        self.origin = tuple(min(p[i] for p in points) for i in range(3))
+        self.shape = tuple(int((max(p[i] for p in points) - self.origin[i]) // cell_size) + 1
+                           for i in range(3))
+        self.cells = {}
+        self._rings = []
+
+        for idx, point in enumerate(points):
+            self.cells.setdefault(self._cell(point), []).append(idx)
+
+    def _cell(self, point):
+        (ox, oy, oz), (sx, sy, sz), size = self.origin, self.shape, self.cell_size
+        return (min(max(int((point[0] - ox) // size), 0), sx - 1),
+                min(max(int((point[1] - oy) // size), 0), sy - 1),
+                min(max(int((point[2] - oz) // size), 0), sz - 1))
+
+    def _ring(self, n):
+        # offsets of all cells with a Chebyshev distance of exactly n
+        while len(self._rings) <= n:
+            k = len(self._rings)
+            span = range(-k, k + 1)
+            self._rings.append(tuple((i, j, l) for i in span for j in span for l in span
+                                     if max(abs(i), abs(j), abs(l)) == k))
+        return self._rings[n]
+
+    def nearest(self, point, max_dist=None):
+        """Return (index, distance) of the point closest to `point`.
+
+        Only points with a distance less than `max_dist` are considered.
+        On ties, the point with the lowest index wins. Returns
+        ``(None, None)`` if there is no match.
+
+        """
+        x, y, z = point
+        best = float('inf') if max_dist is None else max_dist * max_dist
+        best_idx = None
+        cx, cy, cz = self._cell(point)
+
+        for ring in range(max(self.shape)):
+            # no point in this ring can be closer than (ring - 1) cells
+            if ring > 1 and ((ring - 1) * self.cell_size) ** 2 > best:
+                break
+
+            for i, j, k in self._ring(ring):
+                bucket = self.cells.get((cx + i, cy + j, cz + k))
+
+                if bucket:
+                    for idx in bucket:
+                        px, py, pz = self.points[idx]
+                        d2 = (px - x) ** 2 + (py - y) ** 2 + (pz - z) ** 2
+
+                        if d2 < best or (d2 == best and best_idx is not None and idx < best_idx):
+                            best = d2
+                            best_idx = idx
+
+        if best_idx is None:
+            return None, None
+
+        return best_idx, math.sqrt(best)
+
+
 class ColorClassifier(object):
-    def __init__(self, data):
+    """Find the closest entry in a table of ((r, g, b), name) tuples.
+
+    `metric` selects the color difference measure:
+
+    ``rgb``
+        Euclidean distance of the RGB components (0 - 441).
+    ``de76``
+        CIE76 Delta E, i.e. Euclidean distance in CIELAB space.
+    ``de2000``
+        CIEDE2000 Delta E. Needs NumPy.
+
+    For ``rgb`` and ``de76`` single lookups use a grid index over the table
+    colors, ``de2000`` compares against all table entries at once. The CIELAB
+    coordinates of the table are computed only once.
+
+    """
+
+    metrics = ('rgb', 'de76', 'de2000')
+    # number of query colors per block in nearest_many()
+    block_size = 2048
+
+    def __init__(self, data, metric='rgb', cell_size=None):
+        if metric not in self.metrics:
+            raise ValueError("Unknown color metric: %s" % metric)
+
+        if metric == 'de2000' and not _have_numpy():
+            raise ImportError("The 'de2000' color metric needs NumPy.")
+
         self.data = data
+        self.metric = metric
+        self._matrix = None
+
+        if metric == 'rgb':
+            self.points = [color for color, _ in data]
+        elif _have_numpy():
+            self.points = [tuple(lab) for lab in rgb_to_lab_array([c for c, _ in data])]
+        else:
+            self.points = [rgb_to_lab(*color) for color, _ in data]
+
+        if metric == 'de2000':
+            self.index = None
+        else:
+            self.index = _GridIndex(self.points, cell_size or (32 if metric == 'rgb' else 10))
+
+    @property
+    def matrix(self):
+        """The colors of `data` in the metric's color space as N x 3 float64 array."""
+        if self._matrix is None:
+            if not _have_numpy():
+                raise ImportError("ColorClassifier.matrix needs NumPy.")
+            self._matrix = np.array(self.points, dtype=np.float64)
+        return self._matrix
+
+    def nearest(self, r, g, b, max_dist=sys.maxsize):
+        """Return (index, distance) of the closest entry in `data`."""
+        if self.metric == 'rgb':
+            return self.index.nearest((r, g, b), max_dist)
+        elif self.metric == 'de76':
+            return self.index.nearest(rgb_to_lab(r, g, b), max_dist)
+
+        indices, dists = self.nearest_many([(r, g, b)], max_dist)
+        if indices[0] < 0:
+            return None, None
+        return int(indices[0]), float(dists[0])
+
+    def nearest_many(self, colors, max_dist=sys.maxsize):
+        """Return indices and distances of closest entries for N x 3 array `colors`.
+
+        Indices of colors with no entry closer than `max_dist` (if given) are
+        set to -1. The distances are always those to the closest entry.
+
+        """
+        colors = np.asarray(colors, dtype=np.float64).reshape(-1, 3)
+
+        if self.metric != 'rgb':
+            colors = rgb_to_lab_array(colors)
+
+        matrix = self.matrix
+        sq_matrix = np.einsum('ij,ij->i', matrix, matrix)
+        indices = np.empty(len(colors), dtype=np.intp)
+        dists = np.empty(len(colors), dtype=np.float64)
+        block_size = self.block_size if self.metric != 'de2000' else self.block_size // 4
+
+        for start in range(0, len(colors), block_size):
+            block = colors[start:start + block_size]
+
+            if self.metric == 'de2000':
+                d2 = delta_e2000(block[:, np.newaxis], matrix) ** 2
+            else:
+                # |q - c|^2 = |q|^2 - 2 q.c + |c|^2, exact for integer components
+                d2 = block @ matrix.T
+                d2 *= -2
+                d2 += sq_matrix
+                d2 += np.einsum('ij,ij->i', block, block)[:, np.newaxis]
+
+            idx = d2.argmin(axis=1)
+            indices[start:start + len(block)] = idx
+            dists[start:start + len(block)] = d2[np.arange(len(block)), idx]
+
+        np.maximum(dists, 0, out=dists)
+
+        if max_dist is not None:
+            indices[dists >= float(max_dist) ** 2] = -1
+
+        return indices, np.sqrt(dists, out=dists)
 
     def classify(self, r, g, b, min_distance=sys.maxsize):
-        match_name = None
-        for color, name in self.data:
-            distance = dist(color, (r, g, b))
-            if distance < min_distance:
-                min_distance = distance
-                match_name = name
-
-        return match_name
-
-
-color_names = (
-    ((0x00, 0x00, 0x00), "Black"),
-    ((0x00, 0x00, 0x80), "Navy Blue"),
-    ((0x00, 0x00, 0xC8), "Dark Blue"),
-    ((0x00, 0x00, 0xFF), "Blue"),
-    ((0x00, 0x07, 0x41), "Stratos"),
-    ((0x00, 0x1B, 0x1C), "Swamp"),
-    ((0x00, 0x23, 0x87), "Resolution Blue"),
-    ((0x00, 0x29, 0x00), "Deep Fir"),
-    ((0x00, 0x2E, 0x20), "Burnham"),
-    ((0x00, 0x2F, 0xA7), "International Klein Blue"),
-    ((0x00, 0x31, 0x53), "Prussian Blue"),
-    ((0x00, 0x33, 0x66), "Midnight Blue"),
-    ((0x00, 0x33, 0x99), "Smalt"),
-    ((0x00, 0x35, 0x32), "Deep Teal"),
-    ((0x00, 0x3E, 0x40), "Cyprus"),
-    ((0x00, 0x46, 0x20), "Kaitoke Green"),
-    ((0x00, 0x47, 0xAB), "Cobalt"),
-    ((0x00, 0x48, 0x16), "Crusoe"),
-    ((0x00, 0x49, 0x50), "Sherpa Blue"),
-    ((0x00, 0x56, 0xA7), "Endeavour"),
-    ((0x00, 0x58, 0x1A), "Camarone"),
-    ((0x00, 0x66, 0xCC), "Science Blue"),
-    ((0x00, 0x66, 0xFF), "Blue Ribbon"),
-    ((0x00, 0x75, 0x5E), "Tropical Rain Forest"),
-    ((0x00, 0x76, 0xA3), "Allports"),
-    ((0x00, 0x7B, 0xA7), "Deep Cerulean"),
-    ((0x00, 0x7E, 0xC7), "Lochmara"),
-    ((0x00, 0x7F, 0xFF), "Azure Radiance"),
-    ((0x00, 0x80, 0x80), "Teal"),
-    ((0x00, 0x95, 0xB6), "Bondi Blue"),
-    ((0x00, 0x9D, 0xC4), "Pacific Blue"),
-    ((0x00, 0xA6, 0x93), "Persian Green"),
-    ((0x00, 0xA8, 0x6B), "Jade"),
-    ((0x00, 0xCC, 0x99), "Caribbean Green"),
-    ((0x00, 0xCC, 0xCC), "Robin's Egg Blue"),
-    ((0x00, 0xFF, 0x00), "Green"),
-    ((0x00, 0xFF, 0x7F), "Spring Green"),
-    ((0x00, 0xFF, 0xFF), "Cyan / Aqua"),
-    ((0x01, 0x0D, 0x1A), "Blue Charcoal"),
-    ((0x01, 0x16, 0x35), "Midnight"),
-    ((0x01, 0x1D, 0x13), "Holly"),
-    ((0x01, 0x27, 0x31), "Daintree"),
-    ((0x01, 0x36, 0x1C), "Cardin Green"),
-    ((0x01, 0x37, 0x1A), "County Green"),
-    ((0x01, 0x3E, 0x62), "Astronaut Blue"),
-    ((0x01, 0x3F, 0x6A), "Regal Blue"),
-    ((0x01, 0x4B, 0x43), "Aqua Deep"),
-    ((0x01, 0x5E, 0x85), "Orient"),
-    ((0x01, 0x61, 0x62), "Blue Stone"),
-    ((0x01, 0x6D, 0x39), "Fun Green"),
-    ((0x01, 0x79, 0x6F), "Pine Green"),
-    ((0x01, 0x79, 0x87), "Blue Lagoon"),
-    ((0x01, 0x82, 0x6B), "Deep Sea"),
-    ((0x01, 0xA3, 0x68), "Green Haze"),
-    ((0x02, 0x2D, 0x15), "English Holly"),
-    ((0x02, 0x40, 0x2C), "Sherwood Green"),
-    ((0x02, 0x47, 0x8E), "Congress Blue"),
-    ((0x02, 0x4E, 0x46), "Evening Sea"),
-    ((0x02, 0x63, 0x95), "Bahama Blue"),
-    ((0x02, 0x86, 0x6F), "Observatory"),
-    ((0x02, 0xA4, 0xD3), "Cerulean"),
-    ((0x03, 0x16, 0x3C), "Tangaroa"),
-    ((0x03, 0x2B, 0x52), "Green Vogue"),
-    ((0x03, 0x6A, 0x6E), "Mosque"),
-    ((0x04, 0x10, 0x04), "Midnight Moss"),
-    ((0x04, 0x13, 0x22), "Black Pearl"),
-    ((0x04, 0x2E, 0x4C), "Blue Whale"),
-    ((0x04, 0x40, 0x22), "Zuccini"),
-    ((0x04, 0x42, 0x59), "Teal Blue"),
-    ((0x05, 0x10, 0x40), "Deep Cove"),
-    ((0x05, 0x16, 0x57), "Gulf Blue"),
-    ((0x05, 0x59, 0x89), "Venice Blue"),
-    ((0x05, 0x6F, 0x57), "Watercourse"),
-    ((0x06, 0x2A, 0x78), "Catalina Blue"),
-    ((0x06, 0x35, 0x37), "Tiber"),
-    ((0x06, 0x9B, 0x81), "Gossamer"),
-    ((0x06, 0xA1, 0x89), "Niagara"),
-    ((0x07, 0x3A, 0x50), "Tarawera"),
-    ((0x08, 0x01, 0x10), "Jaguar"),
-    ((0x08, 0x19, 0x10), "Black Bean"),
-    ((0x08, 0x25, 0x67), "Deep Sapphire"),
-    ((0x08, 0x83, 0x70), "Elf Green"),
-    ((0x08, 0xE8, 0xDE), "Bright Turquoise"),
-    ((0x09, 0x22, 0x56), "Downriver"),
-    ((0x09, 0x23, 0x0F), "Palm Green"),
-    ((0x09, 0x25, 0x5D), "Madison"),
-    ((0x09, 0x36, 0x24), "Bottle Green"),
-    ((0x09, 0x58, 0x59), "Deep Sea Green"),
-    ((0x09, 0x7F, 0x4B), "Salem"),
-    ((0x0A, 0x00, 0x1C), "Black Russian"),
-    ((0x0A, 0x48, 0x0D), "Dark Fern"),
-    ((0x0A, 0x69, 0x06), "Japanese Laurel"),
-    ((0x0A, 0x6F, 0x75), "Atoll"),
-    ((0x0B, 0x0B, 0x0B), "Cod Gray"),
-    ((0x0B, 0x0F, 0x08), "Marshland"),
-    ((0x0B, 0x11, 0x07), "Gordons Green"),
-    ((0x0B, 0x13, 0x04), "Black Forest"),
-    ((0x0B, 0x62, 0x07), "San Felix"),
-    ((0x0B, 0xDA, 0x51), "Malachite"),
-    ((0x0C, 0x0B, 0x1D), "Ebony"),
-    ((0x0C, 0x0D, 0x0F), "Woodsmoke"),
-    ((0x0C, 0x19, 0x11), "Racing Green"),
-    ((0x0C, 0x7A, 0x79), "Surfie Green"),
-    ((0x0C, 0x89, 0x90), "Blue Chill"),
-    ((0x0D, 0x03, 0x32), "Black Rock"),
-    ((0x0D, 0x11, 0x17), "Bunker"),
-    ((0x0D, 0x1C, 0x19), "Aztec"),
-    ((0x0D, 0x2E, 0x1C), "Bush"),
-    ((0x0E, 0x0E, 0x18), "Cinder"),
-    ((0x0E, 0x2A, 0x30), "Firefly"),
-    ((0x0F, 0x2D, 0x9E), "Torea Bay"),
-    ((0x10, 0x12, 0x1D), "Vulcan"),
-    ((0x10, 0x14, 0x05), "Green Waterloo"),
-    ((0x10, 0x58, 0x52), "Eden"),
-    ((0x11, 0x0C, 0x6C), "Arapawa"),
-    ((0x12, 0x0A, 0x8F), "Ultramarine"),
-    ((0x12, 0x34, 0x47), "Elephant"),
-    ((0x12, 0x6B, 0x40), "Jewel"),
-    ((0x13, 0x00, 0x00), "Diesel"),
-    ((0x13, 0x0A, 0x06), "Asphalt"),
-    ((0x13, 0x26, 0x4D), "Blue Zodiac"),
-    ((0x13, 0x4F, 0x19), "Parsley"),
-    ((0x14, 0x06, 0x00), "Nero"),
-    ((0x14, 0x50, 0xAA), "Tory Blue"),
-    ((0x15, 0x1F, 0x4C), "Bunting"),
-    ((0x15, 0x60, 0xBD), "Denim"),
-    ((0x15, 0x73, 0x6B), "Genoa"),
-    ((0x16, 0x19, 0x28), "Mirage"),
-    ((0x16, 0x1D, 0x10), "Hunter Green"),
-    ((0x16, 0x2A, 0x40), "Big Stone"),
-    ((0x16, 0x32, 0x22), "Celtic"),
-    ((0x16, 0x32, 0x2C), "Timber Green"),
-    ((0x16, 0x35, 0x31), "Gable Green"),
-    ((0x17, 0x1F, 0x04), "Pine Tree"),
-    ((0x17, 0x55, 0x79), "Chathams Blue"),
-    ((0x18, 0x2D, 0x09), "Deep Forest Green"),
-    ((0x18, 0x58, 0x7A), "Blumine"),
-    ((0x19, 0x33, 0x0E), "Palm Leaf"),
-    ((0x19, 0x37, 0x51), "Nile Blue"),
-    ((0x19, 0x59, 0xA8), "Fun Blue"),
-    ((0x1A, 0x1A, 0x68), "Lucky Point"),
-    ((0x1A, 0xB3, 0x85), "Mountain Meadow"),
-    ((0x1B, 0x02, 0x45), "Tolopea"),
-    ((0x1B, 0x10, 0x35), "Haiti"),
-    ((0x1B, 0x12, 0x7B), "Deep Koamaru"),
-    ((0x1B, 0x14, 0x04), "Acadia"),
-    ((0x1B, 0x2F, 0x11), "Seaweed"),
-    ((0x1B, 0x31, 0x62), "Biscay"),
-    ((0x1B, 0x65, 0x9D), "Matisse"),
-    ((0x1C, 0x12, 0x08), "Crowshead"),
-    ((0x1C, 0x1E, 0x13), "Rangoon Green"),
-    ((0x1C, 0x39, 0xBB), "Persian Blue"),
-    ((0x1C, 0x40, 0x2E), "Everglade"),
-    ((0x1C, 0x7C, 0x7D), "Elm"),
-    ((0x1D, 0x61, 0x42), "Green Pea"),
-    ((0x1E, 0x0F, 0x04), "Creole"),
-    ((0x1E, 0x16, 0x09), "Karaka"),
-    ((0x1E, 0x17, 0x08), "El Paso"),
-    ((0x1E, 0x38, 0x5B), "Cello"),
-    ((0x1E, 0x43, 0x3C), "Te Papa Green"),
-    ((0x1E, 0x90, 0xFF), "Dodger Blue"),
-    ((0x1E, 0x9A, 0xB0), "Eastern Blue"),
-    ((0x1F, 0x12, 0x0F), "Night Rider"),
-    ((0x1F, 0xC2, 0xC2), "Java"),
-    ((0x20, 0x20, 0x8D), "Jacksons Purple"),
-    ((0x20, 0x2E, 0x54), "Cloud Burst"),
-    ((0x20, 0x48, 0x52), "Blue Dianne"),
-    ((0x21, 0x1A, 0x0E), "Eternity"),
-    ((0x22, 0x08, 0x78), "Deep Blue"),
-    ((0x22, 0x8B, 0x22), "Forest Green"),
-    ((0x23, 0x34, 0x18), "Mallard"),
-    ((0x24, 0x0A, 0x40), "Violet"),
-    ((0x24, 0x0C, 0x02), "Kilamanjaro"),
-    ((0x24, 0x2A, 0x1D), "Log Cabin"),
-    ((0x24, 0x2E, 0x16), "Black Olive"),
-    ((0x24, 0x50, 0x0F), "Green House"),
-    ((0x25, 0x16, 0x07), "Graphite"),
-    ((0x25, 0x17, 0x06), "Cannon Black"),
-    ((0x25, 0x1F, 0x4F), "Port Gore"),
-    ((0x25, 0x27, 0x2C), "Shark"),
-    ((0x25, 0x31, 0x1C), "Green Kelp"),
-    ((0x25, 0x96, 0xD1), "Curious Blue"),
-    ((0x26, 0x03, 0x68), "Paua"),
-    ((0x26, 0x05, 0x6A), "Paris M"),
-    ((0x26, 0x11, 0x05), "Wood Bark"),
-    ((0x26, 0x14, 0x14), "Gondola"),
-    ((0x26, 0x23, 0x35), "Steel Gray"),
-    ((0x26, 0x28, 0x3B), "Ebony Clay"),
-    ((0x27, 0x3A, 0x81), "Bay of Many"),
-    ((0x27, 0x50, 0x4B), "Plantation"),
-    ((0x27, 0x8A, 0x5B), "Eucalyptus"),
-    ((0x28, 0x1E, 0x15), "Oil"),
-    ((0x28, 0x3A, 0x77), "Astronaut"),
-    ((0x28, 0x6A, 0xCD), "Mariner"),
-    ((0x29, 0x0C, 0x5E), "Violent Violet"),
-    ((0x29, 0x21, 0x30), "Bastille"),
-    ((0x29, 0x23, 0x19), "Zeus"),
-    ((0x29, 0x29, 0x37), "Charade"),
-    ((0x29, 0x7B, 0x9A), "Jelly Bean"),
-    ((0x29, 0xAB, 0x87), "Jungle Green"),
-    ((0x2A, 0x03, 0x59), "Cherry Pie"),
-    ((0x2A, 0x14, 0x0E), "Coffee Bean"),
-    ((0x2A, 0x26, 0x30), "Baltic Sea"),
-    ((0x2A, 0x38, 0x0B), "Turtle Green"),
-    ((0x2A, 0x52, 0xBE), "Cerulean Blue"),
-    ((0x2B, 0x02, 0x02), "Sepia Black"),
-    ((0x2B, 0x19, 0x4F), "Valhalla"),
-    ((0x2B, 0x32, 0x28), "Heavy Metal"),
-    ((0x2C, 0x0E, 0x8C), "Blue Gem"),
-    ((0x2C, 0x16, 0x32), "Revolver"),
-    ((0x2C, 0x21, 0x33), "Bleached Cedar"),
-    ((0x2C, 0x8C, 0x84), "Lochinvar"),
-    ((0x2D, 0x25, 0x10), "Mikado"),
-    ((0x2D, 0x38, 0x3A), "Outer Space"),
-    ((0x2D, 0x56, 0x9B), "St Tropaz"),
-    ((0x2E, 0x03, 0x29), "Jacaranda"),
-    ((0x2E, 0x19, 0x05), "Jacko Bean"),
-    ((0x2E, 0x32, 0x22), "Rangitoto"),
-    ((0x2E, 0x3F, 0x62), "Rhino"),
-    ((0x2E, 0x8B, 0x57), "Sea Green"),
-    ((0x2E, 0xBF, 0xD4), "Scooter"),
-    ((0x2F, 0x27, 0x0E), "Onion"),
-    ((0x2F, 0x3C, 0xB3), "Governor Bay"),
-    ((0x2F, 0x51, 0x9E), "Sapphire"),
-    ((0x2F, 0x5A, 0x57), "Spectra"),
-    ((0x2F, 0x61, 0x68), "Casal"),
-    ((0x30, 0x05, 0x29), "Melanzane"),
-    ((0x30, 0x1F, 0x1E), "Cocoa Brown"),
-    ((0x30, 0x2A, 0x0F), "Woodrush"),
-    ((0x30, 0x4B, 0x6A), "San Juan"),
-    ((0x30, 0xD5, 0xC8), "Turquoise"),
-    ((0x31, 0x1C, 0x17), "Eclipse"),
-    ((0x31, 0x44, 0x59), "Pickled Bluewood"),
-    ((0x31, 0x5B, 0xA1), "Azure"),
-    ((0x31, 0x72, 0x8D), "Calypso"),
-    ((0x31, 0x7D, 0x82), "Paradiso"),
-    ((0x32, 0x12, 0x7A), "Persian Indigo"),
-    ((0x32, 0x29, 0x3A), "Blackcurrant"),
-    ((0x32, 0x32, 0x32), "Mine Shaft"),
-    ((0x32, 0x5D, 0x52), "Stromboli"),
-    ((0x32, 0x7C, 0x14), "Bilbao"),
-    ((0x32, 0x7D, 0xA0), "Astral"),
-    ((0x33, 0x03, 0x6B), "Christalle"),
-    ((0x33, 0x29, 0x2F), "Thunder"),
-    ((0x33, 0xCC, 0x99), "Shamrock"),
-    ((0x34, 0x15, 0x15), "Tamarind"),
-    ((0x35, 0x00, 0x36), "Mardi Gras"),
-    ((0x35, 0x0E, 0x42), "Valentino"),
-    ((0x35, 0x0E, 0x57), "Jagger"),
-    ((0x35, 0x35, 0x42), "Tuna"),
-    ((0x35, 0x4E, 0x8C), "Chambray"),
-    ((0x36, 0x30, 0x50), "Martinique"),
-    ((0x36, 0x35, 0x34), "Tuatara"),
-    ((0x36, 0x3C, 0x0D), "Waiouru"),
-    ((0x36, 0x74, 0x7D), "Ming"),
-    ((0x36, 0x87, 0x16), "La Palma"),
-    ((0x37, 0x02, 0x02), "Chocolate"),
-    ((0x37, 0x1D, 0x09), "Clinker"),
-    ((0x37, 0x29, 0x0E), "Brown Tumbleweed"),
-    ((0x37, 0x30, 0x21), "Birch"),
-    ((0x37, 0x74, 0x75), "Oracle"),
-    ((0x38, 0x04, 0x74), "Blue Diamond"),
-    ((0x38, 0x1A, 0x51), "Grape"),
-    ((0x38, 0x35, 0x33), "Dune"),
-    ((0x38, 0x45, 0x55), "Oxford Blue"),
-    ((0x38, 0x49, 0x10), "Clover"),
-    ((0x39, 0x48, 0x51), "Limed Spruce"),
-    ((0x39, 0x64, 0x13), "Dell"),
-    ((0x3A, 0x00, 0x20), "Toledo"),
-    ((0x3A, 0x20, 0x10), "Sambuca"),
-    ((0x3A, 0x2A, 0x6A), "Jacarta"),
-    ((0x3A, 0x68, 0x6C), "William"),
-    ((0x3A, 0x6A, 0x47), "Killarney"),
-    ((0x3A, 0xB0, 0x9E), "Keppel"),
-    ((0x3B, 0x00, 0x0B), "Temptress"),
-    ((0x3B, 0x09, 0x10), "Aubergine"),
-    ((0x3B, 0x1F, 0x1F), "Jon"),
-    ((0x3B, 0x28, 0x20), "Treehouse"),
-    ((0x3B, 0x7A, 0x57), "Amazon"),
-    ((0x3B, 0x91, 0xB4), "Boston Blue"),
-    ((0x3C, 0x08, 0x78), "Windsor"),
-    ((0x3C, 0x12, 0x06), "Rebel"),
-    ((0x3C, 0x1F, 0x76), "Meteorite"),
-    ((0x3C, 0x20, 0x05), "Dark Ebony"),
-    ((0x3C, 0x39, 0x10), "Camouflage"),
-    ((0x3C, 0x41, 0x51), "Bright Gray"),
-    ((0x3C, 0x44, 0x43), "Cape Cod"),
-    ((0x3C, 0x49, 0x3A), "Lunar Green"),
-    ((0x3D, 0x0C, 0x02), "Bean  "),
-    ((0x3D, 0x2B, 0x1F), "Bistre"),
-    ((0x3D, 0x7D, 0x52), "Goblin"),
-    ((0x3E, 0x04, 0x80), "Kingfisher Daisy"),
-    ((0x3E, 0x1C, 0x14), "Cedar"),
-    ((0x3E, 0x2B, 0x23), "English Walnut"),
-    ((0x3E, 0x2C, 0x1C), "Black Marlin"),
-    ((0x3E, 0x3A, 0x44), "Ship Gray"),
-    ((0x3E, 0xAB, 0xBF), "Pelorous"),
-    ((0x3F, 0x21, 0x09), "Bronze"),
-    ((0x3F, 0x25, 0x00), "Cola"),
-    ((0x3F, 0x30, 0x02), "Madras"),
-    ((0x3F, 0x30, 0x7F), "Minsk"),
-    ((0x3F, 0x4C, 0x3A), "Cabbage Pont"),
-    ((0x3F, 0x58, 0x3B), "Tom Thumb"),
-    ((0x3F, 0x5D, 0x53), "Mineral Green"),
-    ((0x3F, 0xC1, 0xAA), "Puerto Rico"),
-    ((0x3F, 0xFF, 0x00), "Harlequin"),
-    ((0x40, 0x18, 0x01), "Brown Pod"),
-    ((0x40, 0x29, 0x1D), "Cork"),
-    ((0x40, 0x3B, 0x38), "Masala"),
-    ((0x40, 0x3D, 0x19), "Thatch Green"),
-    ((0x40, 0x51, 0x69), "Fiord"),
-    ((0x40, 0x82, 0x6D), "Viridian"),
-    ((0x40, 0xA8, 0x60), "Chateau Green"),
-    ((0x41, 0x00, 0x56), "Ripe Plum"),
-    ((0x41, 0x1F, 0x10), "Paco"),
-    ((0x41, 0x20, 0x10), "Deep Oak"),
-    ((0x41, 0x3C, 0x37), "Merlin"),
-    ((0x41, 0x42, 0x57), "Gun Powder"),
-    ((0x41, 0x4C, 0x7D), "East Bay"),
-    ((0x41, 0x69, 0xE1), "Royal Blue"),
-    ((0x41, 0xAA, 0x78), "Ocean Green"),
-    ((0x42, 0x03, 0x03), "Burnt Maroon"),
-    ((0x42, 0x39, 0x21), "Lisbon Brown"),
-    ((0x42, 0x79, 0x77), "Faded Jade"),
-    ((0x43, 0x15, 0x60), "Scarlet Gum"),
-    ((0x43, 0x31, 0x20), "Iroko"),
-    ((0x43, 0x3E, 0x37), "Armadillo"),
-    ((0x43, 0x4C, 0x59), "River Bed"),
-    ((0x43, 0x6A, 0x0D), "Green Leaf"),
-    ((0x44, 0x01, 0x2D), "Barossa"),
-    ((0x44, 0x1D, 0x00), "Morocco Brown"),
-    ((0x44, 0x49, 0x54), "Mako"),
-    ((0x45, 0x49, 0x36), "Kelp"),
-    ((0x45, 0x6C, 0xAC), "San Marino"),
-    ((0x45, 0xB1, 0xE8), "Picton Blue"),
-    ((0x46, 0x0B, 0x41), "Loulou"),
-    ((0x46, 0x24, 0x25), "Crater Brown"),
-    ((0x46, 0x59, 0x45), "Gray Asparagus"),
-    ((0x46, 0x82, 0xB4), "Steel Blue"),
-    ((0x48, 0x04, 0x04), "Rustic Red"),
-    ((0x48, 0x06, 0x07), "Bulgarian Rose"),
-    ((0x48, 0x06, 0x56), "Clairvoyant"),
-    ((0x48, 0x1C, 0x1C), "Cocoa Bean"),
-    ((0x48, 0x31, 0x31), "Woody Brown"),
-    ((0x48, 0x3C, 0x32), "Taupe"),
-    ((0x49, 0x17, 0x0C), "Van Cleef"),
-    ((0x49, 0x26, 0x15), "Brown Derby"),
-    ((0x49, 0x37, 0x1B), "Metallic Bronze"),
-    ((0x49, 0x54, 0x00), "Verdun Green"),
-    ((0x49, 0x66, 0x79), "Blue Bayoux"),
-    ((0x49, 0x71, 0x83), "Bismark"),
-    ((0x4A, 0x2A, 0x04), "Bracken"),
-    ((0x4A, 0x30, 0x04), "Deep Bronze"),
-    ((0x4A, 0x3C, 0x30), "Mondo"),
-    ((0x4A, 0x42, 0x44), "Tundora"),
-    ((0x4A, 0x44, 0x4B), "Gravel"),
-    ((0x4A, 0x4E, 0x5A), "Trout"),
-    ((0x4B, 0x00, 0x82), "Pigment Indigo"),
-    ((0x4B, 0x5D, 0x52), "Nandor"),
-    ((0x4C, 0x30, 0x24), "Saddle"),
-    ((0x4C, 0x4F, 0x56), "Abbey"),
-    ((0x4D, 0x01, 0x35), "Blackberry"),
-    ((0x4D, 0x0A, 0x18), "Cab Sav"),
-    ((0x4D, 0x1E, 0x01), "Indian Tan"),
-    ((0x4D, 0x28, 0x2D), "Cowboy"),
-    ((0x4D, 0x28, 0x2E), "Livid Brown"),
-    ((0x4D, 0x38, 0x33), "Rock"),
-    ((0x4D, 0x3D, 0x14), "Punga"),
-    ((0x4D, 0x40, 0x0F), "Bronzetone"),
-    ((0x4D, 0x53, 0x28), "Woodland"),
-    ((0x4E, 0x06, 0x06), "Mahogany"),
-    ((0x4E, 0x2A, 0x5A), "Bossanova"),
-    ((0x4E, 0x3B, 0x41), "Matterhorn"),
-    ((0x4E, 0x42, 0x0C), "Bronze Olive"),
-    ((0x4E, 0x45, 0x62), "Mulled Wine"),
-    ((0x4E, 0x66, 0x49), "Axolotl"),
-    ((0x4E, 0x7F, 0x9E), "Wedgewood"),
-    ((0x4E, 0xAB, 0xD1), "Shakespeare"),
-    ((0x4F, 0x1C, 0x70), "Honey Flower"),
-    ((0x4F, 0x23, 0x98), "Daisy Bush"),
-    ((0x4F, 0x69, 0xC6), "Indigo"),
-    ((0x4F, 0x79, 0x42), "Fern Green"),
-    ((0x4F, 0x9D, 0x5D), "Fruit Salad"),
-    ((0x4F, 0xA8, 0x3D), "Apple"),
-    ((0x50, 0x43, 0x51), "Mortar"),
-    ((0x50, 0x70, 0x96), "Kashmir Blue"),
-    ((0x50, 0x76, 0x72), "Cutty Sark"),
-    ((0x50, 0xC8, 0x78), "Emerald"),
-    ((0x51, 0x46, 0x49), "Emperor"),
-    ((0x51, 0x6E, 0x3D), "Chalet Green"),
-    ((0x51, 0x7C, 0x66), "Como"),
-    ((0x51, 0x80, 0x8F), "Smalt Blue"),
-    ((0x52, 0x00, 0x1F), "Castro"),
-    ((0x52, 0x0C, 0x17), "Maroon Oak"),
-    ((0x52, 0x3C, 0x94), "Gigas"),
-    ((0x53, 0x34, 0x55), "Voodoo"),
-    ((0x53, 0x44, 0x91), "Victoria"),
-    ((0x53, 0x82, 0x4B), "Hippie Green"),
-    ((0x54, 0x10, 0x12), "Heath"),
-    ((0x54, 0x43, 0x33), "Judge Gray"),
-    ((0x54, 0x53, 0x4D), "Fuscous Gray"),
-    ((0x54, 0x90, 0x19), "Vida Loca"),
-    ((0x55, 0x28, 0x0C), "Cioccolato"),
-    ((0x55, 0x5B, 0x10), "Saratoga"),
-    ((0x55, 0x6D, 0x56), "Finlandia"),
-    ((0x55, 0x90, 0xD9), "Havelock Blue"),
-    ((0x56, 0xB4, 0xBE), "Fountain Blue"),
-    ((0x57, 0x83, 0x63), "Spring Leaves"),
-    ((0x58, 0x34, 0x01), "Saddle Brown"),
-    ((0x58, 0x55, 0x62), "Scarpa Flow"),
-    ((0x58, 0x71, 0x56), "Cactus"),
-    ((0x58, 0x9A, 0xAF), "Hippie Blue"),
-    ((0x59, 0x1D, 0x35), "Wine Berry"),
-    ((0x59, 0x28, 0x04), "Brown Bramble"),
-    ((0x59, 0x37, 0x37), "Congo Brown"),
-    ((0x59, 0x44, 0x33), "Millbrook"),
-    ((0x5A, 0x6E, 0x9C), "Waikawa Gray"),
-    ((0x5A, 0x87, 0xA0), "Horizon"),
-    ((0x5B, 0x30, 0x13), "Jambalaya"),
-    ((0x5C, 0x01, 0x20), "Bordeaux"),
-    ((0x5C, 0x05, 0x36), "Mulberry Wood"),
-    ((0x5C, 0x2E, 0x01), "Carnaby Tan"),
-    ((0x5C, 0x5D, 0x75), "Comet"),
-    ((0x5D, 0x1E, 0x0F), "Redwood"),
-    ((0x5D, 0x4C, 0x51), "Don Juan"),
-    ((0x5D, 0x5C, 0x58), "Chicago"),
-    ((0x5D, 0x5E, 0x37), "Verdigris"),
-    ((0x5D, 0x77, 0x47), "Dingley"),
-    ((0x5D, 0xA1, 0x9F), "Breaker Bay"),
-    ((0x5E, 0x48, 0x3E), "Kabul"),
-    ((0x5E, 0x5D, 0x3B), "Hemlock"),
-    ((0x5F, 0x3D, 0x26), "Irish Coffee"),
-    ((0x5F, 0x5F, 0x6E), "Mid Gray"),
-    ((0x5F, 0x66, 0x72), "Shuttle Gray"),
-    ((0x5F, 0xA7, 0x77), "Aqua Forest"),
-    ((0x5F, 0xB3, 0xAC), "Tradewind"),
-    ((0x60, 0x49, 0x13), "Horses Neck"),
-    ((0x60, 0x5B, 0x73), "Smoky"),
-    ((0x60, 0x6E, 0x68), "Corduroy"),
-    ((0x60, 0x93, 0xD1), "Danube"),
-    ((0x61, 0x27, 0x18), "Espresso"),
-    ((0x61, 0x40, 0x51), "Eggplant"),
-    ((0x61, 0x5D, 0x30), "Costa Del Sol"),
-    ((0x61, 0x84, 0x5F), "Glade Green"),
-    ((0x62, 0x2F, 0x30), "Buccaneer"),
-    ((0x62, 0x3F, 0x2D), "Quincy"),
-    ((0x62, 0x4E, 0x9A), "Butterfly Bush"),
-    ((0x62, 0x51, 0x19), "West Coast"),
-    ((0x62, 0x66, 0x49), "Finch"),
-    ((0x63, 0x9A, 0x8F), "Patina"),
-    ((0x63, 0xB7, 0x6C), "Fern"),
-    ((0x64, 0x56, 0xB7), "Blue Violet"),
-    ((0x64, 0x60, 0x77), "Dolphin"),
-    ((0x64, 0x64, 0x63), "Storm Dust"),
-    ((0x64, 0x6A, 0x54), "Siam"),
-    ((0x64, 0x6E, 0x75), "Nevada"),
-    ((0x64, 0x95, 0xED), "Cornflower Blue"),
-    ((0x64, 0xCC, 0xDB), "Viking"),
-    ((0x65, 0x00, 0x0B), "Rosewood"),
-    ((0x65, 0x1A, 0x14), "Cherrywood"),
-    ((0x65, 0x2D, 0xC1), "Purple Heart"),
-    ((0x65, 0x72, 0x20), "Fern Frond"),
-    ((0x65, 0x74, 0x5D), "Willow Grove"),
-    ((0x65, 0x86, 0x9F), "Hoki"),
-    ((0x66, 0x00, 0x45), "Pompadour"),
-    ((0x66, 0x00, 0x99), "Purple"),
-    ((0x66, 0x02, 0x3C), "Tyrian Purple"),
-    ((0x66, 0x10, 0x10), "Dark Tan"),
-    ((0x66, 0xB5, 0x8F), "Silver Tree"),
-    ((0x66, 0xFF, 0x00), "Bright Green"),
-    ((0x66, 0xFF, 0x66), "Screamin' Green"),
-    ((0x67, 0x03, 0x2D), "Black Rose"),
-    ((0x67, 0x5F, 0xA6), "Scampi"),
-    ((0x67, 0x66, 0x62), "Ironside Gray"),
-    ((0x67, 0x89, 0x75), "Viridian Green"),
-    ((0x67, 0xA7, 0x12), "Christi"),
-    ((0x68, 0x36, 0x00), "Nutmeg Wood Finish"),
-    ((0x68, 0x55, 0x58), "Zambezi"),
-    ((0x68, 0x5E, 0x6E), "Salt Box"),
-    ((0x69, 0x25, 0x45), "Tawny Port"),
-    ((0x69, 0x2D, 0x54), "Finn"),
-    ((0x69, 0x5F, 0x62), "Scorpion"),
-    ((0x69, 0x7E, 0x9A), "Lynch"),
-    ((0x6A, 0x44, 0x2E), "Spice"),
-    ((0x6A, 0x5D, 0x1B), "Himalaya"),
-    ((0x6A, 0x60, 0x51), "Soya Bean"),
-    ((0x6B, 0x2A, 0x14), "Hairy Heath"),
-    ((0x6B, 0x3F, 0xA0), "Royal Purple"),
-    ((0x6B, 0x4E, 0x31), "Shingle Fawn"),
-    ((0x6B, 0x57, 0x55), "Dorado"),
-    ((0x6B, 0x8B, 0xA2), "Bermuda Gray"),
-    ((0x6B, 0x8E, 0x23), "Olive Drab"),
-    ((0x6C, 0x30, 0x82), "Eminence"),
-    ((0x6C, 0xDA, 0xE7), "Turquoise Blue"),
-    ((0x6D, 0x01, 0x01), "Lonestar"),
-    ((0x6D, 0x5E, 0x54), "Pine Cone"),
-    ((0x6D, 0x6C, 0x6C), "Dove Gray"),
-    ((0x6D, 0x92, 0x92), "Juniper"),
-    ((0x6D, 0x92, 0xA1), "Gothic"),
-    ((0x6E, 0x09, 0x02), "Red Oxide"),
-    ((0x6E, 0x1D, 0x14), "Moccaccino"),
-    ((0x6E, 0x48, 0x26), "Pickled Bean"),
-    ((0x6E, 0x4B, 0x26), "Dallas"),
-    ((0x6E, 0x6D, 0x57), "Kokoda"),
-    ((0x6E, 0x77, 0x83), "Pale Sky"),
-    ((0x6F, 0x44, 0x0C), "Cafe Royale"),
-    ((0x6F, 0x6A, 0x61), "Flint"),
-    ((0x6F, 0x8E, 0x63), "Highland"),
-    ((0x6F, 0x9D, 0x02), "Limeade"),
-    ((0x6F, 0xD0, 0xC5), "Downy"),
-    ((0x70, 0x1C, 0x1C), "Persian Plum"),
-    ((0x70, 0x42, 0x14), "Sepia"),
-    ((0x70, 0x4A, 0x07), "Antique Bronze"),
-    ((0x70, 0x4F, 0x50), "Ferra"),
-    ((0x70, 0x65, 0x55), "Coffee"),
-    ((0x70, 0x80, 0x90), "Slate Gray"),
-    ((0x71, 0x1A, 0x00), "Cedar Wood Finish"),
-    ((0x71, 0x29, 0x1D), "Metallic Copper"),
-    ((0x71, 0x46, 0x93), "Affair"),
-    ((0x71, 0x4A, 0xB2), "Studio"),
-    ((0x71, 0x5D, 0x47), "Tobacco Brown"),
-    ((0x71, 0x63, 0x38), "Yellow Metal"),
-    ((0x71, 0x6B, 0x56), "Peat"),
-    ((0x71, 0x6E, 0x10), "Olivetone"),
-    ((0x71, 0x74, 0x86), "Storm Gray"),
-    ((0x71, 0x80, 0x80), "Sirocco"),
-    ((0x71, 0xD9, 0xE2), "Aquamarine Blue"),
-    ((0x72, 0x01, 0x0F), "Venetian Red"),
-    ((0x72, 0x4A, 0x2F), "Old Copper"),
-    ((0x72, 0x6D, 0x4E), "Go Ben"),
-    ((0x72, 0x7B, 0x89), "Raven"),
-    ((0x73, 0x1E, 0x8F), "Seance"),
-    ((0x73, 0x4A, 0x12), "Raw Umber"),
-    ((0x73, 0x6C, 0x9F), "Kimberly"),
-    ((0x73, 0x6D, 0x58), "Crocodile"),
-    ((0x73, 0x78, 0x29), "Crete"),
-    ((0x73, 0x86, 0x78), "Xanadu"),
-    ((0x74, 0x64, 0x0D), "Spicy Mustard"),
-    ((0x74, 0x7D, 0x63), "Limed Ash"),
-    ((0x74, 0x7D, 0x83), "Rolling Stone"),
-    ((0x74, 0x88, 0x81), "Blue Smoke"),
-    ((0x74, 0x93, 0x78), "Laurel"),
-    ((0x74, 0xC3, 0x65), "Mantis"),
-    ((0x75, 0x5A, 0x57), "Russett"),
-    ((0x75, 0x63, 0xA8), "Deluge"),
-    ((0x76, 0x39, 0x5D), "Cosmic"),
-    ((0x76, 0x66, 0xC6), "Blue Marguerite"),
-    ((0x76, 0xBD, 0x17), "Lima"),
-    ((0x76, 0xD7, 0xEA), "Sky Blue"),
-    ((0x77, 0x0F, 0x05), "Dark Burgundy"),
-    ((0x77, 0x1F, 0x1F), "Crown of Thorns"),
-    ((0x77, 0x3F, 0x1A), "Walnut"),
-    ((0x77, 0x6F, 0x61), "Pablo"),
-    ((0x77, 0x81, 0x20), "Pacifika"),
-    ((0x77, 0x9E, 0x86), "Oxley"),
-    ((0x77, 0xDD, 0x77), "Pastel Green"),
-    ((0x78, 0x01, 0x09), "Japanese Maple"),
-    ((0x78, 0x2D, 0x19), "Mocha"),
-    ((0x78, 0x2F, 0x16), "Peanut"),
-    ((0x78, 0x86, 0x6B), "Camouflage Green"),
-    ((0x78, 0x8A, 0x25), "Wasabi"),
-    ((0x78, 0x8B, 0xBA), "Ship Cove"),
-    ((0x78, 0xA3, 0x9C), "Sea Nymph"),
-    ((0x79, 0x5D, 0x4C), "Roman Coffee"),
-    ((0x79, 0x68, 0x78), "Old Lavender"),
-    ((0x79, 0x69, 0x89), "Rum"),
-    ((0x79, 0x6A, 0x78), "Fedora"),
-    ((0x79, 0x6D, 0x62), "Sandstone"),
-    ((0x79, 0xDE, 0xEC), "Spray"),
-    ((0x7A, 0x01, 0x3A), "Siren"),
-    ((0x7A, 0x58, 0xC1), "Fuchsia Blue"),
-    ((0x7A, 0x7A, 0x7A), "Boulder"),
-    ((0x7A, 0x89, 0xB8), "Wild Blue Yonder"),
-    ((0x7A, 0xC4, 0x88), "De York"),
-    ((0x7B, 0x38, 0x01), "Red Beech"),
-    ((0x7B, 0x3F, 0x00), "Cinnamon"),
-    ((0x7B, 0x66, 0x08), "Yukon Gold"),
-    ((0x7B, 0x78, 0x74), "Tapa"),
-    ((0x7B, 0x7C, 0x94), "Waterloo "),
-    ((0x7B, 0x82, 0x65), "Flax Smoke"),
-    ((0x7B, 0x9F, 0x80), "Amulet"),
-    ((0x7B, 0xA0, 0x5B), "Asparagus"),
-    ((0x7C, 0x1C, 0x05), "Kenyan Copper"),
-    ((0x7C, 0x76, 0x31), "Pesto"),
-    ((0x7C, 0x77, 0x8A), "Topaz"),
-    ((0x7C, 0x7B, 0x7A), "Concord"),
-    ((0x7C, 0x7B, 0x82), "Jumbo"),
-    ((0x7C, 0x88, 0x1A), "Trendy Green"),
-    ((0x7C, 0xA1, 0xA6), "Gumbo"),
-    ((0x7C, 0xB0, 0xA1), "Acapulco"),
-    ((0x7C, 0xB7, 0xBB), "Neptune"),
-    ((0x7D, 0x2C, 0x14), "Pueblo"),
-    ((0x7D, 0xA9, 0x8D), "Bay Leaf"),
-    ((0x7D, 0xC8, 0xF7), "Malibu"),
-    ((0x7D, 0xD8, 0xC6), "Bermuda"),
-    ((0x7E, 0x3A, 0x15), "Copper Canyon"),
-    ((0x7F, 0x17, 0x34), "Claret"),
-    ((0x7F, 0x3A, 0x02), "Peru Tan"),
-    ((0x7F, 0x62, 0x6D), "Falcon"),
-    ((0x7F, 0x75, 0x89), "Mobster"),
-    ((0x7F, 0x76, 0xD3), "Moody Blue"),
-    ((0x7F, 0xFF, 0x00), "Chartreuse"),
-    ((0x7F, 0xFF, 0xD4), "Aquamarine"),
-    ((0x80, 0x00, 0x00), "Maroon"),
-    ((0x80, 0x0B, 0x47), "Rose Bud Cherry"),
-    ((0x80, 0x18, 0x18), "Falu Red"),
-    ((0x80, 0x34, 0x1F), "Red Robin"),
-    ((0x80, 0x37, 0x90), "Vivid Violet"),
-    ((0x80, 0x46, 0x1B), "Russet"),
-    ((0x80, 0x7E, 0x79), "Friar Gray"),
-    ((0x80, 0x80, 0x00), "Olive"),
-    ((0x80, 0x80, 0x80), "Gray"),
-    ((0x80, 0xB3, 0xAE), "Gulf Stream"),
-    ((0x80, 0xB3, 0xC4), "Glacier"),
-    ((0x80, 0xCC, 0xEA), "Seagull"),
-    ((0x81, 0x42, 0x2C), "Nutmeg"),
-    ((0x81, 0x6E, 0x71), "Spicy Pink"),
-    ((0x81, 0x73, 0x77), "Empress"),
-    ((0x81, 0x98, 0x85), "Spanish Green"),
-    ((0x82, 0x6F, 0x65), "Sand Dune"),
-    ((0x82, 0x86, 0x85), "Gunsmoke"),
-    ((0x82, 0x8F, 0x72), "Battleship Gray"),
-    ((0x83, 0x19, 0x23), "Merlot"),
-    ((0x83, 0x70, 0x50), "Shadow"),
-    ((0x83, 0xAA, 0x5D), "Chelsea Cucumber"),
-    ((0x83, 0xD0, 0xC6), "Monte Carlo"),
-    ((0x84, 0x31, 0x79), "Plum"),
-    ((0x84, 0xA0, 0xA0), "Granny Smith"),
-    ((0x85, 0x81, 0xD9), "Chetwode Blue"),
-    ((0x85, 0x84, 0x70), "Bandicoot"),
-    ((0x85, 0x9F, 0xAF), "Bali Hai"),
-    ((0x85, 0xC4, 0xCC), "Half Baked"),
-    ((0x86, 0x01, 0x11), "Red Devil"),
-    ((0x86, 0x3C, 0x3C), "Lotus"),
-    ((0x86, 0x48, 0x3C), "Ironstone"),
-    ((0x86, 0x4D, 0x1E), "Bull Shot"),
-    ((0x86, 0x56, 0x0A), "Rusty Nail"),
-    ((0x86, 0x89, 0x74), "Bitter"),
-    ((0x86, 0x94, 0x9F), "Regent Gray"),
-    ((0x87, 0x15, 0x50), "Disco"),
-    ((0x87, 0x75, 0x6E), "Americano"),
-    ((0x87, 0x7C, 0x7B), "Hurricane"),
-    ((0x87, 0x8D, 0x91), "Oslo Gray"),
-    ((0x87, 0xAB, 0x39), "Sushi"),
-    ((0x88, 0x53, 0x42), "Spicy Mix"),
-    ((0x88, 0x62, 0x21), "Kumera"),
-    ((0x88, 0x83, 0x87), "Suva Gray"),
-    ((0x88, 0x8D, 0x65), "Avocado"),
-    ((0x89, 0x34, 0x56), "Camelot"),
-    ((0x89, 0x38, 0x43), "Solid Pink"),
-    ((0x89, 0x43, 0x67), "Cannon Pink"),
-    ((0x89, 0x7D, 0x6D), "Makara"),
-    ((0x8A, 0x33, 0x24), "Burnt Umber"),
-    ((0x8A, 0x73, 0xD6), "True V"),
-    ((0x8A, 0x83, 0x60), "Clay Creek"),
-    ((0x8A, 0x83, 0x89), "Monsoon"),
-    ((0x8A, 0x8F, 0x8A), "Stack"),
-    ((0x8A, 0xB9, 0xF1), "Jordy Blue"),
-    ((0x8B, 0x00, 0xFF), "Electric Violet"),
-    ((0x8B, 0x07, 0x23), "Monarch"),
-    ((0x8B, 0x6B, 0x0B), "Corn Harvest"),
-    ((0x8B, 0x84, 0x70), "Olive Haze"),
-    ((0x8B, 0x84, 0x7E), "Schooner"),
-    ((0x8B, 0x86, 0x80), "Natural Gray"),
-    ((0x8B, 0x9C, 0x90), "Mantle"),
-    ((0x8B, 0x9F, 0xEE), "Portage"),
-    ((0x8B, 0xA6, 0x90), "Envy"),
-    ((0x8B, 0xA9, 0xA5), "Cascade"),
-    ((0x8B, 0xE6, 0xD8), "Riptide"),
-    ((0x8C, 0x05, 0x5E), "Cardinal Pink"),
-    ((0x8C, 0x47, 0x2F), "Mule Fawn"),
-    ((0x8C, 0x57, 0x38), "Potters Clay"),
-    ((0x8C, 0x64, 0x95), "Trendy Pink"),
-    ((0x8D, 0x02, 0x26), "Paprika"),
-    ((0x8D, 0x3D, 0x38), "Sanguine Brown"),
-    ((0x8D, 0x3F, 0x3F), "Tosca"),
-    ((0x8D, 0x76, 0x62), "Cement"),
-    ((0x8D, 0x89, 0x74), "Granite Green"),
-    ((0x8D, 0x90, 0xA1), "Manatee"),
-    ((0x8D, 0xA8, 0xCC), "Polo Blue"),
-    ((0x8E, 0x00, 0x00), "Red Berry"),
-    ((0x8E, 0x4D, 0x1E), "Rope"),
-    ((0x8E, 0x6F, 0x70), "Opium"),
-    ((0x8E, 0x77, 0x5E), "Domino"),
-    ((0x8E, 0x81, 0x90), "Mamba"),
-    ((0x8E, 0xAB, 0xC1), "Nepal"),
-    ((0x8F, 0x02, 0x1C), "Pohutukawa"),
-    ((0x8F, 0x3E, 0x33), "El Salva"),
-    ((0x8F, 0x4B, 0x0E), "Korma"),
-    ((0x8F, 0x81, 0x76), "Squirrel"),
-    ((0x8F, 0xD6, 0xB4), "Vista Blue"),
-    ((0x90, 0x00, 0x20), "Burgundy"),
-    ((0x90, 0x1E, 0x1E), "Old Brick"),
-    ((0x90, 0x78, 0x74), "Hemp"),
-    ((0x90, 0x7B, 0x71), "Almond Frost"),
-    ((0x90, 0x8D, 0x39), "Sycamore"),
-    ((0x92, 0x00, 0x0A), "Sangria"),
-    ((0x92, 0x43, 0x21), "Cumin"),
-    ((0x92, 0x6F, 0x5B), "Beaver"),
-    ((0x92, 0x85, 0x73), "Stonewall"),
-    ((0x92, 0x85, 0x90), "Venus"),
-    ((0x93, 0x70, 0xDB), "Medium Purple"),
-    ((0x93, 0xCC, 0xEA), "Cornflower"),
-    ((0x93, 0xDF, 0xB8), "Algae Green"),
-    ((0x94, 0x47, 0x47), "Copper Rust"),
-    ((0x94, 0x87, 0x71), "Arrowtown"),
-    ((0x95, 0x00, 0x15), "Scarlett"),
-    ((0x95, 0x63, 0x87), "Strikemaster"),
-    ((0x95, 0x93, 0x96), "Mountain Mist"),
-    ((0x96, 0x00, 0x18), "Carmine"),
-    ((0x96, 0x4B, 0x00), "Brown"),
-    ((0x96, 0x70, 0x59), "Leather"),
-    ((0x96, 0x78, 0xB6), "Purple Mountain's Majesty"),
-    ((0x96, 0x7B, 0xB6), "Lavender Purple"),
-    ((0x96, 0xA8, 0xA1), "Pewter"),
-    ((0x96, 0xBB, 0xAB), "Summer Green"),
-    ((0x97, 0x60, 0x5D), "Au Chico"),
-    ((0x97, 0x71, 0xB5), "Wisteria"),
-    ((0x97, 0xCD, 0x2D), "Atlantis"),
-    ((0x98, 0x3D, 0x61), "Vin Rouge"),
-    ((0x98, 0x74, 0xD3), "Lilac Bush"),
-    ((0x98, 0x77, 0x7B), "Bazaar"),
-    ((0x98, 0x81, 0x1B), "Hacienda"),
-    ((0x98, 0x8D, 0x77), "Pale Oyster"),
-    ((0x98, 0xFF, 0x98), "Mint Green"),
-    ((0x99, 0x00, 0x66), "Fresh Eggplant"),
-    ((0x99, 0x11, 0x99), "Violet Eggplant"),
-    ((0x99, 0x16, 0x13), "Tamarillo"),
-    ((0x99, 0x1B, 0x07), "Totem Pole"),
-    ((0x99, 0x66, 0x66), "Copper Rose"),
-    ((0x99, 0x66, 0xCC), "Amethyst"),
-    ((0x99, 0x7A, 0x8D), "Mountbatten Pink"),
-    ((0x99, 0x99, 0xCC), "Blue Bell"),
-    ((0x9A, 0x38, 0x20), "Prairie Sand"),
-    ((0x9A, 0x6E, 0x61), "Toast"),
-    ((0x9A, 0x95, 0x77), "Gurkha"),
-    ((0x9A, 0xB9, 0x73), "Olivine"),
-    ((0x9A, 0xC2, 0xB8), "Shadow Green"),
-    ((0x9B, 0x47, 0x03), "Oregon"),
-    ((0x9B, 0x9E, 0x8F), "Lemon Grass"),
-    ((0x9C, 0x33, 0x36), "Stiletto"),
-    ((0x9D, 0x56, 0x16), "Hawaiian Tan"),
-    ((0x9D, 0xAC, 0xB7), "Gull Gray"),
-    ((0x9D, 0xC2, 0x09), "Pistachio"),
-    ((0x9D, 0xE0, 0x93), "Granny Smith Apple"),
-    ((0x9D, 0xE5, 0xFF), "Anakiwa"),
-    ((0x9E, 0x53, 0x02), "Chelsea Gem"),
-    ((0x9E, 0x5B, 0x40), "Sepia Skin"),
-    ((0x9E, 0xA5, 0x87), "Sage"),
-    ((0x9E, 0xA9, 0x1F), "Citron"),
-    ((0x9E, 0xB1, 0xCD), "Rock Blue"),
-    ((0x9E, 0xDE, 0xE0), "Morning Glory"),
-    ((0x9F, 0x38, 0x1D), "Cognac"),
-    ((0x9F, 0x82, 0x1C), "Reef Gold"),
-    ((0x9F, 0x9F, 0x9C), "Star Dust"),
-    ((0x9F, 0xA0, 0xB1), "Santas Gray"),
-    ((0x9F, 0xD7, 0xD3), "Sinbad"),
-    ((0x9F, 0xDD, 0x8C), "Feijoa"),
-    ((0xA0, 0x27, 0x12), "Tabasco"),
-    ((0xA1, 0x75, 0x0D), "Buttered Rum"),
-    ((0xA1, 0xAD, 0xB5), "Hit Gray"),
-    ((0xA1, 0xC5, 0x0A), "Citrus"),
-    ((0xA1, 0xDA, 0xD7), "Aqua Island"),
-    ((0xA1, 0xE9, 0xDE), "Water Leaf"),
-    ((0xA2, 0x00, 0x6D), "Flirt"),
-    ((0xA2, 0x3B, 0x6C), "Rouge"),
-    ((0xA2, 0x66, 0x45), "Cape Palliser"),
-    ((0xA2, 0xAA, 0xB3), "Gray Chateau"),
-    ((0xA2, 0xAE, 0xAB), "Edward"),
-    ((0xA3, 0x80, 0x7B), "Pharlap"),
-    ((0xA3, 0x97, 0xB4), "Amethyst Smoke"),
-    ((0xA3, 0xE3, 0xED), "Blizzard Blue"),
-    ((0xA4, 0xA4, 0x9D), "Delta"),
-    ((0xA4, 0xA6, 0xD3), "Wistful"),
-    ((0xA4, 0xAF, 0x6E), "Green Smoke"),
-    ((0xA5, 0x0B, 0x5E), "Jazzberry Jam"),
-    ((0xA5, 0x9B, 0x91), "Zorba"),
-    ((0xA5, 0xCB, 0x0C), "Bahia"),
-    ((0xA6, 0x2F, 0x20), "Roof Terracotta"),
-    ((0xA6, 0x55, 0x29), "Paarl"),
-    ((0xA6, 0x8B, 0x5B), "Barley Corn"),
-    ((0xA6, 0x92, 0x79), "Donkey Brown"),
-    ((0xA6, 0xA2, 0x9A), "Dawn"),
-    ((0xA7, 0x25, 0x25), "Mexican Red"),
-    ((0xA7, 0x88, 0x2C), "Luxor Gold"),
-    ((0xA8, 0x53, 0x07), "Rich Gold"),
-    ((0xA8, 0x65, 0x15), "Reno Sand"),
-    ((0xA8, 0x6B, 0x6B), "Coral Tree"),
-    ((0xA8, 0x98, 0x9B), "Dusty Gray"),
-    ((0xA8, 0x99, 0xE6), "Dull Lavender"),
-    ((0xA8, 0xA5, 0x89), "Tallow"),
-    ((0xA8, 0xAE, 0x9C), "Bud"),
-    ((0xA8, 0xAF, 0x8E), "Locust"),
-    ((0xA8, 0xBD, 0x9F), "Norway"),
-    ((0xA8, 0xE3, 0xBD), "Chinook"),
-    ((0xA9, 0xA4, 0x91), "Gray Olive"),
-    ((0xA9, 0xAC, 0xB6), "Aluminium"),
-    ((0xA9, 0xB2, 0xC3), "Cadet Blue"),
-    ((0xA9, 0xB4, 0x97), "Schist"),
-    ((0xA9, 0xBD, 0xBF), "Tower Gray"),
-    ((0xA9, 0xBE, 0xF2), "Perano"),
-    ((0xA9, 0xC6, 0xC2), "Opal"),
-    ((0xAA, 0x37, 0x5A), "Night Shadz"),
-    ((0xAA, 0x42, 0x03), "Fire"),
-    ((0xAA, 0x8B, 0x5B), "Muesli"),
-    ((0xAA, 0x8D, 0x6F), "Sandal"),
-    ((0xAA, 0xA5, 0xA9), "Shady Lady"),
-    ((0xAA, 0xA9, 0xCD), "Logan"),
-    ((0xAA, 0xAB, 0xB7), "Spun Pearl"),
-    ((0xAA, 0xD6, 0xE6), "Regent St Blue"),
-    ((0xAA, 0xF0, 0xD1), "Magic Mint"),
-    ((0xAB, 0x05, 0x63), "Lipstick"),
-    ((0xAB, 0x34, 0x72), "Royal Heath"),
-    ((0xAB, 0x91, 0x7A), "Sandrift"),
-    ((0xAB, 0xA0, 0xD9), "Cold Purple"),
-    ((0xAB, 0xA1, 0x96), "Bronco"),
-    ((0xAC, 0x8A, 0x56), "Limed Oak"),
-    ((0xAC, 0x91, 0xCE), "East Side"),
-    ((0xAC, 0x9E, 0x22), "Lemon Ginger"),
-    ((0xAC, 0xA4, 0x94), "Napa"),
-    ((0xAC, 0xA5, 0x86), "Hillary"),
-    ((0xAC, 0xA5, 0x9F), "Cloudy"),
-    ((0xAC, 0xAC, 0xAC), "Silver Chalice"),
-    ((0xAC, 0xB7, 0x8E), "Swamp Green"),
-    ((0xAC, 0xCB, 0xB1), "Spring Rain"),
-    ((0xAC, 0xDD, 0x4D), "Conifer"),
-    ((0xAC, 0xE1, 0xAF), "Celadon"),
-    ((0xAD, 0x78, 0x1B), "Mandalay"),
-    ((0xAD, 0xBE, 0xD1), "Casper"),
-    ((0xAD, 0xDF, 0xAD), "Moss Green"),
-    ((0xAD, 0xE6, 0xC4), "Padua"),
-    ((0xAD, 0xFF, 0x2F), "Green Yellow"),
-    ((0xAE, 0x45, 0x60), "Hippie Pink"),
-    ((0xAE, 0x60, 0x20), "Desert"),
-    ((0xAE, 0x80, 0x9E), "Bouquet"),
-    ((0xAF, 0x40, 0x35), "Medium Carmine"),
-    ((0xAF, 0x4D, 0x43), "Apple Blossom"),
-    ((0xAF, 0x59, 0x3E), "Brown Rust"),
-    ((0xAF, 0x87, 0x51), "Driftwood"),
-    ((0xAF, 0x8F, 0x2C), "Alpine"),
-    ((0xAF, 0x9F, 0x1C), "Lucky"),
-    ((0xAF, 0xA0, 0x9E), "Martini"),
-    ((0xAF, 0xB1, 0xB8), "Bombay"),
-    ((0xAF, 0xBD, 0xD9), "Pigeon Post"),
-    ((0xB0, 0x4C, 0x6A), "Cadillac"),
-    ((0xB0, 0x5D, 0x54), "Matrix"),
-    ((0xB0, 0x5E, 0x81), "Tapestry"),
-    ((0xB0, 0x66, 0x08), "Mai Tai"),
-    ((0xB0, 0x9A, 0x95), "Del Rio"),
-    ((0xB0, 0xE0, 0xE6), "Powder Blue"),
-    ((0xB0, 0xE3, 0x13), "Inch Worm"),
-    ((0xB1, 0x00, 0x00), "Bright Red"),
-    ((0xB1, 0x4A, 0x0B), "Vesuvius"),
-    ((0xB1, 0x61, 0x0B), "Pumpkin Skin"),
-    ((0xB1, 0x6D, 0x52), "Santa Fe"),
-    ((0xB1, 0x94, 0x61), "Teak"),
-    ((0xB1, 0xE2, 0xC1), "Fringy Flower"),
-    ((0xB1, 0xF4, 0xE7), "Ice Cold"),
-    ((0xB2, 0x09, 0x31), "Shiraz"),
-    ((0xB2, 0xA1, 0xEA), "Biloba Flower"),
-    ((0xB3, 0x2D, 0x29), "Tall Poppy"),
-    ((0xB3, 0x52, 0x13), "Fiery Orange"),
-    ((0xB3, 0x80, 0x07), "Hot Toddy"),
-    ((0xB3, 0xAF, 0x95), "Taupe Gray"),
-    ((0xB3, 0xC1, 0x10), "La Rioja"),
-    ((0xB4, 0x33, 0x32), "Well Read"),
-    ((0xB4, 0x46, 0x68), "Blush"),
-    ((0xB4, 0xCF, 0xD3), "Jungle Mist"),
-    ((0xB5, 0x72, 0x81), "Turkish Rose"),
-    ((0xB5, 0x7E, 0xDC), "Lavender"),
-    ((0xB5, 0xA2, 0x7F), "Mongoose"),
-    ((0xB5, 0xB3, 0x5C), "Olive Green"),
-    ((0xB5, 0xD2, 0xCE), "Jet Stream"),
-    ((0xB5, 0xEC, 0xDF), "Cruise"),
-    ((0xB6, 0x31, 0x6C), "Hibiscus"),
-    ((0xB6, 0x9D, 0x98), "Thatch"),
-    ((0xB6, 0xB0, 0x95), "Heathered Gray"),
-    ((0xB6, 0xBA, 0xA4), "Eagle"),
-    ((0xB6, 0xD1, 0xEA), "Spindle"),
-    ((0xB6, 0xD3, 0xBF), "Gum Leaf"),
-    ((0xB7, 0x41, 0x0E), "Rust"),
-    ((0xB7, 0x8E, 0x5C), "Muddy Waters"),
-    ((0xB7, 0xA2, 0x14), "Sahara"),
-    ((0xB7, 0xA4, 0x58), "Husk"),
-    ((0xB7, 0xB1, 0xB1), "Nobel"),
-    ((0xB7, 0xC3, 0xD0), "Heather"),
-    ((0xB7, 0xF0, 0xBE), "Madang"),
-    ((0xB8, 0x11, 0x04), "Milano Red"),
-    ((0xB8, 0x73, 0x33), "Copper"),
-    ((0xB8, 0xB5, 0x6A), "Gimblet"),
-    ((0xB8, 0xC1, 0xB1), "Green Spring"),
-    ((0xB8, 0xC2, 0x5D), "Celery"),
-    ((0xB8, 0xE0, 0xF9), "Sail"),
-    ((0xB9, 0x4E, 0x48), "Chestnut"),
-    ((0xB9, 0x51, 0x40), "Crail"),
-    ((0xB9, 0x8D, 0x28), "Marigold"),
-    ((0xB9, 0xC4, 0x6A), "Wild Willow"),
-    ((0xB9, 0xC8, 0xAC), "Rainee"),
-    ((0xBA, 0x01, 0x01), "Guardsman Red"),
-    ((0xBA, 0x45, 0x0C), "Rock Spray"),
-    ((0xBA, 0x6F, 0x1E), "Bourbon"),
-    ((0xBA, 0x7F, 0x03), "Pirate Gold"),
-    ((0xBA, 0xB1, 0xA2), "Nomad"),
-    ((0xBA, 0xC7, 0xC9), "Submarine"),
-    ((0xBA, 0xEE, 0xF9), "Charlotte"),
-    ((0xBB, 0x33, 0x85), "Medium Red Violet"),
-    ((0xBB, 0x89, 0x83), "Brandy Rose"),
-    ((0xBB, 0xD0, 0x09), "Rio Grande"),
-    ((0xBB, 0xD7, 0xC1), "Surf"),
-    ((0xBC, 0xC9, 0xC2), "Powder Ash"),
-    ((0xBD, 0x5E, 0x2E), "Tuscany"),
-    ((0xBD, 0x97, 0x8E), "Quicksand"),
-    ((0xBD, 0xB1, 0xA8), "Silk"),
-    ((0xBD, 0xB2, 0xA1), "Malta"),
-    ((0xBD, 0xB3, 0xC7), "Chatelle"),
-    ((0xBD, 0xBB, 0xD7), "Lavender Gray"),
-    ((0xBD, 0xBD, 0xC6), "French Gray"),
-    ((0xBD, 0xC8, 0xB3), "Clay Ash"),
-    ((0xBD, 0xC9, 0xCE), "Loblolly"),
-    ((0xBD, 0xED, 0xFD), "French Pass"),
-    ((0xBE, 0xA6, 0xC3), "London Hue"),
-    ((0xBE, 0xB5, 0xB7), "Pink Swan"),
-    ((0xBE, 0xDE, 0x0D), "Fuego"),
-    ((0xBF, 0x55, 0x00), "Rose of Sharon"),
-    ((0xBF, 0xB8, 0xB0), "Tide"),
-    ((0xBF, 0xBE, 0xD8), "Blue Haze"),
-    ((0xBF, 0xC1, 0xC2), "Silver Sand"),
-    ((0xBF, 0xC9, 0x21), "Key Lime Pie"),
-    ((0xBF, 0xDB, 0xE2), "Ziggurat"),
-    ((0xBF, 0xFF, 0x00), "Lime"),
-    ((0xC0, 0x2B, 0x18), "Thunderbird"),
-    ((0xC0, 0x47, 0x37), "Mojo"),
-    ((0xC0, 0x80, 0x81), "Old Rose"),
-    ((0xC0, 0xC0, 0xC0), "Silver"),
-    ((0xC0, 0xD3, 0xB9), "Pale Leaf"),
-    ((0xC0, 0xD8, 0xB6), "Pixie Green"),
-    ((0xC1, 0x44, 0x0E), "Tia Maria"),
-    ((0xC1, 0x54, 0xC1), "Fuchsia Pink"),
-    ((0xC1, 0xA0, 0x04), "Buddha Gold"),
-    ((0xC1, 0xB7, 0xA4), "Bison Hide"),
-    ((0xC1, 0xBA, 0xB0), "Tea"),
-    ((0xC1, 0xBE, 0xCD), "Gray Suit"),
-    ((0xC1, 0xD7, 0xB0), "Sprout"),
-    ((0xC1, 0xF0, 0x7C), "Sulu"),
-    ((0xC2, 0x6B, 0x03), "Indochine"),
-    ((0xC2, 0x95, 0x5D), "Twine"),
-    ((0xC2, 0xBD, 0xB6), "Cotton Seed"),
-    ((0xC2, 0xCA, 0xC4), "Pumice"),
-    ((0xC2, 0xE8, 0xE5), "Jagged Ice"),
-    ((0xC3, 0x21, 0x48), "Maroon Flush"),
-    ((0xC3, 0xB0, 0x91), "Indian Khaki"),
-    ((0xC3, 0xBF, 0xC1), "Pale Slate"),
-    ((0xC3, 0xC3, 0xBD), "Gray Nickel"),
-    ((0xC3, 0xCD, 0xE6), "Periwinkle Gray"),
-    ((0xC3, 0xD1, 0xD1), "Tiara"),
-    ((0xC3, 0xDD, 0xF9), "Tropical Blue"),
-    ((0xC4, 0x1E, 0x3A), "Cardinal"),
-    ((0xC4, 0x56, 0x55), "Fuzzy Wuzzy Brown"),
-    ((0xC4, 0x57, 0x19), "Orange Roughy"),
-    ((0xC4, 0xC4, 0xBC), "Mist Gray"),
-    ((0xC4, 0xD0, 0xB0), "Coriander"),
-    ((0xC4, 0xF4, 0xEB), "Mint Tulip"),
-    ((0xC5, 0x4B, 0x8C), "Mulberry"),
-    ((0xC5, 0x99, 0x22), "Nugget"),
-    ((0xC5, 0x99, 0x4B), "Tussock"),
-    ((0xC5, 0xDB, 0xCA), "Sea Mist"),
-    ((0xC5, 0xE1, 0x7A), "Yellow Green"),
-    ((0xC6, 0x2D, 0x42), "Brick Red"),
-    ((0xC6, 0x72, 0x6B), "Contessa"),
-    ((0xC6, 0x91, 0x91), "Oriental Pink"),
-    ((0xC6, 0xA8, 0x4B), "Roti"),
-    ((0xC6, 0xC3, 0xB5), "Ash"),
-    ((0xC6, 0xC8, 0xBD), "Kangaroo"),
-    ((0xC6, 0xE6, 0x10), "Las Palmas"),
-    ((0xC7, 0x03, 0x1E), "Monza"),
-    ((0xC7, 0x15, 0x85), "Red Violet"),
-    ((0xC7, 0xBC, 0xA2), "Coral Reef"),
-    ((0xC7, 0xC1, 0xFF), "Melrose"),
-    ((0xC7, 0xC4, 0xBF), "Cloud"),
-    ((0xC7, 0xC9, 0xD5), "Ghost"),
-    ((0xC7, 0xCD, 0x90), "Pine Glade"),
-    ((0xC7, 0xDD, 0xE5), "Botticelli"),
-    ((0xC8, 0x8A, 0x65), "Antique Brass"),
-    ((0xC8, 0xA2, 0xC8), "Lilac"),
-    ((0xC8, 0xA5, 0x28), "Hokey Pokey"),
-    ((0xC8, 0xAA, 0xBF), "Lily"),
-    ((0xC8, 0xB5, 0x68), "Laser"),
-    ((0xC8, 0xE3, 0xD7), "Edgewater"),
-    ((0xC9, 0x63, 0x23), "Piper"),
-    ((0xC9, 0x94, 0x15), "Pizza"),
-    ((0xC9, 0xA0, 0xDC), "Light Wisteria"),
-    ((0xC9, 0xB2, 0x9B), "Rodeo Dust"),
-    ((0xC9, 0xB3, 0x5B), "Sundance"),
-    ((0xC9, 0xB9, 0x3B), "Earls Green"),
-    ((0xC9, 0xC0, 0xBB), "Silver Rust"),
-    ((0xC9, 0xD9, 0xD2), "Conch"),
-    ((0xC9, 0xFF, 0xA2), "Reef"),
-    ((0xC9, 0xFF, 0xE5), "Aero Blue"),
-    ((0xCA, 0x34, 0x35), "Flush Mahogany"),
-    ((0xCA, 0xBB, 0x48), "Turmeric"),
-    ((0xCA, 0xDC, 0xD4), "Paris White"),
-    ((0xCA, 0xE0, 0x0D), "Bitter Lemon"),
-    ((0xCA, 0xE6, 0xDA), "Skeptic"),
-    ((0xCB, 0x8F, 0xA9), "Viola"),
-    ((0xCB, 0xCA, 0xB6), "Foggy Gray"),
-    ((0xCB, 0xD3, 0xB0), "Green Mist"),
-    ((0xCB, 0xDB, 0xD6), "Nebula"),
-    ((0xCC, 0x33, 0x33), "Persian Red"),
-    ((0xCC, 0x55, 0x00), "Burnt Orange"),
-    ((0xCC, 0x77, 0x22), "Ochre"),
-    ((0xCC, 0x88, 0x99), "Puce"),
-    ((0xCC, 0xCA, 0xA8), "Thistle Green"),
-    ((0xCC, 0xCC, 0xFF), "Periwinkle"),
-    ((0xCC, 0xFF, 0x00), "Electric Lime"),
-    ((0xCD, 0x57, 0x00), "Tenn"),
-    ((0xCD, 0x5C, 0x5C), "Chestnut Rose"),
-    ((0xCD, 0x84, 0x29), "Brandy Punch"),
-    ((0xCD, 0xF4, 0xFF), "Onahau"),
-    ((0xCE, 0xB9, 0x8F), "Sorrell Brown"),
-    ((0xCE, 0xBA, 0xBA), "Cold Turkey"),
-    ((0xCE, 0xC2, 0x91), "Yuma"),
-    ((0xCE, 0xC7, 0xA7), "Chino"),
-    ((0xCF, 0xA3, 0x9D), "Eunry"),
-    ((0xCF, 0xB5, 0x3B), "Old Gold"),
-    ((0xCF, 0xDC, 0xCF), "Tasman"),
-    ((0xCF, 0xE5, 0xD2), "Surf Crest"),
-    ((0xCF, 0xF9, 0xF3), "Humming Bird"),
-    ((0xCF, 0xFA, 0xF4), "Scandal"),
-    ((0xD0, 0x5F, 0x04), "Red Stage"),
-    ((0xD0, 0x6D, 0xA1), "Hopbush"),
-    ((0xD0, 0x7D, 0x12), "Meteor"),
-    ((0xD0, 0xBE, 0xF8), "Perfume"),
-    ((0xD0, 0xC0, 0xE5), "Prelude"),
-    ((0xD0, 0xF0, 0xC0), "Tea Green"),
-    ((0xD1, 0x8F, 0x1B), "Geebung"),
-    ((0xD1, 0xBE, 0xA8), "Vanilla"),
-    ((0xD1, 0xC6, 0xB4), "Soft Amber"),
-    ((0xD1, 0xD2, 0xCA), "Celeste"),
-    ((0xD1, 0xD2, 0xDD), "Mischka"),
-    ((0xD1, 0xE2, 0x31), "Pear"),
-    ((0xD2, 0x69, 0x1E), "Hot Cinnamon"),
-    ((0xD2, 0x7D, 0x46), "Raw Sienna"),
-    ((0xD2, 0x9E, 0xAA), "Careys Pink"),
-    ((0xD2, 0xB4, 0x8C), "Tan"),
-    ((0xD2, 0xDA, 0x97), "Deco"),
-    ((0xD2, 0xF6, 0xDE), "Blue Romance"),
-    ((0xD2, 0xF8, 0xB0), "Gossip"),
-    ((0xD3, 0xCB, 0xBA), "Sisal"),
-    ((0xD3, 0xCD, 0xC5), "Swirl"),
-    ((0xD4, 0x74, 0x94), "Charm"),
-    ((0xD4, 0xB6, 0xAF), "Clam Shell"),
-    ((0xD4, 0xBF, 0x8D), "Straw"),
-    ((0xD4, 0xC4, 0xA8), "Akaroa"),
-    ((0xD4, 0xCD, 0x16), "Bird Flower"),
-    ((0xD4, 0xD7, 0xD9), "Iron"),
-    ((0xD4, 0xDF, 0xE2), "Geyser"),
-    ((0xD4, 0xE2, 0xFC), "Hawkes Blue"),
-    ((0xD5, 0x46, 0x00), "Grenadier"),
-    ((0xD5, 0x91, 0xA4), "Can Can"),
-    ((0xD5, 0x9A, 0x6F), "Whiskey"),
-    ((0xD5, 0xD1, 0x95), "Winter Hazel"),
-    ((0xD5, 0xF6, 0xE3), "Granny Apple"),
-    ((0xD6, 0x91, 0x88), "My Pink"),
-    ((0xD6, 0xC5, 0x62), "Tacha"),
-    ((0xD6, 0xCE, 0xF6), "Moon Raker"),
-    ((0xD6, 0xD6, 0xD1), "Quill Gray"),
-    ((0xD6, 0xFF, 0xDB), "Snowy Mint"),
-    ((0xD7, 0x83, 0x7F), "New York Pink"),
-    ((0xD7, 0xC4, 0x98), "Pavlova"),
-    ((0xD7, 0xD0, 0xFF), "Fog"),
-    ((0xD8, 0x44, 0x37), "Valencia"),
-    ((0xD8, 0x7C, 0x63), "Japonica"),
-    ((0xD8, 0xBF, 0xD8), "Thistle"),
-    ((0xD8, 0xC2, 0xD5), "Maverick"),
-    ((0xD8, 0xFC, 0xFA), "Foam"),
-    ((0xD9, 0x49, 0x72), "Cabaret"),
-    ((0xD9, 0x93, 0x76), "Burning Sand"),
-    ((0xD9, 0xB9, 0x9B), "Cameo"),
-    ((0xD9, 0xD6, 0xCF), "Timberwolf"),
-    ((0xD9, 0xDC, 0xC1), "Tana"),
-    ((0xD9, 0xE4, 0xF5), "Link Water"),
-    ((0xD9, 0xF7, 0xFF), "Mabel"),
-    ((0xDA, 0x32, 0x87), "Cerise"),
-    ((0xDA, 0x5B, 0x38), "Flame Pea"),
-    ((0xDA, 0x63, 0x04), "Bamboo"),
-    ((0xDA, 0x6A, 0x41), "Red Damask"),
-    ((0xDA, 0x70, 0xD6), "Orchid"),
-    ((0xDA, 0x8A, 0x67), "Copperfield"),
-    ((0xDA, 0xA5, 0x20), "Golden Grass"),
-    ((0xDA, 0xEC, 0xD6), "Zanah"),
-    ((0xDA, 0xF4, 0xF0), "Iceberg"),
-    ((0xDA, 0xFA, 0xFF), "Oyster Bay"),
-    ((0xDB, 0x50, 0x79), "Cranberry"),
-    ((0xDB, 0x96, 0x90), "Petite Orchid"),
-    ((0xDB, 0x99, 0x5E), "Di Serria"),
-    ((0xDB, 0xDB, 0xDB), "Alto"),
-    ((0xDB, 0xFF, 0xF8), "Frosted Mint"),
-    ((0xDC, 0x14, 0x3C), "Crimson"),
-    ((0xDC, 0x43, 0x33), "Punch"),
-    ((0xDC, 0xB2, 0x0C), "Galliano"),
-    ((0xDC, 0xB4, 0xBC), "Blossom"),
-    ((0xDC, 0xD7, 0x47), "Wattle"),
-    ((0xDC, 0xD9, 0xD2), "Westar"),
-    ((0xDC, 0xDD, 0xCC), "Moon Mist"),
-    ((0xDC, 0xED, 0xB4), "Caper"),
-    ((0xDC, 0xF0, 0xEA), "Swans Down"),
-    ((0xDD, 0xD6, 0xD5), "Swiss Coffee"),
-    ((0xDD, 0xF9, 0xF1), "White Ice"),
-    ((0xDE, 0x31, 0x63), "Cerise Red"),
-    ((0xDE, 0x63, 0x60), "Roman"),
-    ((0xDE, 0xA6, 0x81), "Tumbleweed"),
-    ((0xDE, 0xBA, 0x13), "Gold Tips"),
-    ((0xDE, 0xC1, 0x96), "Brandy"),
-    ((0xDE, 0xCB, 0xC6), "Wafer"),
-    ((0xDE, 0xD4, 0xA4), "Sapling"),
-    ((0xDE, 0xD7, 0x17), "Barberry"),
-    ((0xDE, 0xE5, 0xC0), "Beryl Green"),
-    ((0xDE, 0xF5, 0xFF), "Pattens Blue"),
-    ((0xDF, 0x73, 0xFF), "Heliotrope"),
-    ((0xDF, 0xBE, 0x6F), "Apache"),
-    ((0xDF, 0xCD, 0x6F), "Chenin"),
-    ((0xDF, 0xCF, 0xDB), "Lola"),
-    ((0xDF, 0xEC, 0xDA), "Willow Brook"),
-    ((0xDF, 0xFF, 0x00), "Chartreuse Yellow"),
-    ((0xE0, 0xB0, 0xFF), "Mauve"),
-    ((0xE0, 0xB6, 0x46), "Anzac"),
-    ((0xE0, 0xB9, 0x74), "Harvest Gold"),
-    ((0xE0, 0xC0, 0x95), "Calico"),
-    ((0xE0, 0xFF, 0xFF), "Baby Blue"),
-    ((0xE1, 0x68, 0x65), "Sunglo"),
-    ((0xE1, 0xBC, 0x64), "Equator"),
-    ((0xE1, 0xC0, 0xC8), "Pink Flare"),
-    ((0xE1, 0xE6, 0xD6), "Periglacial Blue"),
-    ((0xE1, 0xEA, 0xD4), "Kidnapper"),
-    ((0xE1, 0xF6, 0xE8), "Tara"),
-    ((0xE2, 0x54, 0x65), "Mandy"),
-    ((0xE2, 0x72, 0x5B), "Terracotta"),
-    ((0xE2, 0x89, 0x13), "Golden Bell"),
-    ((0xE2, 0x92, 0xC0), "Shocking"),
-    ((0xE2, 0x94, 0x18), "Dixie"),
-    ((0xE2, 0x9C, 0xD2), "Light Orchid"),
-    ((0xE2, 0xD8, 0xED), "Snuff"),
-    ((0xE2, 0xEB, 0xED), "Mystic"),
-    ((0xE2, 0xF3, 0xEC), "Apple Green"),
-    ((0xE3, 0x0B, 0x5C), "Razzmatazz"),
-    ((0xE3, 0x26, 0x36), "Alizarin Crimson"),
-    ((0xE3, 0x42, 0x34), "Cinnabar"),
-    ((0xE3, 0xBE, 0xBE), "Cavern Pink"),
-    ((0xE3, 0xF5, 0xE1), "Peppermint"),
-    ((0xE3, 0xF9, 0x88), "Mindaro"),
-    ((0xE4, 0x76, 0x98), "Deep Blush"),
-    ((0xE4, 0x9B, 0x0F), "Gamboge"),
-    ((0xE4, 0xC2, 0xD5), "Melanie"),
-    ((0xE4, 0xCF, 0xDE), "Twilight"),
-    ((0xE4, 0xD1, 0xC0), "Bone"),
-    ((0xE4, 0xD4, 0x22), "Sunflower"),
-    ((0xE4, 0xD5, 0xB7), "Grain Brown"),
-    ((0xE4, 0xD6, 0x9B), "Zombie"),
-    ((0xE4, 0xF6, 0xE7), "Frostee"),
-    ((0xE4, 0xFF, 0xD1), "Snow Flurry"),
-    ((0xE5, 0x2B, 0x50), "Amaranth"),
-    ((0xE5, 0x84, 0x1B), "Zest"),
-    ((0xE5, 0xCC, 0xC9), "Dust Storm"),
-    ((0xE5, 0xD7, 0xBD), "Stark White"),
-    ((0xE5, 0xD8, 0xAF), "Hampton"),
-    ((0xE5, 0xE0, 0xE1), "Bon Jour"),
-    ((0xE5, 0xE5, 0xE5), "Mercury"),
-    ((0xE5, 0xF9, 0xF6), "Polar"),
-    ((0xE6, 0x4E, 0x03), "Trinidad"),
-    ((0xE6, 0xBE, 0x8A), "Gold Sand"),
-    ((0xE6, 0xBE, 0xA5), "Cashmere"),
-    ((0xE6, 0xD7, 0xB9), "Double Spanish White"),
-    ((0xE6, 0xE4, 0xD4), "Satin Linen"),
-    ((0xE6, 0xF2, 0xEA), "Harp"),
-    ((0xE6, 0xF8, 0xF3), "Off Green"),
-    ((0xE6, 0xFF, 0xE9), "Hint of Green"),
-    ((0xE6, 0xFF, 0xFF), "Tranquil"),
-    ((0xE7, 0x72, 0x00), "Mango Tango"),
-    ((0xE7, 0x73, 0x0A), "Christine"),
-    ((0xE7, 0x9F, 0x8C), "Tonys Pink"),
-    ((0xE7, 0x9F, 0xC4), "Kobi"),
-    ((0xE7, 0xBC, 0xB4), "Rose Fog"),
-    ((0xE7, 0xBF, 0x05), "Corn"),
-    ((0xE7, 0xCD, 0x8C), "Putty"),
-    ((0xE7, 0xEC, 0xE6), "Gray Nurse"),
-    ((0xE7, 0xF8, 0xFF), "Lily White"),
-    ((0xE7, 0xFE, 0xFF), "Bubbles"),
-    ((0xE8, 0x99, 0x28), "Fire Bush"),
-    ((0xE8, 0xB9, 0xB3), "Shilo"),
-    ((0xE8, 0xE0, 0xD5), "Pearl Bush"),
-    ((0xE8, 0xEB, 0xE0), "Green White"),
-    ((0xE8, 0xF1, 0xD4), "Chrome White"),
-    ((0xE8, 0xF2, 0xEB), "Gin"),
-    ((0xE8, 0xF5, 0xF2), "Aqua Squeeze"),
-    ((0xE9, 0x6E, 0x00), "Clementine"),
-    ((0xE9, 0x74, 0x51), "Burnt Sienna"),
-    ((0xE9, 0x7C, 0x07), "Tahiti Gold"),
-    ((0xE9, 0xCE, 0xCD), "Oyster Pink"),
-    ((0xE9, 0xD7, 0x5A), "Confetti"),
-    ((0xE9, 0xE3, 0xE3), "Ebb"),
-    ((0xE9, 0xF8, 0xED), "Ottoman"),
-    ((0xE9, 0xFF, 0xFD), "Clear Day"),
-    ((0xEA, 0x88, 0xA8), "Carissma"),
-    ((0xEA, 0xAE, 0x69), "Porsche"),
-    ((0xEA, 0xB3, 0x3B), "Tulip Tree"),
-    ((0xEA, 0xC6, 0x74), "Rob Roy"),
-    ((0xEA, 0xDA, 0xB8), "Raffia"),
-    ((0xEA, 0xE8, 0xD4), "White Rock"),
-    ((0xEA, 0xF6, 0xEE), "Panache"),
-    ((0xEA, 0xF6, 0xFF), "Solitude"),
-    ((0xEA, 0xF9, 0xF5), "Aqua Spring"),
-    ((0xEA, 0xFF, 0xFE), "Dew"),
-    ((0xEB, 0x93, 0x73), "Apricot"),
-    ((0xEB, 0xC2, 0xAF), "Zinnwaldite"),
-    ((0xEC, 0xA9, 0x27), "Fuel Yellow"),
-    ((0xEC, 0xC5, 0x4E), "Ronchi"),
-    ((0xEC, 0xC7, 0xEE), "French Lilac"),
-    ((0xEC, 0xCD, 0xB9), "Just Right"),
-    ((0xEC, 0xE0, 0x90), "Wild Rice"),
-    ((0xEC, 0xEB, 0xBD), "Fall Green"),
-    ((0xEC, 0xEB, 0xCE), "Aths Special"),
-    ((0xEC, 0xF2, 0x45), "Starship"),
-    ((0xED, 0x0A, 0x3F), "Red Ribbon"),
-    ((0xED, 0x7A, 0x1C), "Tango"),
-    ((0xED, 0x91, 0x21), "Carrot Orange"),
-    ((0xED, 0x98, 0x9E), "Sea Pink"),
-    ((0xED, 0xB3, 0x81), "Tacao"),
-    ((0xED, 0xC9, 0xAF), "Desert Sand"),
-    ((0xED, 0xCD, 0xAB), "Pancho"),
-    ((0xED, 0xDC, 0xB1), "Chamois"),
-    ((0xED, 0xEA, 0x99), "Primrose"),
-    ((0xED, 0xF5, 0xDD), "Frost"),
-    ((0xED, 0xF5, 0xF5), "Aqua Haze"),
-    ((0xED, 0xF6, 0xFF), "Zumthor"),
-    ((0xED, 0xF9, 0xF1), "Narvik"),
-    ((0xED, 0xFC, 0x84), "Honeysuckle"),
-    ((0xEE, 0x82, 0xEE), "Lavender Magenta"),
-    ((0xEE, 0xC1, 0xBE), "Beauty Bush"),
-    ((0xEE, 0xD7, 0x94), "Chalky"),
-    ((0xEE, 0xD9, 0xC4), "Almond"),
-    ((0xEE, 0xDC, 0x82), "Flax"),
-    ((0xEE, 0xDE, 0xDA), "Bizarre"),
-    ((0xEE, 0xE3, 0xAD), "Double Colonial White"),
-    ((0xEE, 0xEE, 0xE8), "Cararra"),
-    ((0xEE, 0xEF, 0x78), "Manz"),
-    ((0xEE, 0xF0, 0xC8), "Tahuna Sands"),
-    ((0xEE, 0xF0, 0xF3), "Athens Gray"),
-    ((0xEE, 0xF3, 0xC3), "Tusk"),
-    ((0xEE, 0xF4, 0xDE), "Loafer"),
-    ((0xEE, 0xF6, 0xF7), "Catskill White"),
-    ((0xEE, 0xFD, 0xFF), "Twilight Blue"),
-    ((0xEE, 0xFF, 0x9A), "Jonquil"),
-    ((0xEE, 0xFF, 0xE2), "Rice Flower"),
-    ((0xEF, 0x86, 0x3F), "Jaffa"),
-    ((0xEF, 0xEF, 0xEF), "Gallery"),
-    ((0xEF, 0xF2, 0xF3), "Porcelain"),
-    ((0xF0, 0x91, 0xA9), "Mauvelous"),
-    ((0xF0, 0xD5, 0x2D), "Golden Dream"),
-    ((0xF0, 0xDB, 0x7D), "Golden Sand"),
-    ((0xF0, 0xDC, 0x82), "Buff"),
-    ((0xF0, 0xE2, 0xEC), "Prim"),
-    ((0xF0, 0xE6, 0x8C), "Khaki"),
-    ((0xF0, 0xEE, 0xFD), "Selago"),
-    ((0xF0, 0xEE, 0xFF), "Titan White"),
-    ((0xF0, 0xF8, 0xFF), "Alice Blue"),
-    ((0xF0, 0xFC, 0xEA), "Feta"),
-    ((0xF1, 0x82, 0x00), "Gold Drop"),
-    ((0xF1, 0x9B, 0xAB), "Wewak"),
-    ((0xF1, 0xE7, 0x88), "Sahara Sand"),
-    ((0xF1, 0xE9, 0xD2), "Parchment"),
-    ((0xF1, 0xE9, 0xFF), "Blue Chalk"),
-    ((0xF1, 0xEE, 0xC1), "Mint Julep"),
-    ((0xF1, 0xF1, 0xF1), "Seashell"),
-    ((0xF1, 0xF7, 0xF2), "Saltpan"),
-    ((0xF1, 0xFF, 0xAD), "Tidal"),
-    ((0xF1, 0xFF, 0xC8), "Chiffon"),
-    ((0xF2, 0x55, 0x2A), "Flamingo"),
-    ((0xF2, 0x85, 0x00), "Tangerine"),
-    ((0xF2, 0xC3, 0xB2), "Mandys Pink"),
-    ((0xF2, 0xF2, 0xF2), "Concrete"),
-    ((0xF2, 0xFA, 0xFA), "Black Squeeze"),
-    ((0xF3, 0x47, 0x23), "Pomegranate"),
-    ((0xF3, 0xAD, 0x16), "Buttercup"),
-    ((0xF3, 0xD6, 0x9D), "New Orleans"),
-    ((0xF3, 0xD9, 0xDF), "Vanilla Ice"),
-    ((0xF3, 0xE7, 0xBB), "Sidecar"),
-    ((0xF3, 0xE9, 0xE5), "Dawn Pink"),
-    ((0xF3, 0xED, 0xCF), "Wheatfield"),
-    ((0xF3, 0xFB, 0x62), "Canary"),
-    ((0xF3, 0xFB, 0xD4), "Orinoco"),
-    ((0xF3, 0xFF, 0xD8), "Carla"),
-    ((0xF4, 0x00, 0xA1), "Hollywood Cerise"),
-    ((0xF4, 0xA4, 0x60), "Sandy brown"),
-    ((0xF4, 0xC4, 0x30), "Saffron"),
-    ((0xF4, 0xD8, 0x1C), "Ripe Lemon"),
-    ((0xF4, 0xEB, 0xD3), "Janna"),
-    ((0xF4, 0xF2, 0xEE), "Pampas"),
-    ((0xF4, 0xF4, 0xF4), "Wild Sand"),
-    ((0xF4, 0xF8, 0xFF), "Zircon"),
-    ((0xF5, 0x75, 0x84), "Froly"),
-    ((0xF5, 0xC8, 0x5C), "Cream Can"),
-    ((0xF5, 0xC9, 0x99), "Manhattan"),
-    ((0xF5, 0xD5, 0xA0), "Maize"),
-    ((0xF5, 0xDE, 0xB3), "Wheat"),
-    ((0xF5, 0xE7, 0xA2), "Sandwisp"),
-    ((0xF5, 0xE7, 0xE2), "Pot Pourri"),
-    ((0xF5, 0xE9, 0xD3), "Albescent White"),
-    ((0xF5, 0xED, 0xEF), "Soft Peach"),
-    ((0xF5, 0xF3, 0xE5), "Ecru White"),
-    ((0xF5, 0xF5, 0xDC), "Beige"),
-    ((0xF5, 0xFB, 0x3D), "Golden Fizz"),
-    ((0xF5, 0xFF, 0xBE), "Australian Mint"),
-    ((0xF6, 0x4A, 0x8A), "French Rose"),
-    ((0xF6, 0x53, 0xA6), "Brilliant Rose"),
-    ((0xF6, 0xA4, 0xC9), "Illusion"),
-    ((0xF6, 0xF0, 0xE6), "Merino"),
-    ((0xF6, 0xF7, 0xF7), "Black Haze"),
-    ((0xF6, 0xFF, 0xDC), "Spring Sun"),
-    ((0xF7, 0x46, 0x8A), "Violet Red"),
-    ((0xF7, 0x77, 0x03), "Chilean Fire"),
-    ((0xF7, 0x7F, 0xBE), "Persian Pink"),
-    ((0xF7, 0xB6, 0x68), "Rajah"),
-    ((0xF7, 0xC8, 0xDA), "Azalea"),
-    ((0xF7, 0xDB, 0xE6), "We Peep"),
-    ((0xF7, 0xF2, 0xE1), "Quarter Spanish White"),
-    ((0xF7, 0xF5, 0xFA), "Whisper"),
-    ((0xF7, 0xFA, 0xF7), "Snow Drift"),
-    ((0xF8, 0xB8, 0x53), "Casablanca"),
-    ((0xF8, 0xC3, 0xDF), "Chantilly"),
-    ((0xF8, 0xD9, 0xE9), "Cherub"),
-    ((0xF8, 0xDB, 0x9D), "Marzipan"),
-    ((0xF8, 0xDD, 0x5C), "Energy Yellow"),
-    ((0xF8, 0xE4, 0xBF), "Givry"),
-    ((0xF8, 0xF0, 0xE8), "White Linen"),
-    ((0xF8, 0xF4, 0xFF), "Magnolia"),
-    ((0xF8, 0xF6, 0xF1), "Spring Wood"),
-    ((0xF8, 0xF7, 0xDC), "Coconut Cream"),
-    ((0xF8, 0xF7, 0xFC), "White Lilac"),
-    ((0xF8, 0xF8, 0xF7), "Desert Storm"),
-    ((0xF8, 0xF9, 0x9C), "Texas"),
-    ((0xF8, 0xFA, 0xCD), "Corn Field"),
-    ((0xF8, 0xFD, 0xD3), "Mimosa"),
-    ((0xF9, 0x5A, 0x61), "Carnation"),
-    ((0xF9, 0xBF, 0x58), "Saffron Mango"),
-    ((0xF9, 0xE0, 0xED), "Carousel Pink"),
-    ((0xF9, 0xE4, 0xBC), "Dairy Cream"),
-    ((0xF9, 0xE6, 0x63), "Portica"),
-    ((0xF9, 0xEA, 0xF3), "Amour"),
-    ((0xF9, 0xF8, 0xE4), "Rum Swizzle"),
-    ((0xF9, 0xFF, 0x8B), "Dolly"),
-    ((0xF9, 0xFF, 0xF6), "Sugar Cane"),
-    ((0xFA, 0x78, 0x14), "Ecstasy"),
-    ((0xFA, 0x9D, 0x5A), "Tan Hide"),
-    ((0xFA, 0xD3, 0xA2), "Corvette"),
-    ((0xFA, 0xDF, 0xAD), "Peach Yellow"),
-    ((0xFA, 0xE6, 0x00), "Turbo"),
-    ((0xFA, 0xEA, 0xB9), "Astra"),
-    ((0xFA, 0xEC, 0xCC), "Champagne"),
-    ((0xFA, 0xF0, 0xE6), "Linen"),
-    ((0xFA, 0xF3, 0xF0), "Fantasy"),
-    ((0xFA, 0xF7, 0xD6), "Citrine White"),
-    ((0xFA, 0xFA, 0xFA), "Alabaster"),
-    ((0xFA, 0xFD, 0xE4), "Hint of Yellow"),
-    ((0xFA, 0xFF, 0xA4), "Milan"),
-    ((0xFB, 0x60, 0x7F), "Brink Pink"),
-    ((0xFB, 0x89, 0x89), "Geraldine"),
-    ((0xFB, 0xA0, 0xE3), "Lavender Rose"),
-    ((0xFB, 0xA1, 0x29), "Sea Buckthorn"),
-    ((0xFB, 0xAC, 0x13), "Sun"),
-    ((0xFB, 0xAE, 0xD2), "Lavender Pink"),
-    ((0xFB, 0xB2, 0xA3), "Rose Bud"),
-    ((0xFB, 0xBE, 0xDA), "Cupid"),
-    ((0xFB, 0xCC, 0xE7), "Classic Rose"),
-    ((0xFB, 0xCE, 0xB1), "Apricot Peach"),
-    ((0xFB, 0xE7, 0xB2), "Banana Mania"),
-    ((0xFB, 0xE8, 0x70), "Marigold Yellow"),
-    ((0xFB, 0xE9, 0x6C), "Festival"),
-    ((0xFB, 0xEA, 0x8C), "Sweet Corn"),
-    ((0xFB, 0xEC, 0x5D), "Candy Corn"),
-    ((0xFB, 0xF9, 0xF9), "Hint of Red"),
-    ((0xFB, 0xFF, 0xBA), "Shalimar"),
-    ((0xFC, 0x0F, 0xC0), "Shocking Pink"),
-    ((0xFC, 0x80, 0xA5), "Tickle Me Pink"),
-    ((0xFC, 0x9C, 0x1D), "Tree Poppy"),
-    ((0xFC, 0xC0, 0x1E), "Lightning Yellow"),
-    ((0xFC, 0xD6, 0x67), "Goldenrod"),
-    ((0xFC, 0xD9, 0x17), "Candlelight"),
-    ((0xFC, 0xDA, 0x98), "Cherokee"),
-    ((0xFC, 0xF4, 0xD0), "Double Pearl Lusta"),
-    ((0xFC, 0xF4, 0xDC), "Pearl Lusta"),
-    ((0xFC, 0xF8, 0xF7), "Vista White"),
-    ((0xFC, 0xFB, 0xF3), "Bianca"),
-    ((0xFC, 0xFE, 0xDA), "Moon Glow"),
-    ((0xFC, 0xFF, 0xE7), "China Ivory"),
-    ((0xFC, 0xFF, 0xF9), "Ceramic"),
-    ((0xFD, 0x0E, 0x35), "Torch Red"),
-    ((0xFD, 0x5B, 0x78), "Wild Watermelon"),
-    ((0xFD, 0x7B, 0x33), "Crusta"),
-    ((0xFD, 0x7C, 0x07), "Sorbus"),
-    ((0xFD, 0x9F, 0xA2), "Sweet Pink"),
-    ((0xFD, 0xD5, 0xB1), "Light Apricot"),
-    ((0xFD, 0xD7, 0xE4), "Pig Pink"),
-    ((0xFD, 0xE1, 0xDC), "Cinderella"),
-    ((0xFD, 0xE2, 0x95), "Golden Glow"),
-    ((0xFD, 0xE9, 0x10), "Lemon"),
-    ((0xFD, 0xF5, 0xE6), "Old Lace"),
-    ((0xFD, 0xF6, 0xD3), "Half Colonial White"),
-    ((0xFD, 0xF7, 0xAD), "Drover"),
-    ((0xFD, 0xFE, 0xB8), "Pale Prim"),
-    ((0xFD, 0xFF, 0xD5), "Cumulus"),
-    ((0xFE, 0x28, 0xA2), "Persian Rose"),
-    ((0xFE, 0x4C, 0x40), "Sunset Orange"),
-    ((0xFE, 0x6F, 0x5E), "Bittersweet"),
-    ((0xFE, 0x9D, 0x04), "California"),
-    ((0xFE, 0xA9, 0x04), "Yellow Sea"),
-    ((0xFE, 0xBA, 0xAD), "Melon"),
-    ((0xFE, 0xD3, 0x3C), "Bright Sun"),
-    ((0xFE, 0xD8, 0x5D), "Dandelion"),
-    ((0xFE, 0xDB, 0x8D), "Salomie"),
-    ((0xFE, 0xE5, 0xAC), "Cape Honey"),
-    ((0xFE, 0xEB, 0xF3), "Remy"),
-    ((0xFE, 0xEF, 0xCE), "Oasis"),
-    ((0xFE, 0xF0, 0xEC), "Bridesmaid"),
-    ((0xFE, 0xF2, 0xC7), "Beeswax"),
-    ((0xFE, 0xF3, 0xD8), "Bleach White"),
-    ((0xFE, 0xF4, 0xCC), "Pipi"),
-    ((0xFE, 0xF4, 0xDB), "Half Spanish White"),
-    ((0xFE, 0xF4, 0xF8), "Wisp Pink"),
-    ((0xFE, 0xF5, 0xF1), "Provincial Pink"),
-    ((0xFE, 0xF7, 0xDE), "Half Dutch White"),
-    ((0xFE, 0xF8, 0xE2), "Solitaire"),
-    ((0xFE, 0xF8, 0xFF), "White Pointer"),
-    ((0xFE, 0xF9, 0xE3), "Off Yellow"),
-    ((0xFE, 0xFC, 0xED), "Orange White"),
-    ((0xFF, 0x00, 0x00), "Red"),
-    ((0xFF, 0x00, 0x7F), "Rose"),
-    ((0xFF, 0x00, 0xCC), "Purple Pizzazz"),
-    ((0xFF, 0x00, 0xFF), "Magenta / Fuchsia"),
-    ((0xFF, 0x24, 0x00), "Scarlet"),
-    ((0xFF, 0x33, 0x99), "Wild Strawberry"),
-    ((0xFF, 0x33, 0xCC), "Razzle Dazzle Rose"),
-    ((0xFF, 0x35, 0x5E), "Radical Red"),
-    ((0xFF, 0x3F, 0x34), "Red Orange"),
-    ((0xFF, 0x40, 0x40), "Coral Red"),
-    ((0xFF, 0x4D, 0x00), "Vermilion"),
-    ((0xFF, 0x4F, 0x00), "International Orange"),
-    ((0xFF, 0x60, 0x37), "Outrageous Orange"),
-    ((0xFF, 0x66, 0x00), "Blaze Orange"),
-    ((0xFF, 0x66, 0xFF), "Pink Flamingo"),
-    ((0xFF, 0x68, 0x1F), "Orange"),
-    ((0xFF, 0x69, 0xB4), "Hot Pink"),
-    ((0xFF, 0x6B, 0x53), "Persimmon"),
-    ((0xFF, 0x6F, 0xFF), "Blush Pink"),
-    ((0xFF, 0x70, 0x34), "Burning Orange"),
-    ((0xFF, 0x75, 0x18), "Pumpkin"),
-    ((0xFF, 0x7D, 0x07), "Flamenco"),
-    ((0xFF, 0x7F, 0x00), "Flush Orange"),
-    ((0xFF, 0x7F, 0x50), "Coral"),
-    ((0xFF, 0x8C, 0x69), "Salmon"),
-    ((0xFF, 0x90, 0x00), "Pizazz"),
-    ((0xFF, 0x91, 0x0F), "West Side"),
-    ((0xFF, 0x91, 0xA4), "Pink Salmon"),
-    ((0xFF, 0x99, 0x33), "Neon Carrot"),
-    ((0xFF, 0x99, 0x66), "Atomic Tangerine"),
-    ((0xFF, 0x99, 0x80), "Vivid Tangerine"),
-    ((0xFF, 0x9E, 0x2C), "Sunshade"),
-    ((0xFF, 0xA0, 0x00), "Orange Peel"),
-    ((0xFF, 0xA1, 0x94), "Mona Lisa"),
-    ((0xFF, 0xA5, 0x00), "Web Orange"),
-    ((0xFF, 0xA6, 0xC9), "Carnation Pink"),
-    ((0xFF, 0xAB, 0x81), "Hit Pink"),
-    ((0xFF, 0xAE, 0x42), "Yellow Orange"),
-    ((0xFF, 0xB0, 0xAC), "Cornflower Lilac"),
-    ((0xFF, 0xB1, 0xB3), "Sundown"),
-    ((0xFF, 0xB3, 0x1F), "My Sin"),
-    ((0xFF, 0xB5, 0x55), "Texas Rose"),
-    ((0xFF, 0xB7, 0xD5), "Cotton Candy"),
-    ((0xFF, 0xB9, 0x7B), "Macaroni and Cheese"),
-    ((0xFF, 0xBA, 0x00), "Selective Yellow"),
-    ((0xFF, 0xBD, 0x5F), "Koromiko"),
-    ((0xFF, 0xBF, 0x00), "Amber"),
-    ((0xFF, 0xC0, 0xA8), "Wax Flower"),
-    ((0xFF, 0xC0, 0xCB), "Pink"),
-    ((0xFF, 0xC3, 0xC0), "Your Pink"),
-    ((0xFF, 0xC9, 0x01), "Supernova"),
-    ((0xFF, 0xCB, 0xA4), "Flesh"),
-    ((0xFF, 0xCC, 0x33), "Sunglow"),
-    ((0xFF, 0xCC, 0x5C), "Golden Tainoi"),
-    ((0xFF, 0xCC, 0x99), "Peach Orange"),
-    ((0xFF, 0xCD, 0x8C), "Chardonnay"),
-    ((0xFF, 0xD1, 0xDC), "Pastel Pink"),
-    ((0xFF, 0xD2, 0xB7), "Romantic"),
-    ((0xFF, 0xD3, 0x8C), "Grandis"),
-    ((0xFF, 0xD7, 0x00), "Gold"),
-    ((0xFF, 0xD8, 0x00), "School bus Yellow"),
-    ((0xFF, 0xD8, 0xD9), "Cosmos"),
-    ((0xFF, 0xDB, 0x58), "Mustard"),
-    ((0xFF, 0xDC, 0xD6), "Peach Schnapps"),
-    ((0xFF, 0xDD, 0xAF), "Caramel"),
-    ((0xFF, 0xDD, 0xCD), "Tuft Bush"),
-    ((0xFF, 0xDD, 0xCF), "Watusi"),
-    ((0xFF, 0xDD, 0xF4), "Pink Lace"),
-    ((0xFF, 0xDE, 0xAD), "Navajo White"),
-    ((0xFF, 0xDE, 0xB3), "Frangipani"),
-    ((0xFF, 0xE1, 0xDF), "Pippin"),
-    ((0xFF, 0xE1, 0xF2), "Pale Rose"),
-    ((0xFF, 0xE2, 0xC5), "Negroni"),
-    ((0xFF, 0xE5, 0xA0), "Cream Brulee"),
-    ((0xFF, 0xE5, 0xB4), "Peach"),
-    ((0xFF, 0xE6, 0xC7), "Tequila"),
-    ((0xFF, 0xE7, 0x72), "Kournikova"),
-    ((0xFF, 0xEA, 0xC8), "Sandy Beach"),
-    ((0xFF, 0xEA, 0xD4), "Karry"),
-    ((0xFF, 0xEC, 0x13), "Broom"),
-    ((0xFF, 0xED, 0xBC), "Colonial White"),
-    ((0xFF, 0xEE, 0xD8), "Derby"),
-    ((0xFF, 0xEF, 0xA1), "Vis Vis"),
-    ((0xFF, 0xEF, 0xC1), "Egg White"),
-    ((0xFF, 0xEF, 0xD5), "Papaya Whip"),
-    ((0xFF, 0xEF, 0xEC), "Fair Pink"),
-    ((0xFF, 0xF0, 0xDB), "Peach Cream"),
-    ((0xFF, 0xF0, 0xF5), "Lavender blush"),
-    ((0xFF, 0xF1, 0x4F), "Gorse"),
-    ((0xFF, 0xF1, 0xB5), "Buttermilk"),
-    ((0xFF, 0xF1, 0xD8), "Pink Lady"),
-    ((0xFF, 0xF1, 0xEE), "Forget Me Not"),
-    ((0xFF, 0xF1, 0xF9), "Tutu"),
-    ((0xFF, 0xF3, 0x9D), "Picasso"),
-    ((0xFF, 0xF3, 0xF1), "Chardon"),
-    ((0xFF, 0xF4, 0x6E), "Paris Daisy"),
-    ((0xFF, 0xF4, 0xCE), "Barley White"),
-    ((0xFF, 0xF4, 0xDD), "Egg Sour"),
-    ((0xFF, 0xF4, 0xE0), "Sazerac"),
-    ((0xFF, 0xF4, 0xE8), "Serenade"),
-    ((0xFF, 0xF4, 0xF3), "Chablis"),
-    ((0xFF, 0xF5, 0xEE), "Seashell Peach"),
-    ((0xFF, 0xF5, 0xF3), "Sauvignon"),
-    ((0xFF, 0xF6, 0xD4), "Milk Punch"),
-    ((0xFF, 0xF6, 0xDF), "Varden"),
-    ((0xFF, 0xF6, 0xF5), "Rose White"),
-    ((0xFF, 0xF8, 0xD1), "Baja White"),
-    ((0xFF, 0xF9, 0xE2), "Gin Fizz"),
-    ((0xFF, 0xF9, 0xE6), "Early Dawn"),
-    ((0xFF, 0xFA, 0xCD), "Lemon Chiffon"),
-    ((0xFF, 0xFA, 0xF4), "Bridal Heath"),
-    ((0xFF, 0xFB, 0xDC), "Scotch Mist"),
-    ((0xFF, 0xFB, 0xF9), "Soapstone"),
-    ((0xFF, 0xFC, 0x99), "Witch Haze"),
-    ((0xFF, 0xFC, 0xEA), "Buttery White"),
-    ((0xFF, 0xFC, 0xEE), "Island Spice"),
-    ((0xFF, 0xFD, 0xD0), "Cream"),
-    ((0xFF, 0xFD, 0xE6), "Chilean Heath"),
-    ((0xFF, 0xFD, 0xE8), "Travertine"),
-    ((0xFF, 0xFD, 0xF3), "Orchid White"),
-    ((0xFF, 0xFD, 0xF4), "Quarter Pearl Lusta"),
-    ((0xFF, 0xFE, 0xE1), "Half and Half"),
-    ((0xFF, 0xFE, 0xEC), "Apricot White"),
-    ((0xFF, 0xFE, 0xF0), "Rice Cake"),
-    ((0xFF, 0xFE, 0xF6), "Black White"),
-    ((0xFF, 0xFE, 0xFD), "Romance"),
-    ((0xFF, 0xFF, 0x00), "Yellow"),
-    ((0xFF, 0xFF, 0x66), "Laser Lemon"),
-    ((0xFF, 0xFF, 0x99), "Pale Canary"),
-    ((0xFF, 0xFF, 0xB4), "Portafino"),
-    ((0xFF, 0xFF, 0xF0), "Ivory"),
-    ((0xFF, 0xFF, 0xFF), "White")
-)
+        idx, _ = self.nearest(r, g, b, min_distance)
+        return self.data[idx][1] if idx is not None else None
+
+
+class ColorLookupTable(object):
+    """Precomputed closest color table index for every color of an RGB cube.
+
+    The cube is quantized to `bits` per channel (8 = all 16.7M colors) and
+    the table entry of each cell is the closest color to the cell's center.
+    The table is stored as a uint16 array in `cache_dir` (default:
+    ``$XDG_CACHE_HOME/colornames``) and memory-mapped on later use. The cache
+    file name contains a hash of the classifier's color table, so a changed
+    table causes a rebuild.
+
+    Needs NumPy.
+
+    """
+
+    def __init__(self, classifier, bits=6, cache_dir=None):
+        if not 1 <= bits <= 8:
+            raise ValueError("Bits per channel must be between 1 and 8.")
+
+        if not _have_numpy():
+            raise ImportError("ColorLookupTable needs NumPy.")
+
+        self.classifier = classifier
+        self.bits = bits
+        self.cache_dir = cache_dir or join(
+            os.environ.get("XDG_CACHE_HOME", expanduser("~/.cache")), "colornames")
+        self.table = self._load()
+
+    @property
+    def cache_key(self):
+        import hashlib
+
+        digest = hashlib.sha1(self.classifier.metric.encode('ascii'))
+        for color, name in self.classifier.data:
+            digest.update(bytearray(color))
+            digest.update(name.encode('utf-8') + b'\0')
+        return digest.hexdigest()[:16]
+
+    @property
+    def cache_file(self):
+        return join(self.cache_dir, "lut-%s-%ibit-%s.npy" % (
+            self.classifier.metric, self.bits, self.cache_key))
+
+    def _load(self):
+        # only needed for the cache, so not imported at module level
+        import glob
+        import tempfile
+
+        try:
+            return np.load(self.cache_file, mmap_mode='r')
+        except (IOError, OSError, ValueError):
+            pass
+
+        table = self._build()
+
+        try:
+            if not os.path.isdir(self.cache_dir):
+                os.makedirs(self.cache_dir)
+
+            # only tables of this metric, tables of other metrics are still valid
+            for stale in glob.glob(join(self.cache_dir, "lut-%s-%ibit-*.npy" % (
+                    self.classifier.metric, self.bits))):
+                os.unlink(stale)
+
+            fd, tmpname = tempfile.mkstemp(suffix='.npy', dir=self.cache_dir)
+            with os.fdopen(fd, 'wb') as fp:
+                np.save(fp, table)
+            os.rename(tmpname, self.cache_file)
+        except (IOError, OSError):
+            return table
+
+        return np.load(self.cache_file, mmap_mode='r')
+
+    def _build(self):
+        shift = 8 - self.bits
+        size = 1 << self.bits
+        centers = np.arange(size) * (1 << shift) + ((1 << shift) - 1) / 2.0
+        table = np.empty(size ** 3, dtype=np.uint16)
+        plane = np.empty((size, size, 3), dtype=np.float64)
+        plane[..., 1] = centers[:, np.newaxis]
+        plane[..., 2] = centers[np.newaxis, :]
+
+        # one red plane of the cube at a time
+        for i, red in enumerate(centers):
+            plane[..., 0] = red
+            indices, _ = self.classifier.nearest_many(plane, None)
+            table[i * size * size:(i + 1) * size * size] = indices
+
+        return table
+
+    def lookup(self, colors, max_dist=None):
+        """Return table indices for an array of colors with shape (..., 3).
 
+        The result has the shape of `colors` without the last axis. If
+        `max_dist` is given, the indices of colors whose distance to the
+        table entry is not less than `max_dist` are set to -1.
 
-def get_color_name(r, g, b, max_dist=50,
-                   classifier=ColorClassifier(color_names)):
+        """
+        colors = np.asarray(colors)
+        rgb = colors.astype(np.intp) >> (8 - self.bits)
+        indices = self.table[(rgb[..., 0] << 2 * self.bits) | (rgb[..., 1] << self.bits) |
+                             rgb[..., 2]].astype(np.intp)
+
+        if max_dist is not None:
+            if self.classifier.metric == 'rgb':
+                diff = self.classifier.matrix[indices] - colors
+                dists = np.sqrt(np.einsum('...i,...i->...', diff, diff))
+            elif self.classifier.metric == 'de76':
+                diff = self.classifier.matrix[indices] - rgb_to_lab_array(colors)
+                dists = np.sqrt(np.einsum('...i,...i->...', diff, diff))
+            else:
+                dists = delta_e2000(self.classifier.matrix[indices], rgb_to_lab_array(colors))
+
+            indices[dists >= max_dist] = -1
+
+        return indices
+
+    def names(self, colors, max_dist=None):
+        """Return list of names for the colors of an N x 3 array (None for no match)."""
+        data = self.classifier.data
+        return [data[idx][1] if idx >= 0 else None
+                for idx in self.lookup(colors, max_dist).ravel()]
+
+
+# Color table as "RRGGBB Name" lines, parsed on first access of `color_names`
+_COLOR_DATA = """\
+000000 Black
+000080 Navy Blue
+0000C8 Dark Blue
+0000FF Blue
+000741 Stratos
+001B1C Swamp
+002387 Resolution Blue
+002900 Deep Fir
+002E20 Burnham
+002FA7 International Klein Blue
+003153 Prussian Blue
+003366 Midnight Blue
+003399 Smalt
+003532 Deep Teal
+003E40 Cyprus
+004620 Kaitoke Green
+0047AB Cobalt
+004816 Crusoe
+004950 Sherpa Blue
+0056A7 Endeavour
+00581A Camarone
+0066CC Science Blue
+0066FF Blue Ribbon
+00755E Tropical Rain Forest
+0076A3 Allports
+007BA7 Deep Cerulean
+007EC7 Lochmara
+007FFF Azure Radiance
+008080 Teal
+0095B6 Bondi Blue
+009DC4 Pacific Blue
+00A693 Persian Green
+00A86B Jade
+00CC99 Caribbean Green
+00CCCC Robin's Egg Blue
+00FF00 Green
+00FF7F Spring Green
+00FFFF Cyan / Aqua
+010D1A Blue Charcoal
+011635 Midnight
+011D13 Holly
+012731 Daintree
+01361C Cardin Green
+01371A County Green
+013E62 Astronaut Blue
+013F6A Regal Blue
+014B43 Aqua Deep
+015E85 Orient
+016162 Blue Stone
+016D39 Fun Green
+01796F Pine Green
+017987 Blue Lagoon
+01826B Deep Sea
+01A368 Green Haze
+022D15 English Holly
+02402C Sherwood Green
+02478E Congress Blue
+024E46 Evening Sea
+026395 Bahama Blue
+02866F Observatory
+02A4D3 Cerulean
+03163C Tangaroa
+032B52 Green Vogue
+036A6E Mosque
+041004 Midnight Moss
+041322 Black Pearl
+042E4C Blue Whale
+044022 Zuccini
+044259 Teal Blue
+051040 Deep Cove
+051657 Gulf Blue
+055989 Venice Blue
+056F57 Watercourse
+062A78 Catalina Blue
+063537 Tiber
+069B81 Gossamer
+06A189 Niagara
+073A50 Tarawera
+080110 Jaguar
+081910 Black Bean
+082567 Deep Sapphire
+088370 Elf Green
+08E8DE Bright Turquoise
+092256 Downriver
+09230F Palm Green
+09255D Madison
+093624 Bottle Green
+095859 Deep Sea Green
+097F4B Salem
+0A001C Black Russian
+0A480D Dark Fern
+0A6906 Japanese Laurel
+0A6F75 Atoll
+0B0B0B Cod Gray
+0B0F08 Marshland
+0B1107 Gordons Green
+0B1304 Black Forest
+0B6207 San Felix
+0BDA51 Malachite
+0C0B1D Ebony
+0C0D0F Woodsmoke
+0C1911 Racing Green
+0C7A79 Surfie Green
+0C8990 Blue Chill
+0D0332 Black Rock
+0D1117 Bunker
+0D1C19 Aztec
+0D2E1C Bush
+0E0E18 Cinder
+0E2A30 Firefly
+0F2D9E Torea Bay
+10121D Vulcan
+101405 Green Waterloo
+105852 Eden
+110C6C Arapawa
+120A8F Ultramarine
+123447 Elephant
+126B40 Jewel
+130000 Diesel
+130A06 Asphalt
+13264D Blue Zodiac
+134F19 Parsley
+140600 Nero
+1450AA Tory Blue
+151F4C Bunting
+1560BD Denim
+15736B Genoa
+161928 Mirage
+161D10 Hunter Green
+162A40 Big Stone
+163222 Celtic
+16322C Timber Green
+163531 Gable Green
+171F04 Pine Tree
+175579 Chathams Blue
+182D09 Deep Forest Green
+18587A Blumine
+19330E Palm Leaf
+193751 Nile Blue
+1959A8 Fun Blue
+1A1A68 Lucky Point
+1AB385 Mountain Meadow
+1B0245 Tolopea
+1B1035 Haiti
+1B127B Deep Koamaru
+1B1404 Acadia
+1B2F11 Seaweed
+1B3162 Biscay
+1B659D Matisse
+1C1208 Crowshead
+1C1E13 Rangoon Green
+1C39BB Persian Blue
+1C402E Everglade
+1C7C7D Elm
+1D6142 Green Pea
+1E0F04 Creole
+1E1609 Karaka
+1E1708 El Paso
+1E385B Cello
+1E433C Te Papa Green
+1E90FF Dodger Blue
+1E9AB0 Eastern Blue
+1F120F Night Rider
+1FC2C2 Java
+20208D Jacksons Purple
+202E54 Cloud Burst
+204852 Blue Dianne
+211A0E Eternity
+220878 Deep Blue
+228B22 Forest Green
+233418 Mallard
+240A40 Violet
+240C02 Kilamanjaro
+242A1D Log Cabin
+242E16 Black Olive
+24500F Green House
+251607 Graphite
+251706 Cannon Black
+251F4F Port Gore
+25272C Shark
+25311C Green Kelp
+2596D1 Curious Blue
+260368 Paua
+26056A Paris M
+261105 Wood Bark
+261414 Gondola
+262335 Steel Gray
+26283B Ebony Clay
+273A81 Bay of Many
+27504B Plantation
+278A5B Eucalyptus
+281E15 Oil
+283A77 Astronaut
+286ACD Mariner
+290C5E Violent Violet
+292130 Bastille
+292319 Zeus
+292937 Charade
+297B9A Jelly Bean
+29AB87 Jungle Green
+2A0359 Cherry Pie
+2A140E Coffee Bean
+2A2630 Baltic Sea
+2A380B Turtle Green
+2A52BE Cerulean Blue
+2B0202 Sepia Black
+2B194F Valhalla
+2B3228 Heavy Metal
+2C0E8C Blue Gem
+2C1632 Revolver
+2C2133 Bleached Cedar
+2C8C84 Lochinvar
+2D2510 Mikado
+2D383A Outer Space
+2D569B St Tropaz
+2E0329 Jacaranda
+2E1905 Jacko Bean
+2E3222 Rangitoto
+2E3F62 Rhino
+2E8B57 Sea Green
+2EBFD4 Scooter
+2F270E Onion
+2F3CB3 Governor Bay
+2F519E Sapphire
+2F5A57 Spectra
+2F6168 Casal
+300529 Melanzane
+301F1E Cocoa Brown
+302A0F Woodrush
+304B6A San Juan
+30D5C8 Turquoise
+311C17 Eclipse
+314459 Pickled Bluewood
+315BA1 Azure
+31728D Calypso
+317D82 Paradiso
+32127A Persian Indigo
+32293A Blackcurrant
+323232 Mine Shaft
+325D52 Stromboli
+327C14 Bilbao
+327DA0 Astral
+33036B Christalle
+33292F Thunder
+33CC99 Shamrock
+341515 Tamarind
+350036 Mardi Gras
+350E42 Valentino
+350E57 Jagger
+353542 Tuna
+354E8C Chambray
+363050 Martinique
+363534 Tuatara
+363C0D Waiouru
+36747D Ming
+368716 La Palma
+370202 Chocolate
+371D09 Clinker
+37290E Brown Tumbleweed
+373021 Birch
+377475 Oracle
+380474 Blue Diamond
+381A51 Grape
+383533 Dune
+384555 Oxford Blue
+384910 Clover
+394851 Limed Spruce
+396413 Dell
+3A0020 Toledo
+3A2010 Sambuca
+3A2A6A Jacarta
+3A686C William
+3A6A47 Killarney
+3AB09E Keppel
+3B000B Temptress
+3B0910 Aubergine
+3B1F1F Jon
+3B2820 Treehouse
+3B7A57 Amazon
+3B91B4 Boston Blue
+3C0878 Windsor
+3C1206 Rebel
+3C1F76 Meteorite
+3C2005 Dark Ebony
+3C3910 Camouflage
+3C4151 Bright Gray
+3C4443 Cape Cod
+3C493A Lunar Green
+3D0C02 Bean  
+3D2B1F Bistre
+3D7D52 Goblin
+3E0480 Kingfisher Daisy
+3E1C14 Cedar
+3E2B23 English Walnut
+3E2C1C Black Marlin
+3E3A44 Ship Gray
+3EABBF Pelorous
+3F2109 Bronze
+3F2500 Cola
+3F3002 Madras
+3F307F Minsk
+3F4C3A Cabbage Pont
+3F583B Tom Thumb
+3F5D53 Mineral Green
+3FC1AA Puerto Rico
+3FFF00 Harlequin
+401801 Brown Pod
+40291D Cork
+403B38 Masala
+403D19 Thatch Green
+405169 Fiord
+40826D Viridian
+40A860 Chateau Green
+410056 Ripe Plum
+411F10 Paco
+412010 Deep Oak
+413C37 Merlin
+414257 Gun Powder
+414C7D East Bay
+4169E1 Royal Blue
+41AA78 Ocean Green
+420303 Burnt Maroon
+423921 Lisbon Brown
+427977 Faded Jade
+431560 Scarlet Gum
+433120 Iroko
+433E37 Armadillo
+434C59 River Bed
+436A0D Green Leaf
+44012D Barossa
+441D00 Morocco Brown
+444954 Mako
+454936 Kelp
+456CAC San Marino
+45B1E8 Picton Blue
+460B41 Loulou
+462425 Crater Brown
+465945 Gray Asparagus
+4682B4 Steel Blue
+480404 Rustic Red
+480607 Bulgarian Rose
+480656 Clairvoyant
+481C1C Cocoa Bean
+483131 Woody Brown
+483C32 Taupe
+49170C Van Cleef
+492615 Brown Derby
+49371B Metallic Bronze
+495400 Verdun Green
+496679 Blue Bayoux
+497183 Bismark
+4A2A04 Bracken
+4A3004 Deep Bronze
+4A3C30 Mondo
+4A4244 Tundora
+4A444B Gravel
+4A4E5A Trout
+4B0082 Pigment Indigo
+4B5D52 Nandor
+4C3024 Saddle
+4C4F56 Abbey
+4D0135 Blackberry
+4D0A18 Cab Sav
+4D1E01 Indian Tan
+4D282D Cowboy
+4D282E Livid Brown
+4D3833 Rock
+4D3D14 Punga
+4D400F Bronzetone
+4D5328 Woodland
+4E0606 Mahogany
+4E2A5A Bossanova
+4E3B41 Matterhorn
+4E420C Bronze Olive
+4E4562 Mulled Wine
+4E6649 Axolotl
+4E7F9E Wedgewood
+4EABD1 Shakespeare
+4F1C70 Honey Flower
+4F2398 Daisy Bush
+4F69C6 Indigo
+4F7942 Fern Green
+4F9D5D Fruit Salad
+4FA83D Apple
+504351 Mortar
+507096 Kashmir Blue
+507672 Cutty Sark
+50C878 Emerald
+514649 Emperor
+516E3D Chalet Green
+517C66 Como
+51808F Smalt Blue
+52001F Castro
+520C17 Maroon Oak
+523C94 Gigas
+533455 Voodoo
+534491 Victoria
+53824B Hippie Green
+541012 Heath
+544333 Judge Gray
+54534D Fuscous Gray
+549019 Vida Loca
+55280C Cioccolato
+555B10 Saratoga
+556D56 Finlandia
+5590D9 Havelock Blue
+56B4BE Fountain Blue
+578363 Spring Leaves
+583401 Saddle Brown
+585562 Scarpa Flow
+587156 Cactus
+589AAF Hippie Blue
+591D35 Wine Berry
+592804 Brown Bramble
+593737 Congo Brown
+594433 Millbrook
+5A6E9C Waikawa Gray
+5A87A0 Horizon
+5B3013 Jambalaya
+5C0120 Bordeaux
+5C0536 Mulberry Wood
+5C2E01 Carnaby Tan
+5C5D75 Comet
+5D1E0F Redwood
+5D4C51 Don Juan
+5D5C58 Chicago
+5D5E37 Verdigris
+5D7747 Dingley
+5DA19F Breaker Bay
+5E483E Kabul
+5E5D3B Hemlock
+5F3D26 Irish Coffee
+5F5F6E Mid Gray
+5F6672 Shuttle Gray
+5FA777 Aqua Forest
+5FB3AC Tradewind
+604913 Horses Neck
+605B73 Smoky
+606E68 Corduroy
+6093D1 Danube
+612718 Espresso
+614051 Eggplant
+615D30 Costa Del Sol
+61845F Glade Green
+622F30 Buccaneer
+623F2D Quincy
+624E9A Butterfly Bush
+625119 West Coast
+626649 Finch
+639A8F Patina
+63B76C Fern
+6456B7 Blue Violet
+646077 Dolphin
+646463 Storm Dust
+646A54 Siam
+646E75 Nevada
+6495ED Cornflower Blue
+64CCDB Viking
+65000B Rosewood
+651A14 Cherrywood
+652DC1 Purple Heart
+657220 Fern Frond
+65745D Willow Grove
+65869F Hoki
+660045 Pompadour
+660099 Purple
+66023C Tyrian Purple
+661010 Dark Tan
+66B58F Silver Tree
+66FF00 Bright Green
+66FF66 Screamin' Green
+67032D Black Rose
+675FA6 Scampi
+676662 Ironside Gray
+678975 Viridian Green
+67A712 Christi
+683600 Nutmeg Wood Finish
+685558 Zambezi
+685E6E Salt Box
+692545 Tawny Port
+692D54 Finn
+695F62 Scorpion
+697E9A Lynch
+6A442E Spice
+6A5D1B Himalaya
+6A6051 Soya Bean
+6B2A14 Hairy Heath
+6B3FA0 Royal Purple
+6B4E31 Shingle Fawn
+6B5755 Dorado
+6B8BA2 Bermuda Gray
+6B8E23 Olive Drab
+6C3082 Eminence
+6CDAE7 Turquoise Blue
+6D0101 Lonestar
+6D5E54 Pine Cone
+6D6C6C Dove Gray
+6D9292 Juniper
+6D92A1 Gothic
+6E0902 Red Oxide
+6E1D14 Moccaccino
+6E4826 Pickled Bean
+6E4B26 Dallas
+6E6D57 Kokoda
+6E7783 Pale Sky
+6F440C Cafe Royale
+6F6A61 Flint
+6F8E63 Highland
+6F9D02 Limeade
+6FD0C5 Downy
+701C1C Persian Plum
+704214 Sepia
+704A07 Antique Bronze
+704F50 Ferra
+706555 Coffee
+708090 Slate Gray
+711A00 Cedar Wood Finish
+71291D Metallic Copper
+714693 Affair
+714AB2 Studio
+715D47 Tobacco Brown
+716338 Yellow Metal
+716B56 Peat
+716E10 Olivetone
+717486 Storm Gray
+718080 Sirocco
+71D9E2 Aquamarine Blue
+72010F Venetian Red
+724A2F Old Copper
+726D4E Go Ben
+727B89 Raven
+731E8F Seance
+734A12 Raw Umber
+736C9F Kimberly
+736D58 Crocodile
+737829 Crete
+738678 Xanadu
+74640D Spicy Mustard
+747D63 Limed Ash
+747D83 Rolling Stone
+748881 Blue Smoke
+749378 Laurel
+74C365 Mantis
+755A57 Russett
+7563A8 Deluge
+76395D Cosmic
+7666C6 Blue Marguerite
+76BD17 Lima
+76D7EA Sky Blue
+770F05 Dark Burgundy
+771F1F Crown of Thorns
+773F1A Walnut
+776F61 Pablo
+778120 Pacifika
+779E86 Oxley
+77DD77 Pastel Green
+780109 Japanese Maple
+782D19 Mocha
+782F16 Peanut
+78866B Camouflage Green
+788A25 Wasabi
+788BBA Ship Cove
+78A39C Sea Nymph
+795D4C Roman Coffee
+796878 Old Lavender
+796989 Rum
+796A78 Fedora
+796D62 Sandstone
+79DEEC Spray
+7A013A Siren
+7A58C1 Fuchsia Blue
+7A7A7A Boulder
+7A89B8 Wild Blue Yonder
+7AC488 De York
+7B3801 Red Beech
+7B3F00 Cinnamon
+7B6608 Yukon Gold
+7B7874 Tapa
+7B7C94 Waterloo 
+7B8265 Flax Smoke
+7B9F80 Amulet
+7BA05B Asparagus
+7C1C05 Kenyan Copper
+7C7631 Pesto
+7C778A Topaz
+7C7B7A Concord
+7C7B82 Jumbo
+7C881A Trendy Green
+7CA1A6 Gumbo
+7CB0A1 Acapulco
+7CB7BB Neptune
+7D2C14 Pueblo
+7DA98D Bay Leaf
+7DC8F7 Malibu
+7DD8C6 Bermuda
+7E3A15 Copper Canyon
+7F1734 Claret
+7F3A02 Peru Tan
+7F626D Falcon
+7F7589 Mobster
+7F76D3 Moody Blue
+7FFF00 Chartreuse
+7FFFD4 Aquamarine
+800000 Maroon
+800B47 Rose Bud Cherry
+801818 Falu Red
+80341F Red Robin
+803790 Vivid Violet
+80461B Russet
+807E79 Friar Gray
+808000 Olive
+808080 Gray
+80B3AE Gulf Stream
+80B3C4 Glacier
+80CCEA Seagull
+81422C Nutmeg
+816E71 Spicy Pink
+817377 Empress
+819885 Spanish Green
+826F65 Sand Dune
+828685 Gunsmoke
+828F72 Battleship Gray
+831923 Merlot
+837050 Shadow
+83AA5D Chelsea Cucumber
+83D0C6 Monte Carlo
+843179 Plum
+84A0A0 Granny Smith
+8581D9 Chetwode Blue
+858470 Bandicoot
+859FAF Bali Hai
+85C4CC Half Baked
+860111 Red Devil
+863C3C Lotus
+86483C Ironstone
+864D1E Bull Shot
+86560A Rusty Nail
+868974 Bitter
+86949F Regent Gray
+871550 Disco
+87756E Americano
+877C7B Hurricane
+878D91 Oslo Gray
+87AB39 Sushi
+885342 Spicy Mix
+886221 Kumera
+888387 Suva Gray
+888D65 Avocado
+893456 Camelot
+893843 Solid Pink
+894367 Cannon Pink
+897D6D Makara
+8A3324 Burnt Umber
+8A73D6 True V
+8A8360 Clay Creek
+8A8389 Monsoon
+8A8F8A Stack
+8AB9F1 Jordy Blue
+8B00FF Electric Violet
+8B0723 Monarch
+8B6B0B Corn Harvest
+8B8470 Olive Haze
+8B847E Schooner
+8B8680 Natural Gray
+8B9C90 Mantle
+8B9FEE Portage
+8BA690 Envy
+8BA9A5 Cascade
+8BE6D8 Riptide
+8C055E Cardinal Pink
+8C472F Mule Fawn
+8C5738 Potters Clay
+8C6495 Trendy Pink
+8D0226 Paprika
+8D3D38 Sanguine Brown
+8D3F3F Tosca
+8D7662 Cement
+8D8974 Granite Green
+8D90A1 Manatee
+8DA8CC Polo Blue
+8E0000 Red Berry
+8E4D1E Rope
+8E6F70 Opium
+8E775E Domino
+8E8190 Mamba
+8EABC1 Nepal
+8F021C Pohutukawa
+8F3E33 El Salva
+8F4B0E Korma
+8F8176 Squirrel
+8FD6B4 Vista Blue
+900020 Burgundy
+901E1E Old Brick
+907874 Hemp
+907B71 Almond Frost
+908D39 Sycamore
+92000A Sangria
+924321 Cumin
+926F5B Beaver
+928573 Stonewall
+928590 Venus
+9370DB Medium Purple
+93CCEA Cornflower
+93DFB8 Algae Green
+944747 Copper Rust
+948771 Arrowtown
+950015 Scarlett
+956387 Strikemaster
+959396 Mountain Mist
+960018 Carmine
+964B00 Brown
+967059 Leather
+9678B6 Purple Mountain's Majesty
+967BB6 Lavender Purple
+96A8A1 Pewter
+96BBAB Summer Green
+97605D Au Chico
+9771B5 Wisteria
+97CD2D Atlantis
+983D61 Vin Rouge
+9874D3 Lilac Bush
+98777B Bazaar
+98811B Hacienda
+988D77 Pale Oyster
+98FF98 Mint Green
+990066 Fresh Eggplant
+991199 Violet Eggplant
+991613 Tamarillo
+991B07 Totem Pole
+996666 Copper Rose
+9966CC Amethyst
+997A8D Mountbatten Pink
+9999CC Blue Bell
+9A3820 Prairie Sand
+9A6E61 Toast
+9A9577 Gurkha
+9AB973 Olivine
+9AC2B8 Shadow Green
+9B4703 Oregon
+9B9E8F Lemon Grass
+9C3336 Stiletto
+9D5616 Hawaiian Tan
+9DACB7 Gull Gray
+9DC209 Pistachio
+9DE093 Granny Smith Apple
+9DE5FF Anakiwa
+9E5302 Chelsea Gem
+9E5B40 Sepia Skin
+9EA587 Sage
+9EA91F Citron
+9EB1CD Rock Blue
+9EDEE0 Morning Glory
+9F381D Cognac
+9F821C Reef Gold
+9F9F9C Star Dust
+9FA0B1 Santas Gray
+9FD7D3 Sinbad
+9FDD8C Feijoa
+A02712 Tabasco
+A1750D Buttered Rum
+A1ADB5 Hit Gray
+A1C50A Citrus
+A1DAD7 Aqua Island
+A1E9DE Water Leaf
+A2006D Flirt
+A23B6C Rouge
+A26645 Cape Palliser
+A2AAB3 Gray Chateau
+A2AEAB Edward
+A3807B Pharlap
+A397B4 Amethyst Smoke
+A3E3ED Blizzard Blue
+A4A49D Delta
+A4A6D3 Wistful
+A4AF6E Green Smoke
+A50B5E Jazzberry Jam
+A59B91 Zorba
+A5CB0C Bahia
+A62F20 Roof Terracotta
+A65529 Paarl
+A68B5B Barley Corn
+A69279 Donkey Brown
+A6A29A Dawn
+A72525 Mexican Red
+A7882C Luxor Gold
+A85307 Rich Gold
+A86515 Reno Sand
+A86B6B Coral Tree
+A8989B Dusty Gray
+A899E6 Dull Lavender
+A8A589 Tallow
+A8AE9C Bud
+A8AF8E Locust
+A8BD9F Norway
+A8E3BD Chinook
+A9A491 Gray Olive
+A9ACB6 Aluminium
+A9B2C3 Cadet Blue
+A9B497 Schist
+A9BDBF Tower Gray
+A9BEF2 Perano
+A9C6C2 Opal
+AA375A Night Shadz
+AA4203 Fire
+AA8B5B Muesli
+AA8D6F Sandal
+AAA5A9 Shady Lady
+AAA9CD Logan
+AAABB7 Spun Pearl
+AAD6E6 Regent St Blue
+AAF0D1 Magic Mint
+AB0563 Lipstick
+AB3472 Royal Heath
+AB917A Sandrift
+ABA0D9 Cold Purple
+ABA196 Bronco
+AC8A56 Limed Oak
+AC91CE East Side
+AC9E22 Lemon Ginger
+ACA494 Napa
+ACA586 Hillary
+ACA59F Cloudy
+ACACAC Silver Chalice
+ACB78E Swamp Green
+ACCBB1 Spring Rain
+ACDD4D Conifer
+ACE1AF Celadon
+AD781B Mandalay
+ADBED1 Casper
+ADDFAD Moss Green
+ADE6C4 Padua
+ADFF2F Green Yellow
+AE4560 Hippie Pink
+AE6020 Desert
+AE809E Bouquet
+AF4035 Medium Carmine
+AF4D43 Apple Blossom
+AF593E Brown Rust
+AF8751 Driftwood
+AF8F2C Alpine
+AF9F1C Lucky
+AFA09E Martini
+AFB1B8 Bombay
+AFBDD9 Pigeon Post
+B04C6A Cadillac
+B05D54 Matrix
+B05E81 Tapestry
+B06608 Mai Tai
+B09A95 Del Rio
+B0E0E6 Powder Blue
+B0E313 Inch Worm
+B10000 Bright Red
+B14A0B Vesuvius
+B1610B Pumpkin Skin
+B16D52 Santa Fe
+B19461 Teak
+B1E2C1 Fringy Flower
+B1F4E7 Ice Cold
+B20931 Shiraz
+B2A1EA Biloba Flower
+B32D29 Tall Poppy
+B35213 Fiery Orange
+B38007 Hot Toddy
+B3AF95 Taupe Gray
+B3C110 La Rioja
+B43332 Well Read
+B44668 Blush
+B4CFD3 Jungle Mist
+B57281 Turkish Rose
+B57EDC Lavender
+B5A27F Mongoose
+B5B35C Olive Green
+B5D2CE Jet Stream
+B5ECDF Cruise
+B6316C Hibiscus
+B69D98 Thatch
+B6B095 Heathered Gray
+B6BAA4 Eagle
+B6D1EA Spindle
+B6D3BF Gum Leaf
+B7410E Rust
+B78E5C Muddy Waters
+B7A214 Sahara
+B7A458 Husk
+B7B1B1 Nobel
+B7C3D0 Heather
+B7F0BE Madang
+B81104 Milano Red
+B87333 Copper
+B8B56A Gimblet
+B8C1B1 Green Spring
+B8C25D Celery
+B8E0F9 Sail
+B94E48 Chestnut
+B95140 Crail
+B98D28 Marigold
+B9C46A Wild Willow
+B9C8AC Rainee
+BA0101 Guardsman Red
+BA450C Rock Spray
+BA6F1E Bourbon
+BA7F03 Pirate Gold
+BAB1A2 Nomad
+BAC7C9 Submarine
+BAEEF9 Charlotte
+BB3385 Medium Red Violet
+BB8983 Brandy Rose
+BBD009 Rio Grande
+BBD7C1 Surf
+BCC9C2 Powder Ash
+BD5E2E Tuscany
+BD978E Quicksand
+BDB1A8 Silk
+BDB2A1 Malta
+BDB3C7 Chatelle
+BDBBD7 Lavender Gray
+BDBDC6 French Gray
+BDC8B3 Clay Ash
+BDC9CE Loblolly
+BDEDFD French Pass
+BEA6C3 London Hue
+BEB5B7 Pink Swan
+BEDE0D Fuego
+BF5500 Rose of Sharon
+BFB8B0 Tide
+BFBED8 Blue Haze
+BFC1C2 Silver Sand
+BFC921 Key Lime Pie
+BFDBE2 Ziggurat
+BFFF00 Lime
+C02B18 Thunderbird
+C04737 Mojo
+C08081 Old Rose
+C0C0C0 Silver
+C0D3B9 Pale Leaf
+C0D8B6 Pixie Green
+C1440E Tia Maria
+C154C1 Fuchsia Pink
+C1A004 Buddha Gold
+C1B7A4 Bison Hide
+C1BAB0 Tea
+C1BECD Gray Suit
+C1D7B0 Sprout
+C1F07C Sulu
+C26B03 Indochine
+C2955D Twine
+C2BDB6 Cotton Seed
+C2CAC4 Pumice
+C2E8E5 Jagged Ice
+C32148 Maroon Flush
+C3B091 Indian Khaki
+C3BFC1 Pale Slate
+C3C3BD Gray Nickel
+C3CDE6 Periwinkle Gray
+C3D1D1 Tiara
+C3DDF9 Tropical Blue
+C41E3A Cardinal
+C45655 Fuzzy Wuzzy Brown
+C45719 Orange Roughy
+C4C4BC Mist Gray
+C4D0B0 Coriander
+C4F4EB Mint Tulip
+C54B8C Mulberry
+C59922 Nugget
+C5994B Tussock
+C5DBCA Sea Mist
+C5E17A Yellow Green
+C62D42 Brick Red
+C6726B Contessa
+C69191 Oriental Pink
+C6A84B Roti
+C6C3B5 Ash
+C6C8BD Kangaroo
+C6E610 Las Palmas
+C7031E Monza
+C71585 Red Violet
+C7BCA2 Coral Reef
+C7C1FF Melrose
+C7C4BF Cloud
+C7C9D5 Ghost
+C7CD90 Pine Glade
+C7DDE5 Botticelli
+C88A65 Antique Brass
+C8A2C8 Lilac
+C8A528 Hokey Pokey
+C8AABF Lily
+C8B568 Laser
+C8E3D7 Edgewater
+C96323 Piper
+C99415 Pizza
+C9A0DC Light Wisteria
+C9B29B Rodeo Dust
+C9B35B Sundance
+C9B93B Earls Green
+C9C0BB Silver Rust
+C9D9D2 Conch
+C9FFA2 Reef
+C9FFE5 Aero Blue
+CA3435 Flush Mahogany
+CABB48 Turmeric
+CADCD4 Paris White
+CAE00D Bitter Lemon
+CAE6DA Skeptic
+CB8FA9 Viola
+CBCAB6 Foggy Gray
+CBD3B0 Green Mist
+CBDBD6 Nebula
+CC3333 Persian Red
+CC5500 Burnt Orange
+CC7722 Ochre
+CC8899 Puce
+CCCAA8 Thistle Green
+CCCCFF Periwinkle
+CCFF00 Electric Lime
+CD5700 Tenn
+CD5C5C Chestnut Rose
+CD8429 Brandy Punch
+CDF4FF Onahau
+CEB98F Sorrell Brown
+CEBABA Cold Turkey
+CEC291 Yuma
+CEC7A7 Chino
+CFA39D Eunry
+CFB53B Old Gold
+CFDCCF Tasman
+CFE5D2 Surf Crest
+CFF9F3 Humming Bird
+CFFAF4 Scandal
+D05F04 Red Stage
+D06DA1 Hopbush
+D07D12 Meteor
+D0BEF8 Perfume
+D0C0E5 Prelude
+D0F0C0 Tea Green
+D18F1B Geebung
+D1BEA8 Vanilla
+D1C6B4 Soft Amber
+D1D2CA Celeste
+D1D2DD Mischka
+D1E231 Pear
+D2691E Hot Cinnamon
+D27D46 Raw Sienna
+D29EAA Careys Pink
+D2B48C Tan
+D2DA97 Deco
+D2F6DE Blue Romance
+D2F8B0 Gossip
+D3CBBA Sisal
+D3CDC5 Swirl
+D47494 Charm
+D4B6AF Clam Shell
+D4BF8D Straw
+D4C4A8 Akaroa
+D4CD16 Bird Flower
+D4D7D9 Iron
+D4DFE2 Geyser
+D4E2FC Hawkes Blue
+D54600 Grenadier
+D591A4 Can Can
+D59A6F Whiskey
+D5D195 Winter Hazel
+D5F6E3 Granny Apple
+D69188 My Pink
+D6C562 Tacha
+D6CEF6 Moon Raker
+D6D6D1 Quill Gray
+D6FFDB Snowy Mint
+D7837F New York Pink
+D7C498 Pavlova
+D7D0FF Fog
+D84437 Valencia
+D87C63 Japonica
+D8BFD8 Thistle
+D8C2D5 Maverick
+D8FCFA Foam
+D94972 Cabaret
+D99376 Burning Sand
+D9B99B Cameo
+D9D6CF Timberwolf
+D9DCC1 Tana
+D9E4F5 Link Water
+D9F7FF Mabel
+DA3287 Cerise
+DA5B38 Flame Pea
+DA6304 Bamboo
+DA6A41 Red Damask
+DA70D6 Orchid
+DA8A67 Copperfield
+DAA520 Golden Grass
+DAECD6 Zanah
+DAF4F0 Iceberg
+DAFAFF Oyster Bay
+DB5079 Cranberry
+DB9690 Petite Orchid
+DB995E Di Serria
+DBDBDB Alto
+DBFFF8 Frosted Mint
+DC143C Crimson
+DC4333 Punch
+DCB20C Galliano
+DCB4BC Blossom
+DCD747 Wattle
+DCD9D2 Westar
+DCDDCC Moon Mist
+DCEDB4 Caper
+DCF0EA Swans Down
+DDD6D5 Swiss Coffee
+DDF9F1 White Ice
+DE3163 Cerise Red
+DE6360 Roman
+DEA681 Tumbleweed
+DEBA13 Gold Tips
+DEC196 Brandy
+DECBC6 Wafer
+DED4A4 Sapling
+DED717 Barberry
+DEE5C0 Beryl Green
+DEF5FF Pattens Blue
+DF73FF Heliotrope
+DFBE6F Apache
+DFCD6F Chenin
+DFCFDB Lola
+DFECDA Willow Brook
+DFFF00 Chartreuse Yellow
+E0B0FF Mauve
+E0B646 Anzac
+E0B974 Harvest Gold
+E0C095 Calico
+E0FFFF Baby Blue
+E16865 Sunglo
+E1BC64 Equator
+E1C0C8 Pink Flare
+E1E6D6 Periglacial Blue
+E1EAD4 Kidnapper
+E1F6E8 Tara
+E25465 Mandy
+E2725B Terracotta
+E28913 Golden Bell
+E292C0 Shocking
+E29418 Dixie
+E29CD2 Light Orchid
+E2D8ED Snuff
+E2EBED Mystic
+E2F3EC Apple Green
+E30B5C Razzmatazz
+E32636 Alizarin Crimson
+E34234 Cinnabar
+E3BEBE Cavern Pink
+E3F5E1 Peppermint
+E3F988 Mindaro
+E47698 Deep Blush
+E49B0F Gamboge
+E4C2D5 Melanie
+E4CFDE Twilight
+E4D1C0 Bone
+E4D422 Sunflower
+E4D5B7 Grain Brown
+E4D69B Zombie
+E4F6E7 Frostee
+E4FFD1 Snow Flurry
+E52B50 Amaranth
+E5841B Zest
+E5CCC9 Dust Storm
+E5D7BD Stark White
+E5D8AF Hampton
+E5E0E1 Bon Jour
+E5E5E5 Mercury
+E5F9F6 Polar
+E64E03 Trinidad
+E6BE8A Gold Sand
+E6BEA5 Cashmere
+E6D7B9 Double Spanish White
+E6E4D4 Satin Linen
+E6F2EA Harp
+E6F8F3 Off Green
+E6FFE9 Hint of Green
+E6FFFF Tranquil
+E77200 Mango Tango
+E7730A Christine
+E79F8C Tonys Pink
+E79FC4 Kobi
+E7BCB4 Rose Fog
+E7BF05 Corn
+E7CD8C Putty
+E7ECE6 Gray Nurse
+E7F8FF Lily White
+E7FEFF Bubbles
+E89928 Fire Bush
+E8B9B3 Shilo
+E8E0D5 Pearl Bush
+E8EBE0 Green White
+E8F1D4 Chrome White
+E8F2EB Gin
+E8F5F2 Aqua Squeeze
+E96E00 Clementine
+E97451 Burnt Sienna
+E97C07 Tahiti Gold
+E9CECD Oyster Pink
+E9D75A Confetti
+E9E3E3 Ebb
+E9F8ED Ottoman
+E9FFFD Clear Day
+EA88A8 Carissma
+EAAE69 Porsche
+EAB33B Tulip Tree
+EAC674 Rob Roy
+EADAB8 Raffia
+EAE8D4 White Rock
+EAF6EE Panache
+EAF6FF Solitude
+EAF9F5 Aqua Spring
+EAFFFE Dew
+EB9373 Apricot
+EBC2AF Zinnwaldite
+ECA927 Fuel Yellow
+ECC54E Ronchi
+ECC7EE French Lilac
+ECCDB9 Just Right
+ECE090 Wild Rice
+ECEBBD Fall Green
+ECEBCE Aths Special
+ECF245 Starship
+ED0A3F Red Ribbon
+ED7A1C Tango
+ED9121 Carrot Orange
+ED989E Sea Pink
+EDB381 Tacao
+EDC9AF Desert Sand
+EDCDAB Pancho
+EDDCB1 Chamois
+EDEA99 Primrose
+EDF5DD Frost
+EDF5F5 Aqua Haze
+EDF6FF Zumthor
+EDF9F1 Narvik
+EDFC84 Honeysuckle
+EE82EE Lavender Magenta
+EEC1BE Beauty Bush
+EED794 Chalky
+EED9C4 Almond
+EEDC82 Flax
+EEDEDA Bizarre
+EEE3AD Double Colonial White
+EEEEE8 Cararra
+EEEF78 Manz
+EEF0C8 Tahuna Sands
+EEF0F3 Athens Gray
+EEF3C3 Tusk
+EEF4DE Loafer
+EEF6F7 Catskill White
+EEFDFF Twilight Blue
+EEFF9A Jonquil
+EEFFE2 Rice Flower
+EF863F Jaffa
+EFEFEF Gallery
+EFF2F3 Porcelain
+F091A9 Mauvelous
+F0D52D Golden Dream
+F0DB7D Golden Sand
+F0DC82 Buff
+F0E2EC Prim
+F0E68C Khaki
+F0EEFD Selago
+F0EEFF Titan White
+F0F8FF Alice Blue
+F0FCEA Feta
+F18200 Gold Drop
+F19BAB Wewak
+F1E788 Sahara Sand
+F1E9D2 Parchment
+F1E9FF Blue Chalk
+F1EEC1 Mint Julep
+F1F1F1 Seashell
+F1F7F2 Saltpan
+F1FFAD Tidal
+F1FFC8 Chiffon
+F2552A Flamingo
+F28500 Tangerine
+F2C3B2 Mandys Pink
+F2F2F2 Concrete
+F2FAFA Black Squeeze
+F34723 Pomegranate
+F3AD16 Buttercup
+F3D69D New Orleans
+F3D9DF Vanilla Ice
+F3E7BB Sidecar
+F3E9E5 Dawn Pink
+F3EDCF Wheatfield
+F3FB62 Canary
+F3FBD4 Orinoco
+F3FFD8 Carla
+F400A1 Hollywood Cerise
+F4A460 Sandy brown
+F4C430 Saffron
+F4D81C Ripe Lemon
+F4EBD3 Janna
+F4F2EE Pampas
+F4F4F4 Wild Sand
+F4F8FF Zircon
+F57584 Froly
+F5C85C Cream Can
+F5C999 Manhattan
+F5D5A0 Maize
+F5DEB3 Wheat
+F5E7A2 Sandwisp
+F5E7E2 Pot Pourri
+F5E9D3 Albescent White
+F5EDEF Soft Peach
+F5F3E5 Ecru White
+F5F5DC Beige
+F5FB3D Golden Fizz
+F5FFBE Australian Mint
+F64A8A French Rose
+F653A6 Brilliant Rose
+F6A4C9 Illusion
+F6F0E6 Merino
+F6F7F7 Black Haze
+F6FFDC Spring Sun
+F7468A Violet Red
+F77703 Chilean Fire
+F77FBE Persian Pink
+F7B668 Rajah
+F7C8DA Azalea
+F7DBE6 We Peep
+F7F2E1 Quarter Spanish White
+F7F5FA Whisper
+F7FAF7 Snow Drift
+F8B853 Casablanca
+F8C3DF Chantilly
+F8D9E9 Cherub
+F8DB9D Marzipan
+F8DD5C Energy Yellow
+F8E4BF Givry
+F8F0E8 White Linen
+F8F4FF Magnolia
+F8F6F1 Spring Wood
+F8F7DC Coconut Cream
+F8F7FC White Lilac
+F8F8F7 Desert Storm
+F8F99C Texas
+F8FACD Corn Field
+F8FDD3 Mimosa
+F95A61 Carnation
+F9BF58 Saffron Mango
+F9E0ED Carousel Pink
+F9E4BC Dairy Cream
+F9E663 Portica
+F9EAF3 Amour
+F9F8E4 Rum Swizzle
+F9FF8B Dolly
+F9FFF6 Sugar Cane
+FA7814 Ecstasy
+FA9D5A Tan Hide
+FAD3A2 Corvette
+FADFAD Peach Yellow
+FAE600 Turbo
+FAEAB9 Astra
+FAECCC Champagne
+FAF0E6 Linen
+FAF3F0 Fantasy
+FAF7D6 Citrine White
+FAFAFA Alabaster
+FAFDE4 Hint of Yellow
+FAFFA4 Milan
+FB607F Brink Pink
+FB8989 Geraldine
+FBA0E3 Lavender Rose
+FBA129 Sea Buckthorn
+FBAC13 Sun
+FBAED2 Lavender Pink
+FBB2A3 Rose Bud
+FBBEDA Cupid
+FBCCE7 Classic Rose
+FBCEB1 Apricot Peach
+FBE7B2 Banana Mania
+FBE870 Marigold Yellow
+FBE96C Festival
+FBEA8C Sweet Corn
+FBEC5D Candy Corn
+FBF9F9 Hint of Red
+FBFFBA Shalimar
+FC0FC0 Shocking Pink
+FC80A5 Tickle Me Pink
+FC9C1D Tree Poppy
+FCC01E Lightning Yellow
+FCD667 Goldenrod
+FCD917 Candlelight
+FCDA98 Cherokee
+FCF4D0 Double Pearl Lusta
+FCF4DC Pearl Lusta
+FCF8F7 Vista White
+FCFBF3 Bianca
+FCFEDA Moon Glow
+FCFFE7 China Ivory
+FCFFF9 Ceramic
+FD0E35 Torch Red
+FD5B78 Wild Watermelon
+FD7B33 Crusta
+FD7C07 Sorbus
+FD9FA2 Sweet Pink
+FDD5B1 Light Apricot
+FDD7E4 Pig Pink
+FDE1DC Cinderella
+FDE295 Golden Glow
+FDE910 Lemon
+FDF5E6 Old Lace
+FDF6D3 Half Colonial White
+FDF7AD Drover
+FDFEB8 Pale Prim
+FDFFD5 Cumulus
+FE28A2 Persian Rose
+FE4C40 Sunset Orange
+FE6F5E Bittersweet
+FE9D04 California
+FEA904 Yellow Sea
+FEBAAD Melon
+FED33C Bright Sun
+FED85D Dandelion
+FEDB8D Salomie
+FEE5AC Cape Honey
+FEEBF3 Remy
+FEEFCE Oasis
+FEF0EC Bridesmaid
+FEF2C7 Beeswax
+FEF3D8 Bleach White
+FEF4CC Pipi
+FEF4DB Half Spanish White
+FEF4F8 Wisp Pink
+FEF5F1 Provincial Pink
+FEF7DE Half Dutch White
+FEF8E2 Solitaire
+FEF8FF White Pointer
+FEF9E3 Off Yellow
+FEFCED Orange White
+FF0000 Red
+FF007F Rose
+FF00CC Purple Pizzazz
+FF00FF Magenta / Fuchsia
+FF2400 Scarlet
+FF3399 Wild Strawberry
+FF33CC Razzle Dazzle Rose
+FF355E Radical Red
+FF3F34 Red Orange
+FF4040 Coral Red
+FF4D00 Vermilion
+FF4F00 International Orange
+FF6037 Outrageous Orange
+FF6600 Blaze Orange
+FF66FF Pink Flamingo
+FF681F Orange
+FF69B4 Hot Pink
+FF6B53 Persimmon
+FF6FFF Blush Pink
+FF7034 Burning Orange
+FF7518 Pumpkin
+FF7D07 Flamenco
+FF7F00 Flush Orange
+FF7F50 Coral
+FF8C69 Salmon
+FF9000 Pizazz
+FF910F West Side
+FF91A4 Pink Salmon
+FF9933 Neon Carrot
+FF9966 Atomic Tangerine
+FF9980 Vivid Tangerine
+FF9E2C Sunshade
+FFA000 Orange Peel
+FFA194 Mona Lisa
+FFA500 Web Orange
+FFA6C9 Carnation Pink
+FFAB81 Hit Pink
+FFAE42 Yellow Orange
+FFB0AC Cornflower Lilac
+FFB1B3 Sundown
+FFB31F My Sin
+FFB555 Texas Rose
+FFB7D5 Cotton Candy
+FFB97B Macaroni and Cheese
+FFBA00 Selective Yellow
+FFBD5F Koromiko
+FFBF00 Amber
+FFC0A8 Wax Flower
+FFC0CB Pink
+FFC3C0 Your Pink
+FFC901 Supernova
+FFCBA4 Flesh
+FFCC33 Sunglow
+FFCC5C Golden Tainoi
+FFCC99 Peach Orange
+FFCD8C Chardonnay
+FFD1DC Pastel Pink
+FFD2B7 Romantic
+FFD38C Grandis
+FFD700 Gold
+FFD800 School bus Yellow
+FFD8D9 Cosmos
+FFDB58 Mustard
+FFDCD6 Peach Schnapps
+FFDDAF Caramel
+FFDDCD Tuft Bush
+FFDDCF Watusi
+FFDDF4 Pink Lace
+FFDEAD Navajo White
+FFDEB3 Frangipani
+FFE1DF Pippin
+FFE1F2 Pale Rose
+FFE2C5 Negroni
+FFE5A0 Cream Brulee
+FFE5B4 Peach
+FFE6C7 Tequila
+FFE772 Kournikova
+FFEAC8 Sandy Beach
+FFEAD4 Karry
+FFEC13 Broom
+FFEDBC Colonial White
+FFEED8 Derby
+FFEFA1 Vis Vis
+FFEFC1 Egg White
+FFEFD5 Papaya Whip
+FFEFEC Fair Pink
+FFF0DB Peach Cream
+FFF0F5 Lavender blush
+FFF14F Gorse
+FFF1B5 Buttermilk
+FFF1D8 Pink Lady
+FFF1EE Forget Me Not
+FFF1F9 Tutu
+FFF39D Picasso
+FFF3F1 Chardon
+FFF46E Paris Daisy
+FFF4CE Barley White
+FFF4DD Egg Sour
+FFF4E0 Sazerac
+FFF4E8 Serenade
+FFF4F3 Chablis
+FFF5EE Seashell Peach
+FFF5F3 Sauvignon
+FFF6D4 Milk Punch
+FFF6DF Varden
+FFF6F5 Rose White
+FFF8D1 Baja White
+FFF9E2 Gin Fizz
+FFF9E6 Early Dawn
+FFFACD Lemon Chiffon
+FFFAF4 Bridal Heath
+FFFBDC Scotch Mist
+FFFBF9 Soapstone
+FFFC99 Witch Haze
+FFFCEA Buttery White
+FFFCEE Island Spice
+FFFDD0 Cream
+FFFDE6 Chilean Heath
+FFFDE8 Travertine
+FFFDF3 Orchid White
+FFFDF4 Quarter Pearl Lusta
+FFFEE1 Half and Half
+FFFEEC Apricot White
+FFFEF0 Rice Cake
+FFFEF6 Black White
+FFFEFD Romance
+FFFF00 Yellow
+FFFF66 Laser Lemon
+FFFF99 Pale Canary
+FFFFB4 Portafino
+FFFFF0 Ivory
+FFFFFF White
+"""
+
+
+_color_names = None
+_classifiers = {}
+
+
+def get_color_table():
+    """Return the color table as a tuple of ((r, g, b), name) tuples.
+
+    The table is parsed from `_COLOR_DATA` on first use. It is also
+    available as the module attribute `color_names`.
+
+    """
+    global _color_names
+    if _color_names is None:
+        _color_names = tuple((tuple(bytearray.fromhex(line[:6])), line[7:])
+                             for line in _COLOR_DATA.splitlines())
+    return _color_names
+
+
+def __getattr__(name):
+    if name == 'color_names':
+        return get_color_table()
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def get_classifier(metric='rgb'):
+    """Return the (cached) ColorClassifier for `color_names` using `metric`."""
+    if metric not in _classifiers:
+        _classifiers[metric] = ColorClassifier(get_color_table(), metric)
+    return _classifiers[metric]
+
+
+def get_color_name(r, g, b, max_dist=50, classifier=None, metric='rgb'):
+    if classifier is None:
+        classifier = get_classifier(metric)
     return classifier.classify(r, g, b, max_dist)
 
 
-__all__ = ('get_color_name',)
+def get_color_names(rgb_array, max_dist=50, classifier=None, metric='rgb'):
+    """Return names and distances of closest matches for a sequence of colors.
+
+    `rgb_array` is an N x 3 array or sequence of (r, g, b) triplets. Returns a
+    list of names, with None for colors without a match closer than
+    `max_dist`, and the distances to the closest color table entries.
+
+    """
+    if classifier is None:
+        classifier = get_classifier(metric)
+
+    if not _have_numpy():
+        names, dists = [], []
+        for r, g, b in rgb_array:
+            # like nearest_many(), always return distance to the closest entry
+            idx, distance = classifier.nearest(r, g, b, None)
+            match = max_dist is None or distance < max_dist
+            names.append(classifier.data[idx][1] if match else None)
+            dists.append(distance)
+        return names, dists
+
+    indices, dists = classifier.nearest_many(rgb_array, max_dist)
+    data = classifier.data
+    return [data[idx][1] if idx >= 0 else None for idx in indices], dists
+
+
+_lookup_tables = {}
+
+
+def get_lookup_table(bits=6, metric='rgb'):
+    """Return the (cached) ColorLookupTable with given bits per channel and metric."""
+    if (bits, metric) not in _lookup_tables:
+        _lookup_tables[(bits, metric)] = ColorLookupTable(get_classifier(metric), bits)
+    return _lookup_tables[(bits, metric)]
+
+
+__all__ = ('get_classifier', 'get_color_table', 'get_color_name', 'get_color_names', 'get_lookup_table')
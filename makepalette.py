@@ -8,26 +8,267 @@
 from __future__ import print_function, unicode_literals
 
 import argparse
+import hashlib
+import json
 import logging
+import math
+import os
+import sqlite3
 import sys
 import time
 
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from operator import itemgetter
-from os.path import basename, splitext
+from os.path import basename, expanduser, isdir, join, splitext
 
 from colorthief import ColorThief
-from colornames import get_color_name
+from colornames import get_color_names
+from PIL import Image
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 log = logging.getLogger(__file__)
 
+ENGINES = ('colorthief', 'mediancut', 'kmeans')
+# Images are reduced to at most this many pixels before palette extraction
+# with the NumPy engines
+MAX_PIXELS = 512 * 512
+# Number of bits per channel of the color histogram used by the NumPy engines
+HIST_BITS = 5
+CACHE_DB = join(os.environ.get("XDG_CACHE_HOME", expanduser("~/.cache")),
+                "makepalette", "palettes.sqlite")
+CACHE_SCHEMA_SQL = """\
+CREATE TABLE IF NOT EXISTS palettes (
+    key TEXT PRIMARY KEY,
+    palette TEXT NOT NULL,
+    last_used REAL NOT NULL
+);
+"""
+CACHE_EVICT_SQL = """\
+DELETE FROM palettes WHERE key IN (
+    SELECT key FROM palettes ORDER BY last_used DESC LIMIT -1 OFFSET ?
+);
+"""
+
+
+class PaletteCache(object):
+    """Persistent cache of extracted palettes with LRU eviction.
+
+    Entries are keyed by the SHA-256 hash of the image file contents and the
+    palette extraction parameters. At most `max_entries` palettes are kept,
+    the least recently used ones are removed first.
+
+    """
+
+    def __init__(self, filename=CACHE_DB, max_entries=1000):
+        dirname = os.path.dirname(filename)
+        if dirname and not isdir(dirname):
+            os.makedirs(dirname)
+
+        self.max_entries = max_entries
+        self.db = sqlite3.connect(filename)
+        self.db.execute(CACHE_SCHEMA_SQL)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @staticmethod
+    def make_key(filename, max_colors, accuracy, engine, seed):
+        digest = hashlib.sha256()
+        with open(filename, 'rb') as fp:
+            for block in iter(lambda: fp.read(1 << 20), b''):
+                digest.update(block)
+
+        # the seed only affects the k-means engine
+        return "%s:%i:%i:%s:%i" % (digest.hexdigest(), max_colors, accuracy, engine,
+                                   seed if engine == 'kmeans' else 0)
+
+    def get(self, key):
+        row = self.db.execute("SELECT palette FROM palettes WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+
+        with self.db:
+            self.db.execute("UPDATE palettes SET last_used = ? WHERE key = ?",
+                            (time.time(), key))
+        return [tuple(color) for color in json.loads(row[0])]
+
+    def put(self, key, palette):
+        with self.db:
+            self.db.execute("INSERT OR REPLACE INTO palettes VALUES (?, ?, ?)",
+                            (key, json.dumps(palette), time.time()))
+            self.db.execute(CACHE_EVICT_SQL, (self.max_entries,))
+
+    def close(self):
+        self.db.close()
+
+
+def extract_palette(filename, max_colors, accuracy, engine='colorthief', seed=0):
+    """Return (palette, seconds) for an image file; used as batch worker."""
+    start = time.time()
+    palette = get_palette(filename, max_colors, accuracy, engine, seed)
+    return palette, time.time() - start
+
+
+def get_palette(filename, max_colors, accuracy, engine='colorthief', seed=0):
+    log.info("Reading image file '%s'...", filename)
+
+    if engine == 'colorthief':
+        image = ColorThief(filename)
+        log.info("Calculating palette of max. %i colors with accuracy = %i ...",
+                 max_colors, accuracy)
+        return image.get_palette(max_colors, accuracy)
+
+    if np is None:
+        raise ImportError("The '%s' engine requires NumPy." % engine)
+
+    colors, counts = color_histogram(load_pixels(filename, accuracy))
+
+    if not len(colors):
+        return []
+
+    log.info("Calculating palette of max. %i colors from %i distinct colors with "
+             "'%s' engine ...", max_colors, len(colors), engine)
+
+    if engine == 'mediancut':
+        palette = median_cut(colors, counts, max_colors)
+    else:
+        palette = kmeans(colors, counts, max_colors, seed=seed)
+
+    return [tuple(int(c) for c in color) for color in palette]
+
+
+def load_pixels(filename, accuracy=1, max_pixels=MAX_PIXELS):
+    """Return downsampled pixels of an image as an N x 3 uint8 array.
+
+    Like ColorThief, mostly transparent and almost white pixels are left out
+    and only every `accuracy`-th pixel is used.
+
+    """
+    image = Image.open(filename)
+    width, height = image.size
+    factor = max(1, int(math.ceil(math.sqrt(width * height / float(max_pixels)))))
+
+    if factor > 1:
+        # let the JPEG decoder do most of the downscaling, if applicable
+        image.draft('RGB', (width // factor, height // factor))
+        factor = max(1, int(math.ceil(math.sqrt(image.size[0] * image.size[1] /
+                                                float(max_pixels)))))
+
+    has_alpha = 'A' in image.getbands() or 'transparency' in image.info
+    image = image.convert('RGBA' if has_alpha else 'RGB')
+
+    if factor > 1:
+        image = image.reduce(factor)
+
+    pixels = np.asarray(image).reshape(-1, 4 if has_alpha else 3)[::accuracy]
+
+    if has_alpha:
+        pixels = pixels[pixels[:, 3] >= 125, :3]
+
+    return pixels[~(pixels > 250).all(axis=1)]
+
+
+def color_histogram(pixels, bits=HIST_BITS):
+    """Return the mean colors and pixel counts of the populated histogram bins."""
+    shift = 8 - bits
+    # widen before shifting, uint8 would overflow
+    q = (pixels >> shift).astype(np.intp)
+    bins = (q[:, 0] << 2 * bits) | (q[:, 1] << bits) | q[:, 2]
+    size = 1 << 3 * bits
+    counts = np.bincount(bins, minlength=size)
+    used = np.flatnonzero(counts)
+    sums = np.stack([np.bincount(bins, weights=pixels[:, i], minlength=size)[used]
+                     for i in range(3)], axis=1)
+    return sums / counts[used, np.newaxis], counts[used]
+
+
+def median_cut(colors, counts, max_colors):
+    """Median cut quantization of weighted colors.
+
+    Like MMCQ, the box with the largest population is split first until 75%
+    of the colors are found, then the box with the largest product of
+    population and volume. Returns the box colors by descending population.
+
+    """
+    boxes = [np.arange(len(colors))]
+
+    def population(box):
+        return counts[box].sum()
+
+    def volume(box):
+        return np.prod(np.ptp(colors[box], axis=0) + 1)
+
+    while len(boxes) < max_colors:
+        splittable = [i for i, box in enumerate(boxes) if len(box) > 1]
+        if not splittable:
+            break
+
+        if len(boxes) < max_colors * 0.75:
+            priority = population
+        else:
+            priority = lambda box: population(box) * volume(box)
+
+        box = boxes.pop(max(splittable, key=lambda i: priority(boxes[i])))
+        # split along the axis with the largest range at the weighted median
+        axis = np.argmax(np.ptp(colors[box], axis=0))
+        box = box[np.argsort(colors[box, axis], kind='stable')]
+        cumulative = np.cumsum(counts[box])
+        split = int(np.searchsorted(cumulative, cumulative[-1] / 2.0)) + 1
+        split = min(max(split, 1), len(box) - 1)
+        boxes.extend((box[:split], box[split:]))
+
+    boxes.sort(key=population, reverse=True)
+    return [np.average(colors[box], axis=0, weights=counts[box]).round() for box in boxes]
+
+
+def kmeans(colors, counts, max_colors, seed=0, max_iter=30):
+    """Weighted k-means clustering of colors with k-means++ seeding.
+
+    The random generator is seeded with `seed`, so results are
+    reproducible. Returns the cluster centers by descending population.
+
+    """
+    rng = np.random.default_rng(seed)
+    k = min(max_colors, len(colors))
+    weights = counts / float(counts.sum())
+    centers = [colors[rng.choice(len(colors), p=weights)]]
+    d2 = ((colors - centers[0]) ** 2).sum(axis=1)
+
+    for _ in range(1, k):
+        p = weights * d2
+        if p.sum() == 0:
+            break
+        centers.append(colors[rng.choice(len(colors), p=p / p.sum())])
+        d2 = np.minimum(d2, ((colors - centers[-1]) ** 2).sum(axis=1))
 
-def get_palette(filename, max_colors, accuracy):
-    log.info("Reading image file '%s'...", args.image_file)
-    image = ColorThief(filename)
-    log.info("Calculating palette of max. %i colors with accuracy = %i ...",
-             max_colors, accuracy)
-    return image.get_palette(max_colors, accuracy)
+    centers = np.array(centers)
+
+    for _ in range(max_iter):
+        labels = (((colors[:, np.newaxis] - centers) ** 2).sum(axis=2)).argmin(axis=1)
+        population = np.bincount(labels, weights=counts, minlength=len(centers))
+        sums = np.stack([np.bincount(labels, weights=counts * colors[:, i],
+                                     minlength=len(centers)) for i in range(3)], axis=1)
+        used = population > 0
+        new_centers = sums[used] / population[used, np.newaxis]
+
+        if len(new_centers) == len(centers) and np.allclose(new_centers, centers, atol=0.5):
+            centers = new_centers
+            break
+
+        centers = new_centers
+
+    labels = (((colors[:, np.newaxis] - centers) ** 2).sum(axis=2)).argmin(axis=1)
+    population = np.bincount(labels, weights=counts, minlength=len(centers))
+    return list(centers[np.argsort(-population, kind='stable')].round())
 
 
 def luminance(r, g, b):
@@ -35,6 +276,21 @@ def luminance(r, g, b):
     return (r * 0.2125 + g * 0.7154 + b + 0.0721) * 0.5
 
 
+def find_images(paths):
+    """Return list of image files given as files or contained in directories."""
+    extensions = Image.registered_extensions()
+    images = []
+
+    for path in paths:
+        if isdir(path):
+            images.extend(sorted(join(path, fn) for fn in os.listdir(path)
+                                 if splitext(fn)[1].lower() in extensions))
+        else:
+            images.append(path)
+
+    return images
+
+
 def rgb_to_hsb(r, g, b):
     """Convert the given RGB values to HSB (between 0.0-1.0)."""
     h, s, v = 0, 0, max(r, g, b)
@@ -55,40 +311,198 @@ def rgb_to_hsb(r, g, b):
     return h, s, v
 
 
+SORT_METHODS = {
+    'luminance': ("Sort by luminance", lambda color: luminance(*color)),
+    'red': ("Sort by red component", itemgetter(0)),
+    'green': ("Sort be green component", itemgetter(1)),
+    'blue': ("Sort by blue component", itemgetter(2)),
+    'hue': ("Sort by hue", lambda color: rgb_to_hsb(*color)[0]),
+    'saturation': ("Sort by saturation", lambda color: rgb_to_hsb(*color)[1]),
+    'brightness': ("Sort by brightness", lambda color: rgb_to_hsb(*color)[2]),
+    'dominance': ('Sort by dominance', lambda color: color),
+}
+
+
+def sort_palette(palette, sort):
+    if sort and sort.rstrip('-') in SORT_METHODS:
+        reverse = sort.endswith('-')
+        method = sort.rstrip('-')
+        log.info("Sorting colors by '%s' method in %s order.", method,
+                 'descending' if reverse else 'ascending')
+        palette = sorted(palette, key=SORT_METHODS[method][1], reverse=reverse)
+
+    return palette
+
+
+def write_palette(palette_fn, palette_name, palette, columns, find_names=None,
+                  name_metric='rgb'):
+    log.info("Writing GIMP palette file to '%s'...", palette_fn)
+    with open(palette_fn, 'w') as gpl:
+        gpl.write('GIMP Palette\n')
+        gpl.write('Name: %s\n' % palette_name)
+        gpl.write('Columns: %i\n#\n' % columns)
+
+        if find_names is not None:
+            color_names, _ = get_color_names(palette, find_names, metric=name_metric)
+        else:
+            color_names = [None] * len(palette)
+
+        for i, ((red, green, blue), color_name) in enumerate(zip(palette, color_names)):
+            if find_names is not None and not color_name:
+                log.warning("No name match found for color (%i, %i, %i).",
+                            red, green, blue)
+            if not color_name:
+                color_name = "%s No. %i" % (palette_name, i + 1)
+
+            gpl.write("%s %s %s %s\n" % (red, green, blue, color_name))
+
+
+def batch(args, cache=None):
+    """Extract palettes of many images in parallel and write them."""
+    images = find_images(args.files)
+
+    if not images:
+        log.error("No image files found.")
+        return 2
+
+    palettes = {}
+    keys = {}
+    failed = 0
+    start = time.time()
+
+    if cache:
+        for filename in images:
+            try:
+                keys[filename] = cache.make_key(filename, args.max_colors, args.accuracy,
+                                                args.engine, args.seed)
+            except (IOError, OSError):
+                continue
+
+            palette = cache.get(keys[filename])
+            if palette is not None:
+                log.info("Using cached palette for '%s'.", filename)
+                palettes[filename] = palette
+
+    pending = [filename for filename in images if filename not in palettes]
+    log.info("Processing %i image files with %s parallel jobs...", len(pending),
+             args.jobs or os.cpu_count())
+
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        futures = {pool.submit(extract_palette, filename, args.max_colors, args.accuracy,
+                               args.engine, args.seed): filename
+                   for filename in pending}
+
+        for i, future in enumerate(as_completed(futures)):
+            filename = futures[future]
+            try:
+                palettes[filename], seconds = future.result()
+            except Exception as exc:
+                failed += 1
+                log.error("Could not process image file '%s': %s", filename, exc)
+            else:
+                log.info("[%i/%i] Found %i colors in '%s' in %.2f seconds.", i + 1,
+                         len(pending), len(palettes[filename]), filename, seconds)
+
+                if filename in keys:
+                    cache.put(keys[filename], palettes[filename])
+
+    log.info("Processed %i image files in %.2f seconds.", len(pending), time.time() - start)
+
+    if args.merge:
+        merged = []
+        for filename in images:
+            merged.extend(color for color in palettes.get(filename, ())
+                          if color not in merged)
+        outputs = [(args.merge, args.palette_name or
+                    splitext(basename(args.merge))[0], merged)]
+    else:
+        outputs = []
+        used = set()
+        stems = Counter(splitext(basename(filename))[0] for filename in palettes)
+        for filename in images:
+            if filename in palettes:
+                filebase = splitext(basename(filename))[0]
+
+                # keep the extension if images with the same stem would share a palette file
+                if stems[filebase] > 1:
+                    filebase = basename(filename)
+
+                # same file name in different directories
+                name, i = filebase, 1
+                while name in used:
+                    i += 1
+                    name = "%s-%i" % (filebase, i)
+
+                if name != splitext(basename(filename))[0]:
+                    log.warning("Palette of '%s' is written to '%s.gpl' to avoid overwriting "
+                                "another palette.", filename, name)
+
+                used.add(name)
+                palette_fn = join(args.output_dir or '', name + '.gpl')
+                outputs.append((palette_fn, name, palettes[filename]))
+
+    if args.output_dir and not isdir(args.output_dir):
+        os.makedirs(args.output_dir)
+
+    for palette_fn, palette_name, palette in outputs:
+        try:
+            write_palette(palette_fn, palette_name, sort_palette(palette, args.sort),
+                          args.columns, args.find_names, args.name_metric)
+        except (IOError, OSError) as exc:
+            failed += 1
+            log.error("Could not write to palette file '%s': %s", palette_fn, exc)
+
+    return 1 if failed else 0
+
+
 def main(args=None):
-    sort_methods = {
-        'luminance': ("Sort by luminance", lambda color: luminance(*color)),
-        'red': ("Sort by red component", itemgetter(0)),
-        'green': ("Sort be green component", itemgetter(1)),
-        'blue': ("Sort by blue component", itemgetter(2)),
-        'hue': ("Sort by hue", lambda color: rgb_to_hsb(*color)[0]),
-        'saturation': ("Sort by saturation", lambda color: rgb_to_hsb(*color)[1]),
-        'brightness': ("Sort by brightness", lambda color: rgb_to_hsb(*color)[2]),
-        'dominance': ('Sort by dominance', lambda color: color),
-    }
     ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
     ap.add_argument('-a', '--accuracy', type=int, default=10,
                     help="Accuracy of algorithm (1=best/slowest, default: %(default)s)")
+    ap.add_argument('-b', '--batch', action="store_true",
+                    help="Batch mode: process all given image files and image files in "
+                         "given directories and write a palette file for each.")
+    ap.add_argument('-C', '--cache-size', type=int, default=1000, metavar='NUM',
+                    help="Max. number of palettes kept in the palette cache "
+                         "(default: %(default)s)")
     ap.add_argument('-c', '--columns', type=int, default=8,
                     help="Number of colors per row (default: %(default)s)")
+    ap.add_argument('-e', '--engine', default='colorthief', choices=ENGINES,
+                    help="Palette extraction engine: ColorThief (pure Python MMCQ) or "
+                         "median cut / k-means on a downsampled image using NumPy "
+                         "(default: %(default)s)")
+    ap.add_argument('-g', '--merge', metavar='PALETTEFILE',
+                    help="Batch mode: write the colors of all images to one palette file.")
+    ap.add_argument('-j', '--jobs', type=int,
+                    help="Batch mode: max. number of parallel jobs (default: number of CPUs)")
     ap.add_argument('-l', '--find-names', type=int, metavar='DISTANCE',
                     help="Set label of each color to nearest match from a built-in "
                          "list of about 1500 colors. DISTANCE is the maximum allowed "
                          "distance for a match (0 - 255, try 20).")
+    ap.add_argument('-M', '--name-metric', default='rgb',
+                    choices=('rgb', 'de76', 'de2000'),
+                    help="Color difference metric for --find-names: RGB distance or "
+                         "CIE76 / CIEDE2000 Delta E (default: %(default)s, try 5 for "
+                         "Delta E metrics).")
     ap.add_argument('-m', '--max-colors', type=int, default=10,
                     help="Maximum number of colors in the palette (default: %(default)s)")
+    ap.add_argument('-N', '--no-cache', action="store_true",
+                    help="Do not use or update the palette cache.")
     ap.add_argument('-n', '--palette-name',
                     help="Name of new palette (default: image file base name)")
+    ap.add_argument('-o', '--output-dir', metavar='DIR',
+                    help="Batch mode: directory for palette files (default: current dir)")
+    ap.add_argument('-S', '--seed', type=int, default=0,
+                    help="Random seed for the 'kmeans' engine (default: %(default)s)")
     ap.add_argument('-s', '--sort', metavar='METHOD', default='dominance',
-                    choices=list(sort_methods) + ['help'],
+                    choices=list(SORT_METHODS) + ['help'],
                     help="Sort color by given method (default: %(default)s). "
                          "Use '--sort help' to show available methods.")
     ap.add_argument('-v', '--verbose', action="store_true",
                     help="Be verbose about what the script does.")
-    ap.add_argument('image_file', metavar='IMAGEFILE', nargs='?',
-                    help="Image file name")
-    ap.add_argument('palette_file', nargs='?', metavar='PALETTEFILE',
-                    help="Palette file name")
+    ap.add_argument('files', metavar='IMAGEFILE [PALETTEFILE]', nargs='*',
+                    help="Image file name and optional palette file name. In batch mode: "
+                         "image file names and/or directories.")
 
     args = ap.parse_args(args if args is not None else sys.argv[1:])
 
@@ -97,57 +511,78 @@ def main(args=None):
 
     if args.sort == 'help':
         print("Color sorting methods:\n")
-        for name in sorted(sort_methods):
-            print("%-15s - %s" % (name, sort_methods[name][0]))
+        for name in sorted(SORT_METHODS):
+            print("%-15s - %s" % (name, SORT_METHODS[name][0]))
 
         print()
         print("Suffix method with a '-' to sort in reversed (i.e. descending)")
         print("order, e.g. 'red-'.")
         return
 
-    if not args.image_file:
+    if not args.files:
         ap.print_help()
         return 2
 
+    if len(args.files) > 2 and not (args.batch or args.merge):
+        ap.error("Only one image file allowed without --batch.")
+
+    cache = None
+    if not args.no_cache:
+        try:
+            cache = PaletteCache(max_entries=args.cache_size)
+        except (OSError, sqlite3.Error) as exc:
+            log.warning("Could not open palette cache: %s", exc)
+
     try:
-        start = time.time()
-        log.info("Calculating palette of max. %i colors with accuracy = %i ...",
-                 args.max_colors, args.accuracy)
-        palette = get_palette(args.image_file, args.max_colors, args.accuracy)
-    except Exception as exc:
-        return "Could not process image file '%s': %s" % (args.image_file, exc)
-    else:
-        log.debug("Found %i colors in %.2f seconds." %
-                  (len(palette), time.time() - start))
+        if args.batch or args.merge:
+            return batch(args, cache)
 
-    filebase = splitext(basename(args.image_file))[0]
-    palette_name = args.palette_name if args.palette_name else filebase
-    palette_fn = args.palette_file if args.palette_file else filebase + '.gpl'
+        return process_image(args, cache)
+    finally:
+        if cache:
+            cache.close()
 
-    if args.sort and args.sort in sort_methods:
-        reverse = args.sort.endswith('-')
-        method = args.sort.rstrip('-')
-        log.info("Sorting colors by '%s' method in %s order.", method,
-                 'descending' if reversed else 'ascending')
-        palette = sorted(palette, key=sort_methods[method][1], reverse=reverse)
+
+def process_image(args, cache=None):
+    """Extract the palette of a single image and write it."""
+    image_file = args.files[0]
+    palette_file = args.files[1] if len(args.files) > 1 else None
+    palette = key = None
+
+    if cache:
+        try:
+            key = cache.make_key(image_file, args.max_colors, args.accuracy,
+                                 args.engine, args.seed)
+        except (IOError, OSError) as exc:
+            return "Could not read image file '%s': %s" % (image_file, exc)
+
+        palette = cache.get(key)
+        if palette is not None:
+            log.info("Using cached palette for '%s'.", image_file)
+
+    if palette is None:
+        try:
+            start = time.time()
+            log.info("Calculating palette of max. %i colors with accuracy = %i ...",
+                     args.max_colors, args.accuracy)
+            palette = get_palette(image_file, args.max_colors, args.accuracy,
+                                  args.engine, args.seed)
+        except Exception as exc:
+            return "Could not process image file '%s': %s" % (image_file, exc)
+        else:
+            log.debug("Found %i colors in %.2f seconds." %
+                      (len(palette), time.time() - start))
+
+        if key:
+            cache.put(key, palette)
+
+    filebase = splitext(basename(image_file))[0]
+    palette_name = args.palette_name if args.palette_name else filebase
+    palette_fn = palette_file if palette_file else filebase + '.gpl'
 
     try:
-        log.info("Writing GIMP palette file to '%s'...", palette_fn)
-        with open(palette_fn, 'w') as gpl:
-            gpl.write('GIMP Palette\n')
-            gpl.write('Name: %s\n' % palette_name)
-            gpl.write('Columns: %i\n#\n' % args.columns)
-
-            for i, (red, green, blue) in enumerate(palette):
-                if args.find_names is not None:
-                    color_name = get_color_name(red, green, blue, args.find_names)
-                    if not color_name:
-                        log.warning("No name match found for color (%i, %i, %i).",
-                                    red, green, blue)
-                if not args.find_names is not None or not color_name:
-                    color_name = "%s No. %i" % (palette_name, i + 1)
-
-                gpl.write("%s %s %s %s\n" % (red, green, blue, color_name))
+        write_palette(palette_fn, palette_name, sort_palette(palette, args.sort),
+                      args.columns, args.find_names, args.name_metric)
     except (IOError, OSError) as exc:
         return "Could not write to palette file '%s': %s" % (palette_fn, exc)
 
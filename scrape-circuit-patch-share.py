@@ -2,6 +2,7 @@
 """Scrape Novation Circuit SysEx patch data from HTML saved from Circuit Patch Share site."""
 
 import argparse
+import io
 import logging
 import os
 import re
@@ -9,8 +10,24 @@ import sys
 from os.path import exists, join
 from base64 import b64decode
 
+from sysex import recognize
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 log = logging.getLogger('scrape-circuit-patch-share')
+# Number of characters read from the HTML file at once
+CHUNK_SIZE = 1 << 16
+# Max. length of an unfinished patch call carried over to the next chunk
+MAX_CARRY = 1 << 20
+PATCH_MARKER = "sendPatchToCircuit("
+PATCH_RX = re.compile(r"sendPatchToCircuit\('(.*?)',\s*atob\('(.*?)'\),\s*(\d+)\)")
+ENTITY_RX = re.compile(r'&#(\d+);')
+# matches at end of text only if it ends with an unfinished entity
+PARTIAL_ENTITY_RX = re.compile(r'(&(#\d*)?)?$')
 
 
 def safe_name(name):
@@ -21,19 +38,88 @@ def unescape(match):
     return chr(int(match.group(1)))
 
 
-def scrape_patches(html):
-    html = re.sub('&#(\d+);', unescape, html)
-    patches = re.findall(r"sendPatchToCircuit\('(.*?)',\s*atob\('(.*?)'\),\s*(\d+)\)", html)
+def decode_patch(payload):
+    """Decode base64-encoded comma-separated list of byte values."""
+    values = b64decode(payload)
+
+    if np is not None:
+        # parse wider than uint8, which would silently wrap invalid values
+        data = np.fromstring(values, dtype=np.int64, sep=',')
+
+        if len(data) != values.count(b',') + 1:
+            raise ValueError("Invalid byte value list in patch data.")
+
+        if len(data) and (data.min() < 0 or data.max() > 0xFF):
+            raise ValueError("Byte value out of range in patch data.")
+
+        return bytearray(data.astype(np.uint8).tobytes())
+
+    return bytearray([int(c) for c in values.split(b',')])
+
+
+def _match_patches(text, seen):
+    # return list of patches in text not seen before and end of last match
+    patches = []
+    pos = 0
+
+    for match in PATCH_RX.finditer(text):
+        name, payload, synth = match.groups()
+        key = (name.strip(), int(synth))
+        pos = match.end()
+
+        if key not in seen:
+            seen.add(key)
+            patches.append(key + (decode_patch(payload),))
+
+    return patches, pos
 
-    result = {}
-    for name, patch, synth in patches:
-        name = name.strip()
-        if name in result:
-            continue
 
-        result[(name, int(synth))] = bytearray([int(c) for c in b64decode(patch).split(b',')])
+def iter_patches(fp, chunk_size=CHUNK_SIZE):
+    """Yield (name, synth, data) for each patch found in HTML file object fp.
 
-    return result
+    Only the first patch with a given name for a synth is yielded. The file is
+    read in chunks of `chunk_size` characters. Character entities and patch
+    data split across chunks are carried over to the next one, so only about
+    one chunk has to be held in memory at once.
+
+    """
+    seen = set()
+    pending = ''
+    carry = ''
+
+    for chunk in iter(lambda: fp.read(chunk_size), ''):
+        # hold back an entity which may continue in the next chunk
+        text = pending + chunk
+        cut = PARTIAL_ENTITY_RX.search(text).start()
+        text, pending = text[:cut], text[cut:]
+        buf = carry + ENTITY_RX.sub(unescape, text)
+        patches, pos = _match_patches(buf, seen)
+
+        for patch in patches:
+            yield patch
+
+        # keep possibly incomplete patch call (or start of marker) at the end
+        start = buf.find(PATCH_MARKER, pos)
+
+        # calls too long to be valid are never completed, skip them
+        while start != -1 and len(buf) - start > MAX_CARRY:
+            start = buf.find(PATCH_MARKER, start + 1)
+
+        if start == -1:
+            start = max(pos, len(buf) - len(PATCH_MARKER) + 1)
+
+        carry = buf[start:]
+
+    patches, _ = _match_patches(carry + ENTITY_RX.sub(unescape, pending), seen)
+
+    for patch in patches:
+        yield patch
+
+
+def scrape_patches(html):
+    """Return dict mapping (name, synth) to data of all patches in html."""
+    return {(name, synth): data
+            for name, synth, data in iter_patches(io.StringIO(html))}
 
 
 def main(args=None):
@@ -48,27 +134,34 @@ def main(args=None):
     logging.basicConfig(format="%(levelname)s: %(message)s",
         level=logging.DEBUG if args.verbose else logging.INFO)
 
+    found = 0
+    i = 0
+
     with open(args.html) as fp:
-        html = fp.read()
+        for name, synth, data in iter_patches(fp):
+            found += 1
+            recognizer = recognize(data)
 
-    patches = scrape_patches(html)
-    log.info("Found %i patches.", len(patches))
+            if recognizer is None or recognizer.synth != 'circuit':
+                log.warning("Data of patch '%s' is not a Novation Circuit patch, skipping.", name)
+                continue
 
+            outdir = join(args.output_dir, "Synth %i" % (synth + 1,))
 
-    for i, ((name, synth), data) in enumerate(sorted(patches.items())):
-        outdir = join(args.output_dir, "Synth %i" % (synth + 1,))
+            if not exists(outdir):
+                os.makedirs(outdir)
 
-        if not exists(outdir):
-            os.makedirs(outdir)
+            outfn = join(outdir, "%s.syx" % safe_name(name))
+            log.info("Writing patch '%s' to '%s'...", name, outfn)
 
-        outfn = join(outdir, "%s.syx" % safe_name(name))
-        log.info("Writing patch '%s' to '%s'...", name, outfn)
+            data[recognizer.slot_offset] = synth
+            with open(outfn, 'wb') as fp_out:
+                fp_out.write(data)
 
-        data[7] = synth
-        with open(outfn, 'wb') as fp:
-            fp.write(patches[(name, synth)])
+            i += 1
 
-    log.info("%i patch files written.", i + 1)
+    log.info("Found %i patches.", found)
+    log.info("%i patch files written.", i)
     return 0
 
 
@@ -8,6 +8,22 @@ The bulk file is split into patches and for each patch a separate file is
 written in the current directory  with each filename showing the patch name
 and optionally the program number, i.e. "The Voice.syx" or "001_The_Voice.syx".
 
+Patches of all synths known to sysex.py (currently Yamaha AN1x voices and
+Novation Circuit patches) are recognized, so dumps with patches of several
+synths can be split in one go. Use --synth to only split patches of some.
+
+With --check, the checksums of all patches are only verified, with --repair
+invalid checksums are fixed in the written patches. With --bulk, the checksums
+of all patches of the same synth and length are calculated at once with NumPy.
+
+The bulk file is memory-mapped and patches are written directly from it (see
+sysex.py), so even huge archive dumps are not read into memory.
+
+With --index, written patches are recorded in an SQLite database together with
+a hash of their contents (with program slot and checksum masked out) and
+patches already in the index, e.g. from other bank files, are not written
+again. Use --query to search the index for patch names.
+
 Uses only minimal error checking and existing files may be overwritten, so
 USE AT YOUR OWN RISK!
 
@@ -16,31 +32,268 @@ USE AT YOUR OWN RISK!
 import sys
 import argparse
 import os
-from os.path import exists, join
+import sqlite3
+from collections import defaultdict
+from os.path import abspath, dirname, exists, expanduser, isdir, join
+
+import sysex
+from sysex import RECOGNIZERS, escape, iter_messages, mapped_file, recognize, write_message
 
 
-__usage__ = "Usage: %(prog)s SYSEXFILE"
+__usage__ = "Usage: %(prog)s SYSEXFILE [OUTPUT_DIR] | --query NAME"
 
-PATCHNAME_OFFSET = 9
-PATCHNAME_LEN = 10
-PATCHSLOT_OFFSET = 7
 PY3 = sys.version_info[:2] >= (3, 0)
+SYNTHS = sorted(set(r.synth for r in RECOGNIZERS.values()))
+INDEX_DB = join(os.environ.get("XDG_DATA_HOME", expanduser("~/.local/share")),
+                "splitsyx", "patches.sqlite")
+INDEX_SCHEMA_SQL = """\
+CREATE TABLE IF NOT EXISTS patches (
+    hash TEXT PRIMARY KEY,
+    synth TEXT NOT NULL,
+    name TEXT NOT NULL,
+    source TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    filename TEXT
+);
+CREATE INDEX IF NOT EXISTS patches_name ON patches (name);
+"""
+INDEX_QUERY_SQL = """\
+SELECT synth, name, source, offset, filename FROM patches
+WHERE name LIKE ?
+ORDER BY synth, name, source, offset;
+"""
+
+
+class PatchIndex(object):
+    """SQLite index of written patches keyed by their normalized hash.
+
+    See Recognizer.digest() in sysex.py for how the hash is calculated.
+
+    """
+
+    def __init__(self, filename=INDEX_DB):
+        directory = dirname(filename)
+        if directory and not isdir(directory):
+            os.makedirs(directory)
+
+        self.db = sqlite3.connect(filename)
+        self.db.executescript(INDEX_SCHEMA_SQL)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def get(self, digest):
+        """Return (synth, name, source, offset, filename) of patch or None."""
+        return self.db.execute("SELECT synth, name, source, offset, filename "
+            "FROM patches WHERE hash = ?", (digest,)).fetchone()
+
+    def add(self, digest, synth, name, source, offset, filename=None):
+        self.db.execute("INSERT OR IGNORE INTO patches VALUES (?, ?, ?, ?, ?, ?)",
+            (digest, synth, name, source, offset, filename))
+
+    def query(self, name):
+        """Return rows of all patches with name containing `name`.
+
+        `name` may contain the SQL LIKE wildcards % and _. Matching is
+        case-insensitive (for ASCII letters).
+
+        """
+        return self.db.execute(INDEX_QUERY_SQL, ("%" + name + "%",)).fetchall()
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
+
+
+def get_recognizer(patch, args):
+    recognizer = recognize(patch)
+
+    if recognizer and (not args.synth or recognizer.synth in args.synth):
+        return recognizer
+
+
+def patch_checksums(recognizer, patch, edit_buffer=True):
+    """Return checksum of patch as is and with slot reset to edit buffer.
+
+    The latter is None if `edit_buffer` is False.
+
+    """
+    if recognizer.checksum_range is None:
+        return None, None
+
+    return (recognizer.checksum(patch),
+        recognizer.checksum(patch, recognizer.edit_buffer)
+        if edit_buffer and recognizer.edit_buffer else None)
+
+
+def bulk_checksums(data, messages, args):
+    """Return checksums of all patches in data as dict with offsets as keys.
+
+    `messages` is a list of (offset, length, recognizer) tuples of all
+    messages in data. Values are the same as returned by patch_checksums(),
+    but calculated for all patches of the same synth and length at once.
+
+    """
+    groups = defaultdict(list)
+
+    for offset, length, recognizer in messages:
+        if recognizer and recognizer.checksum_range is not None:
+            groups[(recognizer, length)].append(offset)
+
+    result = {}
+
+    for (recognizer, length), offsets in groups.items():
+        checksums = sysex.bulk_checksums(data, offsets, length,
+            *recognizer.checksum_range).tolist()
+
+        if recognizer.edit_buffer and not args.check:
+            edit_checksums = sysex.bulk_checksums(data, offsets, length,
+                *recognizer.checksum_range,
+                changes=recognizer.edit_buffer).tolist()
+        else:
+            edit_checksums = [None] * len(offsets)
+
+        result.update(zip(offsets, zip(checksums, edit_checksums)))
+
+    return result
+
+
+def split_patch(patch, i, args, recognizer, checksums=None, index=None,
+        offset=0):
+    """Check patch and write it to a file.
 
+    If a PatchIndex is given as `index`, the patch is not written if it is
+    already in the index, otherwise it is added to it with its `offset` in
+    the input file.
 
-def is_an1x_voice(data):
-    return (data[0] == 0xF0 and data[1] == 0x43 and
-        data[3] == 0x5C and data[2] >> 4 == 0 and
-        data[6]) == 0x11
+    Returns False if the patch has an invalid checksum, True otherwise, or
+    None if it is not a patch of a selected synth (i.e. recognizer is None).
 
+    """
+    if recognizer is None:
+        print (u"Sysex msg. %03i is not a patch dump of a selected synth." % i)
+        return
 
-def checksum(data, offset=4, end=-2):
-    return ~sum(data[offset:end]) + 1 & 0x7F
+    if checksums is None:
+        checksums = patch_checksums(recognizer, patch, not args.check)
 
+    checksum, edit_checksum = checksums
+    valid = checksum is None or patch[-2] == checksum
 
-def escape(s, chars=" /?*:;$\!"):
-    for c in chars:
-        s = s.replace(c, '_')
-    return s
+    if args.check and valid and not args.verbose:
+        return valid
+
+    patchname = recognizer.name(patch)
+
+    if args.verbose:
+        print (u"Read %s '%s' (%i bytes)." % (recognizer.description,
+            patchname, len(patch)))
+
+    if not valid:
+        print (u"%s: checksum of %s '%s' (msg. %03i) is invalid (0x%02X, "
+            "expected 0x%02X)." % ("Error" if args.check else "Warning",
+            recognizer.description, patchname, i, patch[-2], checksum))
+
+    if args.check:
+        return valid
+
+    if index is not None:
+        digest = recognizer.digest(patch)
+        duplicate = index.get(digest)
+
+        if duplicate:
+            print (u"Skipping %s '%s' (msg. %03i), duplicate of '%s' from "
+                "'%s' (offset %i)." % (recognizer.description, patchname, i,
+                duplicate[1], duplicate[2], duplicate[3]))
+            return valid
+
+    filename = escape(patchname.strip())
+    slot = recognizer.slot(patch)
+
+    if args.with_slots and slot is not None:
+        filename = u"%03i_%s.syx" % (slot + 1, filename)
+        changes = None if valid or not args.repair else {-2: bytearray([checksum])}
+    else:
+        filename += ".syx"
+        # reset slot to edit buffer and update checksum
+        changes = recognizer.edit_buffer_changes(patch, edit_checksum)
+
+    if args.output_dir:
+        if not exists(args.output_dir):
+            os.mkdir(args.output_dir)
+
+        filename = join(args.output_dir, filename)
+
+    if exists(filename) and not args.force:
+        print (u"Output file '%s' already exists and will not be "
+            "overwritten." % filename)
+        filename = None
+    else:
+        if args.verbose:
+            print (u"Writing data to file '%s'..." % filename)
+        with open(filename.encode('utf-8'), 'wb') as f:
+            write_message(f, patch, changes)
+
+    if index is not None:
+        index.add(digest, recognizer.synth, patchname.strip(),
+            abspath(args.sysex), offset, filename and abspath(filename))
+
+    return valid
+
+
+def query_index(args):
+    if not exists(args.index_db):
+        print (u"Index '%s' does not exist." % args.index_db)
+        return 1
+
+    with PatchIndex(args.index_db) as index:
+        rows = index.query(args.query)
+
+    for synth, name, source, offset, filename in rows:
+        print (u"%-8s %-16s %s (offset %i)%s" % (synth, name, source, offset,
+            u" -> " + filename if filename else u""))
+
+    print (u"%i patch(es) found." % len(rows))
+    return 0 if rows else 1
+
+
+def split_file(args, index=None):
+    results = []
+
+    with mapped_file(args.sysex) as data:
+        if args.bulk:
+            # find all messages first, then calculate checksums and split
+            messages = [(offset, len(patch), get_recognizer(patch, args))
+                for offset, patch in iter_messages(data)]
+            checksums = bulk_checksums(data, messages, args)
+
+            with memoryview(data) as view:
+                for i, (offset, length, recognizer) in enumerate(messages):
+                    sums = checksums.get(offset)
+
+                    # only checking: skip patches with valid checksum quickly
+                    if (args.check and not args.verbose and sums and
+                            data[offset + length - 2] == sums[0]):
+                        results.append(True)
+                        continue
+
+                    with view[offset:offset + length] as patch:
+                        results.append(split_patch(patch, i, args, recognizer,
+                            sums, index, offset))
+        else:
+            for i, (offset, patch) in enumerate(iter_messages(data)):
+                results.append(split_patch(patch, i, args,
+                    get_recognizer(patch, args), index=index, offset=offset))
+
+    invalid = results.count(False)
+
+    if invalid:
+        print (u"%i patch(es) with invalid checksum found." % invalid)
+
+    return 1 if args.check and invalid else 0
 
 
 def main(args=None):
@@ -54,58 +307,50 @@ def main(args=None):
     ap.add_argument('-f', '--force',
         action="store_true",
         help="Overwrite existing output files.")
-    ap.add_argument('sysex', help="Input AN1x voice bank sysex file.")
+    ap.add_argument('-S', '--synth',
+        action="append", choices=SYNTHS,
+        help="Only split patches of given synth (may be repeated).")
+    ap.add_argument('-c', '--check',
+        action="store_true",
+        help="Only verify checksums of patches and do not write any files.")
+    ap.add_argument('-r', '--repair',
+        action="store_true",
+        help="Fix invalid checksums of patches written with --with-slots.")
+    ap.add_argument('-b', '--bulk',
+        action="store_true",
+        help="Calculate checksums of all patches at once (requires NumPy).")
+    ap.add_argument('-i', '--index',
+        action="store_true",
+        help="Record written patches in index database and skip patches "
+             "already in it.")
+    ap.add_argument('-I', '--index-db',
+        default=INDEX_DB, metavar="DB",
+        help="Index database file (default: %(default)s).")
+    ap.add_argument('-q', '--query',
+        metavar="NAME",
+        help="List patches in index with names containing NAME and exit.")
+    ap.add_argument('sysex', nargs='?', help="Input sysex bank file.")
     ap.add_argument('output_dir', nargs='?',
         help="Output directory (created if it doesn't exist).")
 
     args = ap.parse_args(args if args is not None else sys.argv)
 
-    infile = open(args.sysex, 'rb')
-    data = infile.read()
-    infile.close()
-
-    # split patches
-    patches = [bytearray(p + b'\xF7') for p in data.split(b'\xF7')][:-1]
-
-    for i, patch in enumerate(patches):
-        if not is_an1x_voice(patch):
-            print (u"Sysex msg. %03i is not a Yamaha AN1x voice dump." % i)
-            continue
-
-        patchname = patch[PATCHNAME_OFFSET:PATCHNAME_OFFSET+PATCHNAME_LEN]
-        patchname = patchname.decode('latin1')
-
-        if args.verbose:
-            print (u"Read voice '%s' (%i bytes)." % (patchname, len(patch)))
-
-        filename = escape(patchname.strip())
+    if args.bulk and sysex.np is None:
+        ap.error("--bulk requires NumPy.")
 
-        if args.with_slots:
-            slot = ord(patch[PATCHSLOT_OFFSET])
-            filename = u"%03i_%s.syx" % (slot + 1, filename)
-        else:
-            filename += ".syx"
-            patch = bytearray(patch)
-            patch[6:9] = b'\x10\0\0'
-            patch[-2] = checksum(patch)
+    if args.query is not None:
+        return query_index(args)
 
-        if args.output_dir:
-            if not exists(args.output_dir):
-                os.mkdir(args.output_dir)
+    if not args.sysex:
+        ap.error("No input sysex file given.")
 
-            filename = join(args.output_dir, filename)
-
-        if exists(filename) and not args.force:
-            print (u"Output file '%s' already exists and will not be "
-                "overwritten." % filename)
-        else:
-            if args.verbose:
-                print (u"Writing data to file '%s'..." % filename)
-            f = open(filename.encode('utf-8'), 'wb')
-            f.write(patch)
-            f.close()
+    index = PatchIndex(args.index_db) if args.index and not args.check else None
 
-    return 0
+    try:
+        return split_file(args, index)
+    finally:
+        if index is not None:
+            index.close()
 
 
 if __name__ == '__main__':
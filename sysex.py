@@ -0,0 +1,362 @@
+#!/usr/bin/env python
+#
+# sysex.py
+#
+"""Read System Exclusive messages from (large) files without copying them.
+
+The input file is memory-mapped and the messages between the F0 and F7 markers
+are yielded as memoryview slices of the mapping. Messages can be checked and
+written to other files directly from these views, optionally with some bytes
+replaced (e.g. the program slot) and the checksum updated accordingly.
+
+Patch dumps of known synths are identified with recognize(), which looks up a
+Recognizer, describing the layout of the patch message, by manufacturer ID,
+model ID and message type. Support for more synths can be added with
+register().
+
+Used by splitsyx.py, an1x-splitsyx.py and scrape-circuit-patch-share.py.
+
+"""
+
+import hashlib
+import mmap
+import os
+from contextlib import contextmanager
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+SYSEX_START = b'\xF0'
+SYSEX_END = b'\xF7'
+
+# (manufacturer ID, model ID, message type) -> Recognizer
+RECOGNIZERS = {}
+# manufacturer ID -> (model ID offset, model ID length, message type offset)
+_LAYOUTS = {}
+# Max. number of messages bulk_checksums() copies into an array at once
+BULK_BATCH = 10000
+
+
+@contextmanager
+def mapped_file(filename):
+    """Memory-map the given file read-only.
+
+    Returns the mmap object (or an empty bytes object for an empty file) in a
+    context manager, which closes the mapping on exit. All views on it,
+    i.e. those yielded by iter_messages(), must be released before.
+
+    """
+    with open(filename, 'rb') as fp:
+        if os.fstat(fp.fileno()).st_size == 0:
+            yield b''
+            return
+
+        data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield data
+        finally:
+            data.close()
+
+
+def iter_messages(data):
+    """Yield (offset, message) for each SysEx message in data.
+
+    `data` must be a bytes-like object with a find() method, e.g. bytes or
+    an mmap object. Each message is a memoryview slice of `data` from the F0
+    byte up to and including the F7 byte. Bytes outside of messages are
+    skipped, and for an unterminated message followed by another F0 byte,
+    the message is re-synchronized to start at the latter.
+
+    The view is released when the next message is requested, so it must not
+    be used after that (copy it with bytes() if needed).
+
+    """
+    with memoryview(data) as view:
+        pos = 0
+
+        while True:
+            start = data.find(SYSEX_START, pos)
+
+            if start == -1:
+                break
+
+            end = data.find(SYSEX_END, start + 1)
+
+            if end == -1:
+                break
+
+            start = data.rfind(SYSEX_START, start, end)
+            msg = view[start:end + 1]
+
+            try:
+                yield start, msg
+            finally:
+                msg.release()
+
+            pos = end + 1
+
+
+def _normalize(changes, size):
+    # convert negative offsets of changes and return them sorted by offset
+    return sorted((offset % size, value) for offset, value in (changes or {}).items())
+
+
+def checksum(data, offset=4, end=-2, changes=None):
+    """Return 7-bit checksum (two's complement of sum) of data[offset:end].
+
+    `changes` may be a dict mapping offsets in `data` to bytes which will
+    replace the original ones (see write_message()). The checksum is then
+    calculated as if they had been replaced.
+
+    """
+    total = sum(data[offset:end])
+
+    if changes:
+        start, stop, _ = slice(offset, end).indices(len(data))
+
+        for pos, value in _normalize(changes, len(data)):
+            for i, byte in enumerate(value, pos):
+                if start <= i < stop:
+                    total += byte - data[i]
+
+    return ~total + 1 & 0x7F
+
+
+def bulk_checksums(data, offsets, length, offset=4, end=-2, changes=None):
+    """Return checksums of many messages of the same length as NumPy array.
+
+    The messages start at the given `offsets` in `data` (e.g. as returned by
+    iter_messages()) and are all `length` bytes long. They are copied into a
+    2-D array in batches of BULK_BATCH messages and the checksums of each
+    batch are computed in one vectorized operation. `offset`, `end` and
+    `changes` are the same as for checksum().
+
+    Requires NumPy.
+
+    """
+    buf = np.frombuffer(data, dtype=np.uint8)
+    start, stop, _ = slice(offset, end).indices(length)
+    columns = np.arange(start, stop)
+    offsets = np.asarray(offsets, dtype=np.intp)
+    result = np.empty(len(offsets), dtype=np.uint8)
+
+    for i in range(0, len(offsets), BULK_BATCH):
+        rows = buf[offsets[i:i + BULK_BATCH, None] + columns]
+
+        for pos, value in _normalize(changes, length):
+            for j, byte in enumerate(value, pos):
+                if start <= j < stop:
+                    rows[:, j - start] = byte
+
+        result[i:i + BULK_BATCH] = -rows.sum(axis=1, dtype=np.int64) & 0x7F
+
+    return result
+
+
+def _pieces(msg, changes):
+    # yield parts of msg with changes applied, unchanged parts as slices of msg
+    pos = 0
+
+    for offset, value in _normalize(changes, len(msg)):
+        yield msg[pos:offset]
+        yield value
+        pos = offset + len(value)
+
+    yield msg[pos:]
+
+
+def write_message(fp, msg, changes=None):
+    """Write message (or any bytes-like object) to the binary file object fp.
+
+    `changes` may be a dict mapping offsets in `msg` (negative offsets count
+    from the end) to bytes to write instead of the original ones. The
+    unchanged parts are written directly from `msg` without copying.
+
+    """
+    for piece in _pieces(msg, changes):
+        fp.write(piece)
+
+
+def escape(s, chars=" /?*:;$\\!"):
+    for c in chars:
+        s = s.replace(c, '_')
+    return s
+
+
+class Recognizer(object):
+    """Description of the patch dump message of a synth.
+
+    The message is identified by the manufacturer ID (one or three bytes after
+    the F0 byte), the model ID at `model_offset` and the message type byte at
+    `type_offset`, one of `types`. `accept` may be a function, which does
+    further checks on the message and returns False to reject it.
+
+    The patch name is stored in `name_len` bytes at `name_offset`, the program
+    slot, if any, at `slot_offset`. If the message has a checksum, it is
+    calculated over message[`checksum_range`] and stored in the byte before F7.
+    `edit_buffer` is a dict of changes (see write_message()), which make the
+    message address the edit buffer instead of a program slot.
+
+    """
+
+    def __init__(self, synth, description, manufacturer, model, model_offset,
+                 types, type_offset, name_offset, name_len, slot_offset=None,
+                 checksum_range=None, edit_buffer=None, accept=None):
+        self.synth = synth
+        self.description = description
+        self.manufacturer = bytes(manufacturer)
+        self.model = bytes(model)
+        self.model_offset = model_offset
+        self.types = tuple(types)
+        self.type_offset = type_offset
+        self.name_offset = name_offset
+        self.name_len = name_len
+        self.slot_offset = slot_offset
+        self.checksum_range = checksum_range
+        self.edit_buffer = edit_buffer
+        self.accept = accept
+
+    def __repr__(self):
+        return "<Recognizer %s (%s)>" % (self.synth, self.description)
+
+    def name(self, msg):
+        """Return patch name of message."""
+        name = bytes(msg[self.name_offset:self.name_offset + self.name_len])
+        return name.decode('latin1')
+
+    def slot(self, msg):
+        """Return program slot number (zero-based) of message or None."""
+        if self.slot_offset is not None:
+            return msg[self.slot_offset]
+
+    def checksum(self, msg, changes=None):
+        """Return checksum of message (with changes applied) or None."""
+        if self.checksum_range is not None:
+            return checksum(msg, *self.checksum_range, changes=changes)
+
+    def checksum_ok(self, msg):
+        """Return whether message has no checksum or the checksum is correct."""
+        return self.checksum_range is None or msg[-2] == self.checksum(msg)
+
+    def edit_buffer_changes(self, msg, checksum=None):
+        """Return changes to make message address the edit buffer.
+
+        Includes the updated checksum, which is calculated unless given as
+        `checksum`. Returns None if the message has no program slot.
+
+        """
+        if not self.edit_buffer:
+            return None
+
+        changes = dict(self.edit_buffer)
+
+        if self.checksum_range is not None:
+            if checksum is None:
+                checksum = self.checksum(msg, changes)
+
+            changes[-2] = bytearray([checksum])
+
+        return changes
+
+    def digest(self, msg):
+        """Return SHA-256 hex digest of the normalized message.
+
+        The program slot is masked by applying the edit buffer changes and the
+        checksum byte is set to zero, so dumps of the same patch to different
+        slots have the same digest.
+
+        """
+        if self.edit_buffer:
+            changes = dict(self.edit_buffer)
+        elif self.slot_offset is not None:
+            changes = {self.slot_offset: b'\0'}
+        else:
+            changes = {}
+
+        if self.checksum_range is not None:
+            changes[-2] = b'\0'
+
+        digest = hashlib.sha256()
+
+        for piece in _pieces(msg, changes):
+            digest.update(piece)
+
+        return digest.hexdigest()
+
+
+def register(recognizer):
+    """Add recognizer to the registry.
+
+    All recognizers for the same manufacturer must use the same model ID and
+    message type offsets.
+
+    """
+    layout = (recognizer.model_offset, len(recognizer.model),
+              recognizer.type_offset)
+
+    if _LAYOUTS.setdefault(recognizer.manufacturer, layout) != layout:
+        raise ValueError("Message layout of %r conflicts with registered "
+                         "recognizers." % recognizer)
+
+    for msg_type in recognizer.types:
+        RECOGNIZERS[(recognizer.manufacturer, recognizer.model, msg_type)] = recognizer
+
+    return recognizer
+
+
+def recognize(msg):
+    """Return Recognizer for SysEx message or None if it is not known."""
+    if len(msg) < 3:
+        return None
+
+    manufacturer = bytes(msg[1:4]) if msg[1] == 0 else bytes(msg[1:2])
+    layout = _LAYOUTS.get(manufacturer)
+
+    if layout is None:
+        return None
+
+    model_offset, model_len, type_offset = layout
+
+    if len(msg) <= max(model_offset + model_len, type_offset + 1):
+        return None
+
+    recognizer = RECOGNIZERS.get(
+        (manufacturer, bytes(msg[model_offset:model_offset + model_len]),
+         msg[type_offset]))
+
+    if recognizer and (recognizer.accept is None or recognizer.accept(msg)):
+        return recognizer
+
+
+register(Recognizer(
+    'an1x', "Yamaha AN1x voice",
+    manufacturer=b'\x43',
+    model=b'\x5C',
+    model_offset=3,
+    types=(0x11,),
+    type_offset=6,
+    name_offset=9,
+    name_len=10,
+    slot_offset=7,
+    checksum_range=(4, -2),
+    edit_buffer={6: b'\x10\0\0'},
+    # device number byte of bulk dumps is 0n
+    accept=lambda msg: msg[2] >> 4 == 0,
+))
+
+register(Recognizer(
+    'circuit', "Novation Circuit patch",
+    manufacturer=b'\x00\x20\x29',
+    model=b'\x01\x60',
+    model_offset=4,
+    # replace current patch of synth n / replace patch in flash location n
+    types=(0x00, 0x01),
+    type_offset=6,
+    name_offset=9,
+    name_len=16,
+    slot_offset=7,
+    edit_buffer={6: b'\x00\x00'},
+))